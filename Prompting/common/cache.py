@@ -0,0 +1,145 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        """
+        크기 제한(LRU 방식 축출)과 선택적 만료 시간(TTL)을 갖는 인메모리 캐시
+
+        Note:
+            - 단일 이벤트 루프 내에서 사용하는 것을 전제로 하므로 별도의 lock을 두지 않음
+            - 조회 적중/실패 횟수를 집계해 stats()로 제공
+
+        Args:
+            maxsize: 최대 저장 항목 수 (초과 시 가장 오래 사용되지 않은 항목부터 제거)
+            ttl: 항목 만료 시간(초). None이면 만료 없음
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()  # key -> (저장 시각, 값)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+
+        """key에 해당하는 값을 조회 (없거나 만료되었으면 default 반환)"""
+
+        item = self._data.get(key)
+        if item is None or self._is_expired(item[0]):
+            if item is not None:
+                del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)  # 최근 사용 항목으로 갱신
+        self.hits += 1
+        return item[1]
+
+    def set(self, key: Hashable, value: Any):
+
+        """key-value 저장. 크기 제한을 넘으면 가장 오래 사용되지 않은 항목 제거"""
+
+        self._data[key] = (time.monotonic(), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def items(self) -> list[tuple[Hashable, Any]]:
+
+        """만료되지 않은 (key, 값) 목록 (적중 통계와 사용 순서는 변경하지 않음)"""
+
+        return [(key, value) for key, (stored_at, value) in self._data.items() if not self._is_expired(stored_at)]
+
+    def invalidate(self, key: Hashable):
+
+        """key에 해당하는 항목 제거"""
+
+        self._data.pop(key, None)
+
+    def clear(self):
+
+        """전체 항목 제거"""
+
+        self._data.clear()
+
+    def stats(self) -> dict[str, Any]:
+
+        """캐시 크기 및 적중률 통계"""
+
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def _is_expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and time.monotonic() - stored_at > self.ttl
+
+
+class VersionedLRUCache(LRUCache):
+    def __init__(self, maxsize: int, ttl: Optional[float] = None):
+        """
+        key별 쓰기 일련번호(generation)로 쓰기 이전에 시작한 조회 결과의 저장을 막는 LRUCache (read-through 캐시용)
+
+        Note:
+            - 조회 시작 전 generation()을 받아두고 조회 후 set_if_unchanged()로 저장하면,
+              조회 중에 같은 key의 쓰기(write/invalidate)가 있었던 경우 저장하지 않음 (쓰기 이전 값이 TTL 동안 남는 것을 방지)
+            - key별 마지막 쓰기 번호는 maxsize개까지만 기록하고, 기록에서 밀려난 key는 밀려난 번호 중 가장 큰 값으로 쓰였다고 간주
+
+        Args:
+            maxsize: 최대 저장 항목 수 (key별 쓰기 기록 수 상한도 동일)
+            ttl: 항목 만료 시간(초). None이면 만료 없음
+        """
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._generation = 0  # 마지막 쓰기 일련번호
+        self._last_writes: OrderedDict[Hashable, int] = OrderedDict()  # key -> 마지막 쓰기 일련번호
+        self._evicted_generation = 0  # 기록에서 밀려난 쓰기 일련번호 중 최댓값
+
+    def generation(self) -> int:
+
+        """현재 쓰기 일련번호 (조회/쓰기 시작 전에 받아 set_if_unchanged/write에 전달)"""
+
+        return self._generation
+
+    def set_if_unchanged(self, key: Hashable, value: Any, generation: int) -> bool:
+
+        """generation 이후 key에 쓰기가 없었을 때만 저장하고 저장 여부를 반환"""
+
+        if self._last_write(key) > generation:
+            return False
+        self.set(key, value)
+        return True
+
+    def write(self, key: Hashable, value: Any, generation: int):
+
+        """쓰기 결과로 key의 값을 갱신 (generation 이후 같은 key의 다른 쓰기가 있었으면 순서를 알 수 없으므로 제거)"""
+
+        overlapped = self._last_write(key) > generation
+        self._record_write(key)
+        if overlapped:
+            super().invalidate(key)
+        else:
+            self.set(key, value)
+
+    def invalidate(self, key: Hashable):
+
+        """key에 해당하는 항목 제거 (쓰기로 기록해 진행 중인 조회 결과가 저장되지 않도록 함)"""
+
+        self._record_write(key)
+        super().invalidate(key)
+
+    def _last_write(self, key: Hashable) -> int:
+        return self._last_writes.get(key, self._evicted_generation)
+
+    def _record_write(self, key: Hashable):
+        self._generation += 1
+        self._last_writes[key] = self._generation
+        self._last_writes.move_to_end(key)
+        while len(self._last_writes) > self.maxsize:
+            _, evicted = self._last_writes.popitem(last=False)
+            self._evicted_generation = max(self._evicted_generation, evicted)
@@ -0,0 +1,84 @@
+# 환경 변수(.env) 기반 서버 설정값 모음
+import os
+from dotenv import load_dotenv
+
+load_dotenv()  # .env 파일 로드
+
+
+def _get_int(name: str, default: int) -> int:
+
+    """정수형 환경 변수를 읽고, 미설정 시 기본값을 반환"""
+
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def _get_bool(name: str, default: bool) -> bool:
+
+    """불리언 환경 변수("true"/"1"/"yes")를 읽고, 미설정 시 기본값을 반환"""
+
+    value = os.getenv(name)
+    return value.strip().lower() in ("true", "1", "yes") if value else default
+
+
+def _get_float(name: str, default: float) -> float:
+
+    """실수형 환경 변수를 읽고, 미설정 시 기본값을 반환"""
+
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+# Gemini API 설정
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")  # Gemini API 키
+GEMINI_MAX_WORKERS = _get_int("GEMINI_MAX_WORKERS", 16)  # Gemini 호출용 공유 스레드 풀 크기 (동시 호출 수 상한)
+GEMINI_POOL_SIZE = _get_int("GEMINI_POOL_SIZE", 16)  # Gemini API HTTP 연결 풀 크기 (재사용할 keep-alive 연결 수)
+GEMINI_RPM_LIMIT = _get_int("GEMINI_RPM_LIMIT", 2000)  # Gemini API 분당 요청 수 할당량 (0이면 rate limiter 미사용)
+GEMINI_TPM_LIMIT = _get_int("GEMINI_TPM_LIMIT", 4_000_000)  # Gemini API 분당 토큰 수 할당량 (입력 + 출력)
+GEMINI_MAX_RETRIES = _get_int("GEMINI_MAX_RETRIES", 4)  # 429/5xx 응답 시 최대 재시도 횟수
+GEMINI_BACKOFF_BASE_SECONDS = _get_float("GEMINI_BACKOFF_BASE_SECONDS", 1.0)  # 첫 재시도 대기 시간(초, 재시도마다 두 배)
+GEMINI_BACKOFF_MAX_SECONDS = _get_float("GEMINI_BACKOFF_MAX_SECONDS", 32.0)  # 재시도 대기 시간 상한(초)
+GEMINI_HEDGE_ENABLED = _get_bool("GEMINI_HEDGE_ENABLED", False)  # 대화형(MBTI 봇 채팅) 요청의 hedged request 사용 여부
+GEMINI_HEDGE_PERCENTILE = _get_float("GEMINI_HEDGE_PERCENTILE", 0.95)  # hedge 요청을 보낼 기준 지연 시간 percentile
+GEMINI_HEDGE_MAX_EXTRA_RATIO = _get_float("GEMINI_HEDGE_MAX_EXTRA_RATIO", 0.1)  # 전체 요청 대비 추가(hedge) 요청 수 상한 비율
+GEMINI_HEDGE_MIN_SAMPLES = _get_int("GEMINI_HEDGE_MIN_SAMPLES", 20)  # hedge 시작에 필요한 최소 지연 시간 표본 수
+GEMINI_CHAT_MODEL = os.getenv("GEMINI_CHAT_MODEL", "gemini-2.0-flash-lite")  # MBTI 봇 채팅 생성 모델
+GEMINI_AGENDA_MODEL = os.getenv("GEMINI_AGENDA_MODEL", "gemini-2.0-flash-lite")  # 회의 안건 생성 모델
+GEMINI_SUMMARY_MODEL = os.getenv("GEMINI_SUMMARY_MODEL", "gemini-2.0-flash")  # 회의록 요약 모델
+GEMINI_LONG_CONTEXT_MODEL = os.getenv("GEMINI_LONG_CONTEXT_MODEL", "")  # 입력 토큰 제한 초과 시 전환할 모델 (빈 값이면 분할 처리, 예: gemini-1.5-pro)
+GEMINI_CONTEXT_CACHE_ENABLED = _get_bool("GEMINI_CONTEXT_CACHE_ENABLED", False)  # 정적 프롬프트 prefix의 제공자 측 context cache 사용 여부
+GEMINI_CONTEXT_CACHE_TTL_SECONDS = _get_int("GEMINI_CONTEXT_CACHE_TTL_SECONDS", 3600)  # context cache 유지 시간(초)
+GEMINI_CONTEXT_CACHE_MIN_TOKENS = _get_int("GEMINI_CONTEXT_CACHE_MIN_TOKENS", 4096)  # context cache를 만들 최소 prefix 토큰 수 (gemini-2.0-flash 계열 최소 캐시 크기, 현재 prefix는 모두 미달)
+GEMINI_CONTEXT_CACHE_REFRESH_MARGIN_SECONDS = _get_int("GEMINI_CONTEXT_CACHE_REFRESH_MARGIN_SECONDS", 60)  # 만료 몇 초 전부터 TTL을 연장할지
+
+# 토큰 수 계산 설정
+TOKEN_ESTIMATE_SAFETY_MARGIN = _get_float("TOKEN_ESTIMATE_SAFETY_MARGIN", 0.1)  # 로컬 토큰 추정 오차 허용 비율
+TOKEN_COUNT_CACHE_SIZE = _get_int("TOKEN_COUNT_CACHE_SIZE", 10000)  # 토큰 수 계산 결과 인메모리 캐시 최대 항목 수
+TOKEN_COUNT_CACHE_PERSIST = _get_bool("TOKEN_COUNT_CACHE_PERSIST", False)  # 토큰 수 계산 결과의 MongoDB 영구 저장 여부
+TOKEN_COUNT_CACHE_TTL_SECONDS = _get_int("TOKEN_COUNT_CACHE_TTL_SECONDS", 7 * 24 * 3600)  # MongoDB 저장 결과 만료 시간(초)
+
+
+# 회의 요약 설정
+SUMMARY_PARALLEL_MODE = _get_bool("SUMMARY_PARALLEL_MODE", False)  # 안건(묶음)별 병렬 요약 모드 사용 여부
+SUMMARY_PARALLEL_FAN_OUT = _get_int("SUMMARY_PARALLEL_FAN_OUT", 4)  # 병렬 요약 모드에서 요약 1건당 동시 Gemini 요청 수 상한
+SUMMARY_AGENDAS_PER_REQUEST = _get_int("SUMMARY_AGENDAS_PER_REQUEST", 1)  # 병렬 요약 모드에서 요청 1회에 묶을 안건 수
+
+# 안건 생성 설정
+AGENDA_BATCH_SIZE = _get_int("AGENDA_BATCH_SIZE", 8)  # 배치 안건 생성에서 Gemini 요청 1회에 묶을 회의 설명 수
+AGENDA_BATCH_FAN_OUT = _get_int("AGENDA_BATCH_FAN_OUT", 4)  # 배치 안건 생성 1건당 동시 Gemini 요청 수 상한
+AGENDA_CACHE_SIZE = _get_int("AGENDA_CACHE_SIZE", 1000)  # 안건 생성 응답 캐시 최대 항목 수 (0이면 캐시 미사용)
+AGENDA_CACHE_TTL_SECONDS = _get_int("AGENDA_CACHE_TTL_SECONDS", 7 * 24 * 3600)  # 캐시된 안건 응답 만료 시간(초)
+AGENDA_CACHE_SIMILARITY_THRESHOLD = _get_float("AGENDA_CACHE_SIMILARITY_THRESHOLD", 0.95)  # 유사 회의 설명으로 볼 n-gram 유사도 (1이면 정확히 일치할 때만 재사용)
+
+# MongoDB 설정
+MONGO_ENSURE_INDEXES = _get_bool("MONGO_ENSURE_INDEXES", True)  # 서버 시작 시 repository 조회에 필요한 인덱스 생성 여부
+MONGO_MAX_POOL_SIZE = _get_int("MONGO_MAX_POOL_SIZE", 100)  # MongoDB 연결 풀 최대 연결 수
+MONGO_MIN_POOL_SIZE = _get_int("MONGO_MIN_POOL_SIZE", 0)  # 유휴 상태에서도 유지할 최소 연결 수 (서버 시작 시 미리 연결)
+MONGO_WAIT_QUEUE_TIMEOUT_MS = _get_int("MONGO_WAIT_QUEUE_TIMEOUT_MS", 0)  # 빈 연결을 기다리는 최대 시간(ms, 0이면 제한 없음)
+MONGO_SERVER_SELECTION_TIMEOUT_MS = _get_int("MONGO_SERVER_SELECTION_TIMEOUT_MS", 30000)  # 요청을 보낼 서버를 찾는 최대 시간(ms)
+MONGO_COMPRESSORS = os.getenv("MONGO_COMPRESSORS", "zlib")  # 전송 압축 방식 (우선순위 순, 빈 값이면 압축 안 함, zstd/snappy는 이미지에 없는 추가 패키지 필요)
+MONGO_ZLIB_COMPRESSION_LEVEL = _get_int("MONGO_ZLIB_COMPRESSION_LEVEL", -1)  # zlib 압축 수준 (-1: 기본값, 0~9)
+REPOSITORY_CACHE_SIZE = _get_int("REPOSITORY_CACHE_SIZE", 1000)  # 채팅방/사용자/안건 조회 결과 캐시의 엔티티별 최대 항목 수 (0이면 캐시 미사용)
+REPOSITORY_CACHE_ROOM_TTL_SECONDS = _get_float("REPOSITORY_CACHE_ROOM_TTL_SECONDS", 30)  # 채팅방 정보 캐시 만료 시간(초, 참여자 변경 반영 지연 상한)
+REPOSITORY_CACHE_USER_TTL_SECONDS = _get_float("REPOSITORY_CACHE_USER_TTL_SECONDS", 300)  # 사용자 정보 캐시 만료 시간(초)
+REPOSITORY_CACHE_AGENDA_TTL_SECONDS = _get_float("REPOSITORY_CACHE_AGENDA_TTL_SECONDS", 30)  # 안건 캐시 만료 시간(초)
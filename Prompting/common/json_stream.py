@@ -0,0 +1,59 @@
+import json
+from typing import Any
+
+
+class JsonArrayStreamParser:
+    def __init__(self):
+        """
+        조각으로 나뉘어 도착하는 JSON 배열 텍스트에서, 닫힌 원소(object / array)를 도착하는 대로 파싱하는 증분 파서
+
+        Note:
+            - 최상위 배열의 원소 중 object / array만 반환 (Gemini 응답 schema의 원소는 항상 object)
+            - 문자열 내부의 괄호와 escape 문자를 구분하므로, 텍스트를 어느 위치에서 잘라 전달해도 결과가 같음
+            - 원소가 닫힐 때 해당 원소 텍스트만 json.loads로 파싱하므로 전체 응답을 다시 파싱하지 않음
+        """
+        self._depth = 0  # 현재 괄호 깊이 (최상위 배열 내부 = 1)
+        self._in_string = False
+        self._escaped = False
+        self._element: list[str] = []  # 파싱 중인 원소의 텍스트 조각
+
+    def feed(self, text: str) -> list[Any]:
+        """
+        새로 도착한 텍스트 조각을 읽고, 이번 조각에서 닫힌 원소들을 파싱해 반환
+
+        Args:
+            text: JSON 배열 응답의 다음 텍스트 조각
+
+        Returns:
+            이번 조각에서 완성된 원소 리스트 (없으면 빈 리스트)
+
+        Raises:
+            json.JSONDecodeError: 완성된 원소가 올바른 JSON이 아닌 경우
+        """
+        completed = []
+        start = 0 if self._depth >= 2 else None  # 이번 조각에서 원소 텍스트가 시작된 위치
+
+        for i, ch in enumerate(text):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == '\\':
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in '{[':
+                self._depth += 1
+                if self._depth == 2:  # 최상위 배열의 새 원소 시작
+                    start = i
+            elif ch in '}]':
+                self._depth -= 1
+                if self._depth == 1:  # 최상위 배열의 원소 종료
+                    self._element.append(text[start:i + 1])
+                    completed.append(json.loads(''.join(self._element)))
+                    self._element, start = [], None
+
+        if start is not None:  # 아직 닫히지 않은 원소의 텍스트 보관
+            self._element.append(text[start:])
+        return completed
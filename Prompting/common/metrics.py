@@ -0,0 +1,27 @@
+from typing import Any, Callable
+
+
+class MetricsRegistry:
+    def __init__(self):
+        """
+        서버 내부 구성 요소(캐시, 클라이언트 등)의 통계 지표를 모아 제공하는 레지스트리
+
+        - 각 구성 요소는 통계 dict를 반환하는 함수를 이름과 함께 등록
+        - /metrics/ API에서 snapshot()으로 전체 지표를 조회
+        """
+        self._providers: dict[str, Callable[[], dict[str, Any]]] = {}
+
+    def register(self, name: str, provider: Callable[[], dict[str, Any]]):
+
+        """지표 이름과 통계 dict 제공 함수를 등록 (같은 이름은 덮어씀)"""
+
+        self._providers[name] = provider
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+
+        """등록된 모든 지표의 현재 값을 조회"""
+
+        return {name: provider() for name, provider in self._providers.items()}
+
+
+metrics_registry = MetricsRegistry()  # 프로세스 전역 지표 레지스트리
@@ -1,14 +1,25 @@
+import json
 from fastapi.responses import JSONResponse
 from fastapi.encoders import jsonable_encoder
 from typing import Optional, Any
 
 
-def success_response(data: Optional[Any] = None, message: str = "요청이 성공했습니다."):
+def success_response(data: Optional[Any] = None, message: str = "요청이 성공했습니다.",
+                     headers: Optional[dict[str, str]] = None):
     return JSONResponse(
         status_code=200,
+        headers=headers,
         content=jsonable_encoder({
             "status": "SUCCESS",
             "message": message,
             "data": data
         })
     )
+
+
+def sse_event(event: str, data: Any) -> str:
+
+    """Server-Sent Events 형식의 이벤트 문자열 생성 (data는 JSON 직렬화)"""
+
+    payload = json.dumps(jsonable_encoder(data), ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
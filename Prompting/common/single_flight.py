@@ -0,0 +1,49 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    def __init__(self):
+        """
+        같은 key의 요청이 동시에 여러 번 들어오면 작업을 한 번만 실행하고 결과를 공유하는 in-process single-flight 레이어
+
+        Note:
+            - 먼저 들어온 요청(leader)만 작업을 실행하고, 실행 중에 들어온 같은 key의 요청은 그 결과(또는 예외)를 함께 받음
+            - 작업은 별도 Task로 실행하고 각 요청은 shield로 기다리므로, 요청 하나가 취소되어도 다른 요청의 작업은 계속 진행
+            - 작업이 끝나면 key를 바로 제거하므로 결과를 캐싱하지는 않음 (완료 후 들어온 요청은 새로 실행)
+            - key의 첫 번째 요소를 엔드포인트 이름으로 보고 엔드포인트별 실행/병합 횟수를 집계
+        """
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self._counts: dict[str, dict[str, int]] = {}  # 엔드포인트 -> {"executed": 실행 수, "coalesced": 병합된 요청 수}
+
+    async def do(self, key: tuple, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        key에 해당하는 작업이 실행 중이면 그 결과를 기다리고, 아니면 func를 실행해 결과를 반환
+
+        Args:
+            key: 작업 식별 key (엔드포인트, 채팅방 ID, 안건 ID, 요청 옵션 등)
+            func: 작업을 실행하는 비동기 함수 (인자 없이 호출)
+
+        Returns:
+            작업 결과 (같은 key의 동시 요청은 같은 결과 객체를 공유)
+        """
+        counts = self._counts.setdefault(str(key[0]), {"executed": 0, "coalesced": 0})
+        task = self._in_flight.get(key)
+        if task is None:
+            counts["executed"] += 1
+            task = asyncio.ensure_future(func())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            counts["coalesced"] += 1
+
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict[str, Any]:
+
+        """엔드포인트별 실행/병합 요청 수 및 현재 실행 중인 작업 수"""
+
+        return {
+            "in_flight": len(self._in_flight),
+            **{endpoint: dict(counts) for endpoint, counts in self._counts.items()},
+        }
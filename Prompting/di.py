@@ -1,18 +1,151 @@
 # DI 함수 정의
-from Prompting.repository import AgendaRepository, ChatRepository, RoomRepository, UserRepository
-from Prompting.services import AgendaGenerator, MeetingSummarizer, MbtiChatGenerator
-
-def get_agenda_service():
-    return AgendaGenerator()
-def get_summarizer_service():
-    return MeetingSummarizer()
-def get_bot_service():
-    return MbtiChatGenerator()
-def get_agenda_repo():
-    return AgendaRepository()
+import asyncio
+import logging
+
+from fastapi import FastAPI, Request
+from concurrent.futures import ThreadPoolExecutor
+from Prompting.common.config import (
+    GEMINI_MAX_WORKERS, GEMINI_POOL_SIZE, GEMINI_RPM_LIMIT, GEMINI_HEDGE_ENABLED, GEMINI_CONTEXT_CACHE_ENABLED,
+    AGENDA_CACHE_SIZE, TOKEN_COUNT_CACHE_SIZE, TOKEN_COUNT_CACHE_PERSIST, TOKEN_COUNT_CACHE_TTL_SECONDS,
+    MONGO_ENSURE_INDEXES, REPOSITORY_CACHE_SIZE
+)
+from Prompting.common.metrics import metrics_registry
+from Prompting.common.single_flight import SingleFlight
+from Prompting.repository import (
+    AgendaRepository, ChatRepository, RoomRepository, UserRepository, AgendaSummaryRepository, TokenCountRepository,
+    RepositoryCache
+)
+from Prompting.repository import mongo_client
+from Prompting.repository.indexes import ensure_indexes
+from Prompting.services import GeminiClient, AgendaGenerator, MeetingSummarizer, MbtiChatGenerator
+from Prompting.services.token_count_cache import TokenCountCache
+from Prompting.services.rate_limiter import GeminiRateLimiter
+from Prompting.services.hedging import HedgingPolicy
+from Prompting.services.model_router import ModelRouter
+from Prompting.services.context_cache import ContextCacheManager
+from Prompting.services.token_estimator import TokenEstimator
+from Prompting.services.agenda_cache import AgendaResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+async def init_services(app: FastAPI):
+    """
+    프로세스 전체에서 공유할 MongoDB/Gemini 클라이언트, 스레드 풀, 서비스 객체를 생성해 app.state에 등록 (lifespan 시작 시 호출)
+
+    Args:
+        app: FastAPI 애플리케이션
+    """
+    await mongo_client.connect()  # 공유 MongoDB 클라이언트(연결 풀) 생성 및 연결 warm-up
+    mongo_setup_tasks: list[asyncio.Task] = []  # 서버 기동을 막지 않도록 백그라운드에서 실행하는 MongoDB 초기 설정
+    if MONGO_ENSURE_INDEXES:  # repository 조회에 필요한 MongoDB 인덱스 생성
+        mongo_setup_tasks.append(asyncio.create_task(_ensure_indexes()))
+    app.state.mongo_setup_tasks = mongo_setup_tasks
+
+    repository_cache = None
+    if REPOSITORY_CACHE_SIZE > 0:  # 채팅방/참여자/안건 조회 결과 재사용 (요청마다 생성되는 repository가 공유)
+        repository_cache = RepositoryCache()
+        metrics_registry.register("repository_cache", repository_cache.stats)
+    app.state.repository_cache = repository_cache
+
+    token_count_repo = None
+    if TOKEN_COUNT_CACHE_PERSIST:  # 토큰 수 계산 결과를 MongoDB TTL 콜렉션에도 저장
+        token_count_repo = TokenCountRepository()
+        mongo_setup_tasks.append(asyncio.create_task(_ensure_token_count_ttl_index(token_count_repo)))
+    token_count_cache = TokenCountCache(maxsize=TOKEN_COUNT_CACHE_SIZE, repository=token_count_repo)
+    metrics_registry.register("token_count_cache", token_count_cache.stats)
+
+    rate_limiter = None
+    if GEMINI_RPM_LIMIT > 0:  # 프로세스 전체 Gemini 요청이 공유하는 RPM/TPM 할당량 limiter
+        rate_limiter = GeminiRateLimiter()
+        metrics_registry.register("gemini_rate_limiter", rate_limiter.stats)
+
+    hedging_policy = None
+    if GEMINI_HEDGE_ENABLED:  # 대화형 요청의 tail latency 단축용 hedged request
+        hedging_policy = HedgingPolicy()
+        metrics_registry.register("gemini_hedging", hedging_policy.stats)
+
+    model_router = ModelRouter()  # 서비스/입력 토큰 수별 Gemini 모델 선택
+    metrics_registry.register("model_router", model_router.stats)
+
+    context_cache = None
+    if GEMINI_CONTEXT_CACHE_ENABLED:  # MBTI 성향 자료, 요약 지시문 등 정적 prefix의 제공자 측 context cache
+        context_cache = ContextCacheManager(token_counter=TokenEstimator().estimate)
+        metrics_registry.register("gemini_context_cache", context_cache.stats)
+
+    executor = ThreadPoolExecutor(max_workers=GEMINI_MAX_WORKERS, thread_name_prefix="gemini")
+    gemini_client = GeminiClient(executor=executor, pool_size=GEMINI_POOL_SIZE, token_count_cache=token_count_cache,
+                                 rate_limiter=rate_limiter, hedging_policy=hedging_policy, model_router=model_router,
+                                 context_cache=context_cache)
+    await gemini_client.warm_up()
+
+    agenda_cache = None
+    if AGENDA_CACHE_SIZE > 0:  # 반복되는 회의 설명의 안건 응답 재사용
+        agenda_cache = AgendaResponseCache()
+        metrics_registry.register("agenda_cache", agenda_cache.stats)
+
+    app.state.gemini_executor = executor
+    app.state.gemini_client = gemini_client
+    app.state.agenda_service = AgendaGenerator(client=gemini_client, cache=agenda_cache)
+    app.state.summarizer_service = MeetingSummarizer(client=gemini_client)
+    app.state.bot_service = MbtiChatGenerator(client=gemini_client)
+
+    single_flight = SingleFlight()  # 같은 채팅방의 동시 중복 요청 병합
+    metrics_registry.register("single_flight", single_flight.stats)
+    app.state.single_flight = single_flight
+
+
+async def close_services(app: FastAPI):
+    """
+    init_services()에서 생성한 공유 자원을 정리 (lifespan 종료 시 호출)
+
+    Args:
+        app: FastAPI 애플리케이션
+    """
+    app.state.gemini_executor.shutdown(wait=True)  # 진행 중인 Gemini 호출이 끝날 때까지 대기
+    app.state.gemini_client.close()  # 진행 중인 호출이 모두 끝난 뒤 공유 HTTP 세션 정리
+    for task in app.state.mongo_setup_tasks:
+        if not task.done():
+            task.cancel()
+    mongo_client.close()
+
+
+async def _ensure_indexes():
+
+    """필수 MongoDB 인덱스 생성 (실패해도 서버는 계속 동작하며, 인덱스가 없으면 조회만 느려짐)"""
+
+    try:
+        created = await ensure_indexes()
+        logger.info("MongoDB 인덱스 확인 완료 (새로 생성: %s)", {c: names for c, names in created.items() if names})
+    except Exception as e:
+        logger.warning("MongoDB 인덱스 생성 실패: %s", e)
+
+
+async def _ensure_token_count_ttl_index(token_count_repo: TokenCountRepository):
+
+    """토큰 수 캐시 콜렉션의 TTL 인덱스 생성 (실패해도 서버는 계속 동작하며, 만료되지 않은 캐시 문서만 남음)"""
+
+    try:
+        await token_count_repo.ensure_ttl_index(TOKEN_COUNT_CACHE_TTL_SECONDS)
+    except Exception as e:
+        logger.warning("MongoDB 토큰 수 캐시 TTL 인덱스 생성 실패: %s", e)
+
+
+def get_agenda_service(request: Request) -> AgendaGenerator:
+    return request.app.state.agenda_service
+def get_summarizer_service(request: Request) -> MeetingSummarizer:
+    return request.app.state.summarizer_service
+def get_bot_service(request: Request) -> MbtiChatGenerator:
+    return request.app.state.bot_service
+def get_single_flight(request: Request) -> SingleFlight:
+    return request.app.state.single_flight
+def get_agenda_repo(request: Request) -> AgendaRepository:
+    return AgendaRepository(cache=request.app.state.repository_cache)
 def get_chat_repo():
     return ChatRepository()
-def get_room_repo():
-    return RoomRepository()
-def get_user_repo():
-    return UserRepository()
\ No newline at end of file
+def get_room_repo(request: Request) -> RoomRepository:
+    return RoomRepository(cache=request.app.state.repository_cache)
+def get_user_repo(request: Request) -> UserRepository:
+    return UserRepository(cache=request.app.state.repository_cache)
+def get_agenda_summary_repo():
+    return AgendaSummaryRepository()
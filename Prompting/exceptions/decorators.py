@@ -12,7 +12,7 @@ def catch_and_raise(label: str, error_class: type, skip_types: tuple[type] = ())
     - 에러 메시지 앞에 설명 문자열(label)을 추가하여 traceback과 함께 상세 에러 로그를 출력
     - 기본적으로 프로젝트의 주요 커스텀 에러는 다시 감싸지 않고 그대로 전달 (skip)
     - 예상하지 못한 일반 Exception만 지정한 error_class로 감싸서 전달
-    - 동기/비동기 함수 모두 처리 가능
+    - 동기/비동기 함수 및 비동기 제너레이터(스트리밍 응답 생성) 모두 처리 가능
 
     Args:
         label: 주어진 함수 작업에 대한 설명 문자열
@@ -25,7 +25,21 @@ def catch_and_raise(label: str, error_class: type, skip_types: tuple[type] = ())
     skip = (BaseCustomError, RequestValidationError, ) + skip_types
 
     def decorator(func):
-        if inspect.iscoroutinefunction(func):
+        if inspect.isasyncgenfunction(func):
+            # 비동기 제너레이터 처리 wrapper (값을 생성하는 도중 발생한 예외도 변환)
+            @wraps(func)
+            async def async_gen_wrapper(*args, **kwargs):
+                try:
+                    async for item in func(*args, **kwargs):
+                        yield item
+                except skip:
+                    print(f"[{label} 에러]", traceback.format_exc())
+                    raise  # skip에 포함된 예외는 그대로 전파
+                except Exception as e:
+                    print(f"[{label} 에러]", traceback.format_exc())
+                    raise error_class()  # str(e)
+            return async_gen_wrapper
+        elif inspect.iscoroutinefunction(func):
             # 비동기 함수 처리 wrapper
             @wraps(func)
             async def async_wrapper(*args, **kwargs):
@@ -1,32 +1,52 @@
 # MindSync AI Server: FastAPI 기반 회의 지원 서비스
 
 import logging
-from typing import Any
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional, Union
 
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, BackgroundTasks
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 
-from Prompting.schemas import SummaryRequest, ChatRequest, AgendaRequest, Response
-from Prompting.repository import AgendaRepository, ChatRepository, RoomRepository, UserRepository
+from Prompting.schemas import SummaryRequest, ChatRequest, ChatResponse, AgendaRequest, AgendaBatchRequest, Response
+from Prompting.models import AgendaSummaryModel
+from Prompting.repository import AgendaRepository, ChatRepository, RoomRepository, UserRepository, AgendaSummaryRepository
 from Prompting.services import AgendaGenerator, MeetingSummarizer, MbtiChatGenerator
 from Prompting.usecases import load_summary_context_and_update_agenda_status, load_chat_context_and_update_agenda_status
+from Prompting.usecases import summarize_completed_agendas, load_reusable_agenda_summaries, save_agenda_summaries
+from Prompting.usecases.meeting_context import MeetingContext
 
+from Prompting.exceptions.base import BaseCustomError
 from Prompting.exceptions.errors import GeminiCallError, GeminiParseError, MongoAccessError, PromptBuildError
 from Prompting.exceptions.decorators import catch_and_raise
 from Prompting.exceptions.handlers import custom_exception_handler, request_validation_exception_handler, general_exception_handler
 
-from Prompting.common.resonse_util import success_response
+from Prompting.common.resonse_util import success_response, sse_event
+from Prompting.common.metrics import metrics_registry
+from Prompting.common.single_flight import SingleFlight
 
 from .di import (
-    get_agenda_repo, get_room_repo, get_chat_repo, get_user_repo,
-    get_agenda_service, get_bot_service, get_summarizer_service
+    init_services, close_services,
+    get_agenda_repo, get_room_repo, get_chat_repo, get_user_repo, get_agenda_summary_repo,
+    get_agenda_service, get_bot_service, get_summarizer_service, get_single_flight
 )
 
 
 # 기본 설정 및 예외 핸들러 등록 ------------------------------------------------------------------------
 logging.basicConfig(level=logging.INFO)  # 로깅 설정
-app = FastAPI(docs_url=None, redoc_url=None)  # FastAPI 애플리케이션 생성(Swagger UI 제거)
+SUMMARY_CACHE_HEADER = "X-Summary-Cache"  # 회의 요약 재사용 여부 표시 응답 헤더
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작 시 공유 자원(MongoDB/Gemini 클라이언트, 스레드 풀, 서비스 객체)을 생성하고 종료 시 정리"""
+    await init_services(app)
+    yield
+    await close_services(app)
+
+
+app = FastAPI(docs_url=None, redoc_url=None, lifespan=lifespan)  # FastAPI 애플리케이션 생성(Swagger UI 제거)
 
 # 허용할 origin 지정
 origins = [
@@ -40,6 +60,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],    # or ["POST", "GET"]
     allow_headers=["*"],
+    expose_headers=[SUMMARY_CACHE_HEADER],  # 프론트엔드에서 읽을 수 있도록 노출할 응답 헤더
 )
 
 for exc in [GeminiCallError, GeminiParseError, MongoAccessError, PromptBuildError]:
@@ -73,6 +94,39 @@ async def generate_and_save_agendas(
     return success_response(data=db_agendas, message="안건 생성을 완료했습니다.")
 
 
+@app.post("/agenda_generation/batch/", response_model=Response)
+async def generate_and_save_agendas_batch(
+        request: AgendaBatchRequest,
+        agenda_service: AgendaGenerator = Depends(get_agenda_service),
+        agenda_repo: AgendaRepository = Depends(get_agenda_repo)
+):
+    """
+    여러 채팅방의 회의 안건 일괄 생성 API
+
+    Note:
+        - 회의 설명을 여러 개씩 묶어 Gemini 요청 1회로 생성하고 (실패한 묶음은 채팅방별 요청으로 대체),
+          생성된 안건은 한 번의 bulk write로 저장
+
+    Args:
+        request: 채팅방별 회의 안건 생성 요청 목록 body
+        agenda_service: Gemini 기반 안건 생성 서비스 객체 (DI 자동 관리)
+        agenda_repo: 안건 데이터 관리 객체 (DI 자동 관리)
+
+    Returns:
+        Response 형식의 JSONResponse (상세는 API 명세서에서 확인)
+    """
+    descriptions = {r.roomId: r.description for r in request.requests}  # 같은 채팅방이 중복되면 마지막 요청 사용
+    agenda_lists = await agenda_service.generate_agendas_batch(topic_requests=list(descriptions.values()))
+    ai_agendas = {
+        room_id: agenda_service.parse_response_to_agenda_data(response=agenda_list)
+        for room_id, agenda_list in zip(descriptions, agenda_lists)
+    }
+    db_agendas = await agenda_repo.save_agendas(agenda_dicts=ai_agendas)
+
+    data = [{"roomId": room_id, "agendas": agendas} for room_id, agendas in db_agendas.items()]
+    return success_response(data=data, message="안건 일괄 생성을 완료했습니다.")
+
+
 @app.post("/summarize/", response_model=Response)
 async def summarize_meeting_chat(
         request: SummaryRequest,
@@ -80,11 +134,20 @@ async def summarize_meeting_chat(
         chat_repo: ChatRepository = Depends(get_chat_repo),
         room_repo: RoomRepository = Depends(get_room_repo),
         user_repo: UserRepository = Depends(get_user_repo),
-        agenda_repo: AgendaRepository = Depends(get_agenda_repo)
+        agenda_repo: AgendaRepository = Depends(get_agenda_repo),
+        summary_repo: AgendaSummaryRepository = Depends(get_agenda_summary_repo),
+        single_flight: SingleFlight = Depends(get_single_flight)
 ):
     """
     회의 요약 생성 API
 
+    Note:
+        - 안건별 논의 상태와 채팅 내역이 이전 요약 생성 시점과 같으면 저장된 요약을 그대로 반환 (Gemini 호출 및 저장 생략)
+        - 일부 안건만 바뀐 경우 채팅 내역이 같은 안건의 요약은 재사용하고 나머지만 새로 요약
+        - 요청 body의 use_cache=false로 재사용을 건너뛰고 전체 요약을 새로 생성
+        - 재사용 여부는 응답 헤더 X-Summary-Cache(HIT / PARTIAL / MISS / BYPASS)로 표시
+        - 같은 채팅방에 같은 옵션의 요청이 동시에 들어오면 한 번만 처리하고 결과를 공유
+
     Args:
         request: 회의 요약 생성 요청 body
         summarizer: Gemini 기반 요약 생성 서비스 객체 (DI 자동 관리)
@@ -92,45 +155,313 @@ async def summarize_meeting_chat(
         room_repo: 채팅방 데이터 관리 객체 (DI 자동 관리)
         user_repo: 사용자 데이터 관리 객체 (DI 자동 관리)
         agenda_repo: 안건 데이터 관리 객체 (DI 자동 관리)
+        summary_repo: 안건별 요약 데이터 관리 객체 (DI 자동 관리)
+        single_flight: 동시 중복 요청 병합 객체 (DI 자동 관리)
 
     Returns:
         Response 형식의 JSONResponse (상세는 API 명세서에서 확인)
     """
+    async def summarize() -> tuple[list[AgendaSummaryModel], str]:
+        return await _summarize_and_save(request, summarizer, chat_repo, room_repo, user_repo, agenda_repo, summary_repo)
+
+    key = ("summarize", request.roomId, request.is_last_agenda_skipped, request.use_cache)
+    summary_data, cache_status = await single_flight.do(key, summarize)
+    return success_response(data=summary_data, message="요약 생성을 완료했습니다.",
+                            headers={SUMMARY_CACHE_HEADER: cache_status})
+
+
+async def _summarize_and_save(
+        request: SummaryRequest,
+        summarizer: MeetingSummarizer,
+        chat_repo: ChatRepository,
+        room_repo: RoomRepository,
+        user_repo: UserRepository,
+        agenda_repo: AgendaRepository,
+        summary_repo: AgendaSummaryRepository
+) -> tuple[list[AgendaSummaryModel], str]:
+    """
+    회의 요약을 생성(또는 재사용)하고 저장
+
+    Returns:
+        (안건별 요약 리스트, 요약 재사용 여부 - HIT / PARTIAL / MISS / BYPASS)
+    """
+    meeting_context, fingerprint, cached_summary, precomputed = await _load_summary_inputs(
+        request, chat_repo, room_repo, user_repo, agenda_repo, summary_repo
+    )
+    cache_status = _summary_cache_status(request, cached_summary, precomputed)
+    if cached_summary is not None:
+        return cached_summary, cache_status
+
+    summary = await summarizer.generate_summary(meeting_context, precomputed=precomputed)
+    summary_data = await _save_summary(request, meeting_context, fingerprint, summary, precomputed,
+                                       summarizer, room_repo, summary_repo)
+    return summary_data, cache_status
+
+
+async def _load_summary_inputs(
+        request: SummaryRequest,
+        chat_repo: ChatRepository,
+        room_repo: RoomRepository,
+        user_repo: UserRepository,
+        agenda_repo: AgendaRepository,
+        summary_repo: AgendaSummaryRepository
+) -> tuple[MeetingContext, str, Optional[list[AgendaSummaryModel]], dict[str, dict]]:
+    """
+    회의 맥락을 불러오고, 재사용할 수 있는 요약을 조회
+
+    Returns:
+        (회의 맥락, 회의 fingerprint, 그대로 반환할 저장된 회의 요약(없으면 None), 재사용할 안건별 요약)
+    """
     meeting_context = await load_summary_context_and_update_agenda_status(request, chat_repo, agenda_repo, room_repo, user_repo)
-    summary = await summarizer.generate_summary(meeting_context)
+    fingerprint = meeting_context.meeting_fingerprint()
+    if not request.use_cache:
+        return meeting_context, fingerprint, None, {}
+
+    # 회의 전체가 이전 요약 생성 시점과 같으면 저장된 요약 반환
+    cached_summary = await room_repo.get_summary_by_fingerprint(request.roomId, fingerprint)
+    if cached_summary is not None:
+        return meeting_context, fingerprint, cached_summary, {}
+    # 채팅 내역이 바뀌지 않은 안건의 요약 (논의 완료 시 미리 생성되었거나 이전 요약 생성 시 저장된 요약)
+    precomputed = await load_reusable_agenda_summaries(meeting_context, request.roomId, summary_repo)
+    return meeting_context, fingerprint, None, precomputed
+
+
+def _summary_cache_status(request: SummaryRequest, cached_summary: Optional[list[AgendaSummaryModel]],
+                          precomputed: dict[str, dict]) -> str:
+
+    """요약 재사용 여부 (HIT / PARTIAL / MISS / BYPASS)"""
+
+    if not request.use_cache:
+        return "BYPASS"
+    if cached_summary is not None:
+        return "HIT"
+    return "PARTIAL" if precomputed else "MISS"
+
+
+async def _save_summary(
+        request: SummaryRequest,
+        meeting_context: MeetingContext,
+        fingerprint: str,
+        summary: list[dict],
+        precomputed: dict[str, dict],
+        summarizer: MeetingSummarizer,
+        room_repo: RoomRepository,
+        summary_repo: AgendaSummaryRepository
+) -> list[AgendaSummaryModel]:
+    """
+    새로 생성한 안건별 요약과 회의 요약을 저장
+
+    Returns:
+        MongoDB 저장 형식으로 변환한 안건별 요약 리스트
+    """
+    generated = [s for s in summary if str(s["step"]) not in precomputed]
+    await save_agenda_summaries(meeting_context, request.roomId, generated, summary_repo)
+
     summary_data = summarizer.parse_response_to_summary_data(summary)
-    await room_repo.save_summary(room_id=request.roomId, summary=summary_data)
+    await room_repo.save_summary(room_id=request.roomId, summary=summary_data, fingerprint=fingerprint)
+    return summary_data
+
+
+async def _next_or_none(stream: AsyncIterator[Any]) -> Optional[Any]:
+
+    """비동기 iterator의 다음 값 (끝났으면 None)"""
+
+    try:
+        return await stream.__anext__()
+    except StopAsyncIteration:
+        return None
+
+
+@app.post("/summarize/stream/")
+async def stream_meeting_summary(
+        request: SummaryRequest,
+        summarizer: MeetingSummarizer = Depends(get_summarizer_service),
+        chat_repo: ChatRepository = Depends(get_chat_repo),
+        room_repo: RoomRepository = Depends(get_room_repo),
+        user_repo: UserRepository = Depends(get_user_repo),
+        agenda_repo: AgendaRepository = Depends(get_agenda_repo),
+        summary_repo: AgendaSummaryRepository = Depends(get_agenda_summary_repo)
+):
+    """
+    회의 요약 스트리밍 생성 API (Server-Sent Events)
+
+    Note:
+        - 안건별 요약이 완성되는 대로 /summarize/ 응답의 안건 요약과 같은 형식으로 summary 이벤트 전송 (안건 순서와 다를 수 있음)
+        - 모든 안건의 요약이 끝나면 요약을 저장하고, /summarize/와 같은 응답을 done 이벤트로 전송
+        - 요약 재사용 규칙과 X-Summary-Cache 응답 헤더는 /summarize/와 동일
+        - 첫 안건 요약 전의 오류는 일반 에러 응답(JSON)으로, 이후의 오류는 error 이벤트로 전송 (요약은 저장하지 않음)
+
+    Args:
+        request: 회의 요약 생성 요청 body
+        summarizer: Gemini 기반 요약 생성 서비스 객체 (DI 자동 관리)
+        chat_repo: 채팅 데이터 관리 객체 (DI 자동 관리)
+        room_repo: 채팅방 데이터 관리 객체 (DI 자동 관리)
+        user_repo: 사용자 데이터 관리 객체 (DI 자동 관리)
+        agenda_repo: 안건 데이터 관리 객체 (DI 자동 관리)
+        summary_repo: 안건별 요약 데이터 관리 객체 (DI 자동 관리)
+
+    Returns:
+        text/event-stream 형식의 StreamingResponse (상세는 API 명세서에서 확인)
+    """
+    meeting_context, fingerprint, cached_summary, precomputed = await _load_summary_inputs(
+        request, chat_repo, room_repo, user_repo, agenda_repo, summary_repo
+    )
+    headers = {"Cache-Control": "no-cache", SUMMARY_CACHE_HEADER: _summary_cache_status(request, cached_summary, precomputed)}
+
+    if cached_summary is not None:
+        async def cached_event_stream():
+            for agenda_summary in cached_summary:
+                yield sse_event("summary", agenda_summary)
+            yield sse_event("done", {"status": "SUCCESS", "message": "요약 생성을 완료했습니다.", "data": cached_summary})
+        return StreamingResponse(cached_event_stream(), media_type="text/event-stream", headers=headers)
+
+    stream = summarizer.generate_summary_stream(meeting_context, precomputed=precomputed)
+    first = await _next_or_none(stream)  # 첫 안건 요약까지는 예외를 일반 에러 응답으로 처리
 
-    return success_response(data=summary_data, message="요약 생성을 완료했습니다.")
+    async def event_stream():
+        summary, item = [], first
+        try:
+            while item is not None:
+                summary.append(item)
+                yield sse_event("summary", summarizer.parse_response_to_summary_data([item])[0])
+                item = await _next_or_none(stream)
+
+            summary.sort(key=lambda s: int(s["step"]))
+            summary_data = await _save_summary(request, meeting_context, fingerprint, summary, precomputed,
+                                               summarizer, room_repo, summary_repo)
+            yield sse_event("done", {"status": "SUCCESS", "message": "요약 생성을 완료했습니다.", "data": summary_data})
+        except BaseCustomError as e:
+            yield sse_event("error", {"status": "ERROR", "message": e.message, "data": None})
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=headers)
 
 
 @app.post("/mbti_chat/", response_model=Response)
 async def generate_mbti_chat(
         request: ChatRequest,
+        background_tasks: BackgroundTasks,
         bot: MbtiChatGenerator = Depends(get_bot_service),
+        summarizer: MeetingSummarizer = Depends(get_summarizer_service),
         chat_repo: ChatRepository = Depends(get_chat_repo),
         room_repo: RoomRepository = Depends(get_room_repo),
         user_repo: UserRepository = Depends(get_user_repo),
-        agenda_repo: AgendaRepository = Depends(get_agenda_repo)
+        agenda_repo: AgendaRepository = Depends(get_agenda_repo),
+        summary_repo: AgendaSummaryRepository = Depends(get_agenda_summary_repo),
+        single_flight: SingleFlight = Depends(get_single_flight)
 ):
     """
     MBTI 봇 채팅 생성 API
 
+    Note:
+        - all_bots 또는 bot_emails를 지정하면 여러 AI 참여자의 채팅을 동시에 생성해 리스트로 반환 (미지정 시 첫 번째 AI 참여자만)
+        - 직전 안건이 논의 완료 처리되면, 응답 후 백그라운드에서 해당 안건의 요약을 미리 생성해 저장
+        - 같은 채팅방, 안건에 같은 옵션의 요청이 동시에 들어오면 한 번만 처리하고 생성된 채팅을 공유
+
     Args:
         request: 채팅 생성 요청 body
+        background_tasks: 응답 후 실행할 백그라운드 작업 목록 (FastAPI 자동 관리)
         bot: Gemini 기반 MBTI 봇 채팅 생성 서비스 객체 (DI 자동 관리)
+        summarizer: Gemini 기반 요약 생성 서비스 객체 (DI 자동 관리)
         chat_repo: 채팅 데이터 관리 객체 (DI 자동 관리)
         room_repo: 채팅방 데이터 관리 객체 (DI 자동 관리)
         user_repo: 사용자 데이터 관리 객체 (DI 자동 관리)
         agenda_repo: 안건 데이터 관리 객체 (DI 자동 관리)
+        summary_repo: 안건별 요약 데이터 관리 객체 (DI 자동 관리)
+        single_flight: 동시 중복 요청 병합 객체 (DI 자동 관리)
 
     Returns:
         Response 형식의 JSONResponse (상세는 API 명세서에서 확인)
     """
+    multi_bot = request.all_bots or request.bot_emails is not None
+
+    async def generate_chat() -> Union[ChatResponse, list[ChatResponse]]:
+        meeting_context = await load_chat_context_and_update_agenda_status(request, chat_repo, agenda_repo, room_repo, user_repo)
+        if multi_bot:  # 회의 맥락은 한 번만 불러오고 봇별 채팅은 동시에 생성
+            chat_response = await bot.generate_chats(meeting_context=meeting_context, request=request,
+                                                     bot_emails=request.bot_emails)
+        else:
+            chat_response = await bot.generate_chat(meeting_context=meeting_context, request=request)
+
+        # 직전 안건이 논의 완료 처리된 경우에만 채팅 내역이 로드되므로, 이때 해당 안건 요약을 미리 생성
+        # (병합된 요청 중 실제로 실행한 요청의 응답 후에만 한 번 실행)
+        if meeting_context.chats:
+            background_tasks.add_task(summarize_completed_agendas, meeting_context, request.roomId, summarizer, summary_repo)
+        return chat_response
+
+    bot_emails = tuple(request.bot_emails) if request.bot_emails is not None else None
+    key = ("mbti_chat", request.roomId, request.agendaId, request.is_previous_skipped, multi_bot, bot_emails)
+    chat_response = await single_flight.do(key, generate_chat)
+    data = [r.model_dump() for r in chat_response] if multi_bot else chat_response.model_dump()
+    return success_response(data=data, message="MBTI 봇의 채팅 생성을 완료했습니다.")
+
+
+@app.post("/mbti_chat/stream/")
+async def stream_mbti_chat(
+        request: ChatRequest,
+        background_tasks: BackgroundTasks,
+        bot: MbtiChatGenerator = Depends(get_bot_service),
+        summarizer: MeetingSummarizer = Depends(get_summarizer_service),
+        chat_repo: ChatRepository = Depends(get_chat_repo),
+        room_repo: RoomRepository = Depends(get_room_repo),
+        user_repo: UserRepository = Depends(get_user_repo),
+        agenda_repo: AgendaRepository = Depends(get_agenda_repo),
+        summary_repo: AgendaSummaryRepository = Depends(get_agenda_summary_repo)
+):
+    """
+    MBTI 봇 채팅 스트리밍 생성 API (Server-Sent Events)
+
+    Note:
+        - 생성되는 채팅 텍스트 조각을 delta 이벤트로 보내고, 마지막에 /mbti_chat/과 같은 응답을 done 이벤트로 전송
+        - 첫 조각이 생성되기 전의 오류는 일반 에러 응답(JSON)으로, 이후의 오류는 error 이벤트로 전송
+        - 직전 안건이 논의 완료 처리되면, 스트림 종료 후 백그라운드에서 해당 안건의 요약을 미리 생성해 저장
+
+    Args:
+        request: 채팅 생성 요청 body
+        background_tasks: 응답 후 실행할 백그라운드 작업 목록 (FastAPI 자동 관리)
+        bot: Gemini 기반 MBTI 봇 채팅 생성 서비스 객체 (DI 자동 관리)
+        summarizer: Gemini 기반 요약 생성 서비스 객체 (DI 자동 관리)
+        chat_repo: 채팅 데이터 관리 객체 (DI 자동 관리)
+        room_repo: 채팅방 데이터 관리 객체 (DI 자동 관리)
+        user_repo: 사용자 데이터 관리 객체 (DI 자동 관리)
+        agenda_repo: 안건 데이터 관리 객체 (DI 자동 관리)
+        summary_repo: 안건별 요약 데이터 관리 객체 (DI 자동 관리)
+
+    Returns:
+        text/event-stream 형식의 StreamingResponse (상세는 API 명세서에서 확인)
+    """
     meeting_context = await load_chat_context_and_update_agenda_status(request, chat_repo, agenda_repo, room_repo, user_repo)
-    chat_response = await bot.generate_chat(meeting_context=meeting_context, request=request)
+    if meeting_context.chats:
+        background_tasks.add_task(summarize_completed_agendas, meeting_context, request.roomId, summarizer, summary_repo)
+
+    stream = bot.generate_chat_stream(meeting_context=meeting_context, request=request)
+    first = await stream.__anext__()  # 첫 조각까지는 예외를 일반 에러 응답으로 처리
 
-    return success_response(data=chat_response.model_dump(), message="MBTI 봇의 채팅 생성을 완료했습니다.")
+    async def event_stream():
+        item = first
+        try:
+            while True:
+                if isinstance(item, ChatResponse):
+                    yield sse_event("done", {
+                        "status": "SUCCESS", "message": "MBTI 봇의 채팅 생성을 완료했습니다.", "data": item.model_dump()
+                    })
+                    return
+                yield sse_event("delta", {"text": item})
+                item = await stream.__anext__()
+        except BaseCustomError as e:
+            yield sse_event("error", {"status": "ERROR", "message": e.message, "data": None})
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+@app.get("/metrics/", response_model=Response)
+async def get_metrics():
+    """
+    서버 내부 지표 조회 API (캐시 적중률 등)
+
+    Returns:
+        Response 형식의 JSONResponse (data: {지표 이름: 통계 dict})
+    """
+    return success_response(data=metrics_registry.snapshot(), message="서버 지표 조회를 완료했습니다.")
 
 
 @app.get("/")
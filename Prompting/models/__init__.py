@@ -1,4 +1,5 @@
 from .chatroom import RoomModel, AgendaSummaryModel
 from .chat import ChatMessage, RoomMessages
 from .user import UserModel
-from .agenda import AgendaItemModel
\ No newline at end of file
+from .agenda import AgendaItemModel
+from .agenda_summary import StoredAgendaSummaryModel
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+
+class StoredAgendaSummaryModel(BaseModel):
+    """
+    StoredAgendaSummaryModel: 안건 논의 완료 시점에 미리 생성해 둔 안건별 요약 데이터 구조.
+
+    - fingerprint: 요약 생성 시점의 안건 채팅 내역 해시값 (MeetingContext.agenda_fingerprint)
+    - summary: Gemini 요약 응답 dict (step, sub_topic, key_statements, conclusion)
+    """
+    fingerprint: str
+    summary: dict
+
+    class Config:
+        extra = "ignore"
@@ -16,7 +16,8 @@ class RoomModel(BaseModel):
     content: str
     participants: list[str]
     # mbti: str
-    # summary: list[AgendaSummaryModel]
+    summary: Optional[list[AgendaSummaryModel]] = None
+    summaryFingerprint: Optional[str] = None  # 요약 생성 시점의 회의 해시값 (MeetingContext.meeting_fingerprint)
 
     class Config:
         extra = "ignore"
@@ -2,3 +2,6 @@ from .agenda_repository import AgendaRepository
 from .chat_repository import ChatRepository
 from .room_repository import RoomRepository
 from .user_repository import UserRepository
+from .agenda_summary_repository import AgendaSummaryRepository
+from .token_count_repository import TokenCountRepository
+from .repository_cache import RepositoryCache
@@ -1,13 +1,21 @@
-from .mongo_client import db, AGENDA_COLLECTION
+from typing import Optional
+
+from .mongo_client import get_db, AGENDA_COLLECTION
+from .repository_cache import RepositoryCache
 from Prompting.exceptions import MongoAccessError, catch_and_raise
 from Prompting.common import AgendaStatus
-from pymongo import ReturnDocument
+from pymongo import ReturnDocument, UpdateOne
 from Prompting.models import AgendaItemModel
 
 
 class AgendaRepository:
-    def __init__(self):
-        self.collection = db[AGENDA_COLLECTION]
+    def __init__(self, cache: Optional[RepositoryCache] = None):
+        """
+        Args:
+            cache: 안건 조회 결과를 공유할 read-through 캐시 (선택 사항)
+        """
+        self.collection = get_db()[AGENDA_COLLECTION]
+        self.cache = cache
 
     @catch_and_raise("MongoDB 안건 저장", MongoAccessError)
     async def save_agenda(self, room_id: str, agenda_dict: dict[str, str]) -> dict[str, str]:
@@ -21,6 +29,62 @@ class AgendaRepository:
         Returns:
             [안건 ID]-[안건명]이 매핑된 dict (예비 안건을 포함해 실제 저장된 안건 데이터)
         """
+        agenda_data = self._to_agenda_data(agenda_dict)
+        result = await self.collection.update_one(
+            {"_id": room_id},  # 검색 기준
+            {"$set": {"roomId": room_id, "agendas": agenda_data}},  # 갱신 필드
+            upsert=True  # 없으면 새로 insert
+        )
+        self._invalidate(room_id)
+
+        if result.modified_count == 0 and result.upserted_id is None:
+            raise MongoAccessError("회의 안건 저장 실패")
+
+        return agenda_dict  # 반환은 [안건 ID]-[안건명]이 매핑된 dict만
+
+
+    @catch_and_raise("MongoDB 안건 일괄 저장", MongoAccessError)
+    async def save_agendas(self, agenda_dicts: dict[str, dict[str, str]]) -> dict[str, dict[str, str]]:
+        """
+        여러 채팅방의 안건 데이터를 한 번의 bulk write로 MongoDB agenda 콜렉션에 저장
+
+        Args:
+            agenda_dicts: [채팅방 ID]-[[안건 ID]-[안건명]이 매핑된 dict] 매핑
+
+        Returns:
+            [채팅방 ID]-[실제 저장된 [안건 ID]-[안건명] dict] 매핑 (예비 안건 포함)
+        """
+        operations = [
+            UpdateOne(
+                {"_id": room_id},
+                {"$set": {"roomId": room_id, "agendas": self._to_agenda_data(agenda_dict)}},
+                upsert=True
+            )
+            for room_id, agenda_dict in agenda_dicts.items()
+        ]
+        if not operations:
+            return {}
+
+        result = await self.collection.bulk_write(operations, ordered=False)  # 채팅방 간 순서 무관
+        for room_id in agenda_dicts:
+            self._invalidate(room_id)
+        if result.matched_count + result.upserted_count != len(operations):
+            raise MongoAccessError("회의 안건 일괄 저장 실패")
+
+        return agenda_dicts
+
+
+    @staticmethod
+    def _to_agenda_data(agenda_dict: dict[str, str]) -> dict[str, dict]:
+        """
+        [안건 ID]-[안건명] dict에 예비 안건을 추가하고, 안건명과 논의 상태를 함께 담은 DB 저장용 dict로 변환
+
+        Args:
+            agenda_dict: [안건 ID]-[안건명]이 매핑된 dict (예비 안건이 추가됨)
+
+        Returns:
+            [안건 ID]-[{안건명, 논의 상태}]가 매핑된 DB 저장용 dict
+        """
         # 마지막 요소로 추가 논의를 위한 예비 안건 추가
         last_agenda_id = str(len(agenda_dict) + 1)
         agenda_dict[last_agenda_id] = "예비 안건 (회의 중 추가 논의 시)"
@@ -32,29 +96,32 @@ class AgendaRepository:
                 "title": title,
                 "status": AgendaStatus.PENDING.value
             }
-
-        result = await self.collection.update_one(
-            {"_id": room_id},  # 검색 기준
-            {"$set": {"roomId": room_id, "agendas": agenda_data}},  # 갱신 필드
-            upsert=True  # 없으면 새로 insert
-        )
-
-        if result.modified_count == 0 and result.upserted_id is None:
-            raise MongoAccessError("회의 안건 저장 실패")
-
-        return agenda_dict  # 반환은 [안건 ID]-[안건명]이 매핑된 dict만
+        return agenda_data
 
 
     @catch_and_raise("MongoDB 안건 조회", MongoAccessError)
     async def get_agenda_by_room(self, room_id: str) -> dict[str, AgendaItemModel]:
-        """채팅방 ID를 기반으로 해당 방의 안건 데이터를 검색"""
+        """
+        채팅방 ID를 기반으로 해당 방의 안건 데이터를 검색
+
+        Note:
+            - 캐시가 있으면 캐시를 먼저 조회하고, 캐시된 안건은 복사본 반환
+            - 조회 중에 같은 채팅방의 안건 쓰기가 있었으면 조회 결과(쓰기 이전 문서일 수 있음)를 캐시에 저장하지 않음
+        """
+        generation = 0
+        if self.cache:
+            agendas = self.cache.agendas.get(room_id)
+            if agendas is not None:
+                return self._copy_agendas(agendas)
+            generation = self.cache.agendas.generation()
+
         doc = await self.collection.find_one({"roomId": room_id})
         if doc is None:
             raise MongoAccessError(f"roomId '{room_id}'에 해당하는 안건 데이터 없음")
-        return {
-            aid: AgendaItemModel(**item)
-            for aid, item in doc.get("agendas", {}).items()
-        }
+        agendas = self._to_agenda_models(doc)
+        if self.cache:
+            self.cache.agendas.set_if_unchanged(room_id, self._copy_agendas(agendas), generation)
+        return agendas
 
 
     @catch_and_raise("MongoDB 안건 상태 업데이트", MongoAccessError)
@@ -68,6 +135,7 @@ class AgendaRepository:
             is_skipped: 안건의 생략 여부. 생략이 아니면 완료로 처리
         """
         status = AgendaStatus.SKIPPED if is_skipped else AgendaStatus.COMPLETE
+        generation = self.cache.agendas.generation() if self.cache else 0
         updated_agendas = await self.collection.find_one_and_update(
             {"_id": room_id},
             {"$set": {f"agendas.{agenda_id}.status": status.value}},
@@ -75,5 +143,32 @@ class AgendaRepository:
             return_document=ReturnDocument.AFTER  # 업데이트 후의 값을 반환
         )
         if updated_agendas is None:
+            self._invalidate(room_id)
             raise MongoAccessError("안건 상태 업데이트 실패")
+        if self.cache:  # 업데이트 후 문서로 캐시 갱신 (동시에 진행된 다른 쓰기가 있으면 제거)
+            self.cache.agendas.write(room_id, self._to_agenda_models(updated_agendas), generation)
+
+
+    @staticmethod
+    def _to_agenda_models(doc: dict) -> dict[str, AgendaItemModel]:
+
+        """안건 문서의 agendas 필드를 [안건 ID]-[AgendaItemModel] dict로 변환"""
+
+        return {aid: AgendaItemModel(**item) for aid, item in doc.get("agendas", {}).items()}
+
+
+    @staticmethod
+    def _copy_agendas(agendas: dict[str, AgendaItemModel]) -> dict[str, AgendaItemModel]:
+
+        """캐시와 호출 측이 안건 dict를 공유하지 않도록 복사"""
+
+        return {aid: item.model_copy() for aid, item in agendas.items()}
+
+
+    def _invalidate(self, room_id: str):
+
+        """안건을 쓴 채팅방의 캐시된 안건 제거"""
+
+        if self.cache:
+            self.cache.agendas.invalidate(room_id)
 
@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+from .mongo_client import get_db, AGENDA_SUMMARY_COLLECTION
+from Prompting.exceptions.errors import MongoAccessError
+from Prompting.exceptions.decorators import catch_and_raise
+from Prompting.models import StoredAgendaSummaryModel
+
+
+class AgendaSummaryRepository:
+    def __init__(self):
+        self.collection = get_db()[AGENDA_SUMMARY_COLLECTION]
+
+    @catch_and_raise("MongoDB 안건별 요약 저장", MongoAccessError)
+    async def save_agenda_summaries(self, room_id: str, summaries: dict[str, StoredAgendaSummaryModel]):
+        """
+        채팅방 문서에 안건별 요약을 한 번의 쓰기로 추가 또는 갱신
+
+        Args:
+            room_id: 채팅방 ID
+            summaries: 안건 ID -> 저장할 안건별 요약 (요약 생성에 사용한 채팅 내역 해시값 포함)
+        """
+        if not summaries:
+            return
+
+        updated_at = datetime.now(timezone.utc)
+        await self.collection.update_one(
+            {"_id": room_id},
+            {"$set": {
+                "roomId": room_id,
+                **{
+                    f"summaries.{aid}": {**item.dict(), "updatedAt": updated_at}
+                    for aid, item in summaries.items()
+                }
+            }},
+            upsert=True
+        )
+
+    @catch_and_raise("MongoDB 안건별 요약 조회", MongoAccessError)
+    async def get_agenda_summaries(self, room_id: str) -> dict[str, StoredAgendaSummaryModel]:
+        """채팅방 ID로 저장된 안건별 요약을 조회. 안건 ID-요약 맵을 반환 (없으면 빈 dict)."""
+        doc = await self.collection.find_one({"_id": room_id}, projection={"summaries": 1})
+        if doc is None:
+            return {}
+        return {
+            aid: StoredAgendaSummaryModel(**item)
+            for aid, item in doc.get("summaries", {}).items()
+        }
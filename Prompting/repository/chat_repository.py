@@ -1,41 +1,112 @@
-from .mongo_client import db, CHAT_COLLECTION
+from .mongo_client import get_db, get_server_version, CHAT_COLLECTION, SORT_ARRAY_MIN_VERSION
 from Prompting.exceptions.errors import MongoAccessError
 from Prompting.exceptions.decorators import catch_and_raise
 from Prompting.models import ChatMessage, RoomMessages
 from collections import OrderedDict
+from typing import Any, Optional
 
 
 class ChatRepository:
+    CHAT_FIELDS = tuple(ChatMessage.model_fields)  # MongoDB에서 전송받을 채팅 메세지 필드 (ChatMessage 필드만)
+
     def __init__(self):
-        self.collection = db[CHAT_COLLECTION]
+        self.collection = get_db()[CHAT_COLLECTION]
 
     @catch_and_raise("MongoDB 전체 채팅 조회", MongoAccessError)
     async def get_chat_logs_by_room(self, room_id: str) -> OrderedDict[str, list[ChatMessage]]:
-        """채팅방 ID 기준으로 해당 방의 전체 채팅 기록을 시간 순서대로 조회. 안건 ID-채팅내역 맵을 반환."""
-
-        doc = await self.collection.find_one({"_id": room_id})
+        """
+        채팅방 ID 기준으로 해당 방의 전체 채팅 기록을 시간 순서대로 조회. 안건 ID-채팅내역 맵을 반환.
+        (안건별 채팅 정렬은 MongoDB aggregation에서 처리, $sortArray를 지원하지 않는 서버면 Python에서 정렬)
+        """
+        sort_in_db = await self._supports_sort_array()
+        doc = await self._aggregate_one(self.room_pipeline(room_id, sort_in_db))
         if doc is None:
             raise MongoAccessError(f"roomId '{room_id}'에 해당하는 채팅 데이터 없음")
 
-        room_msgs = RoomMessages(**doc)
-        agenda_chat_map = room_msgs.messages
-
-        # 각 agenda의 채팅 리스트를 timestamp 기준 정렬
-        for aid in agenda_chat_map:
-            agenda_chat_map[aid].sort(key=lambda chat: chat.timestamp)
-
+        agenda_chat_map = RoomMessages(**doc).messages
+        if not sort_in_db:
+            for chats in agenda_chat_map.values():
+                chats.sort(key=lambda chat: chat.timestamp)
         sorted_agenda_chat_map = sorted(agenda_chat_map.items(), key=lambda item: int(item[0]))  # agenda_id 정렬
         return OrderedDict(sorted_agenda_chat_map)
 
 
     @catch_and_raise("MongoDB 지정 안건 채팅 조회", MongoAccessError)
     async def get_chat_logs_by_agenda_id(self, room_id: str, agenda_id: str) -> dict[str, list[ChatMessage]]:
-        """특정 안건에 대한 채팅 기록을 시간 순으로 조회"""
-
-        doc = await self.collection.find_one({"_id": room_id})
+        """
+        특정 안건에 대한 채팅 기록을 시간 순으로 조회
+        (해당 안건의 채팅만 projection해 MongoDB에서 정렬된 상태로 전송받음, $sortArray를 지원하지 않는 서버면 Python에서 정렬)
+        """
+        sort_in_db = await self._supports_sort_array()
+        doc = await self._aggregate_one(self.agenda_pipeline(room_id, agenda_id, sort_in_db))
         if doc is None:
             raise MongoAccessError(f"roomId '{room_id}'에 해당하는 채팅 데이터 없음")
+        if doc.get("chats") is None:
+            raise MongoAccessError(f"roomId '{room_id}'에 안건 ID '{agenda_id}'의 채팅 데이터 없음")
+
+        agenda_chat_map = RoomMessages(messages={agenda_id: doc["chats"]}).messages
+        if not sort_in_db:
+            agenda_chat_map[agenda_id].sort(key=lambda chat: chat.timestamp)
+        return agenda_chat_map
+
+
+    def room_pipeline(self, room_id: str, sort_in_db: bool = True) -> list[dict[str, Any]]:
+
+        """채팅방 전체 채팅을 안건별로 (sort_in_db면 timestamp 순 정렬해) 반환하는 aggregation pipeline"""
+
+        return [
+            {"$match": {"_id": room_id}},
+            {"$project": {"_id": 0, "messages": {"$arrayToObject": {"$map": {
+                "input": {"$objectToArray": "$messages"},
+                "as": "agenda",
+                "in": {"k": "$$agenda.k", "v": self._projected_chats("$$agenda.v", sort_in_db)},
+            }}}}},
+        ]
+
+
+    def agenda_pipeline(self, room_id: str, agenda_id: str, sort_in_db: bool = True) -> list[dict[str, Any]]:
+        """
+        채팅방의 특정 안건 채팅(messages.<agenda_id>)만 (sort_in_db면 timestamp 순 정렬해) 반환하는 aggregation pipeline
+
+        Raises:
+            MongoAccessError: 안건 ID가 숫자 문자열이 아닌 경우 (필드 경로에 그대로 사용되므로)
+        """
+        if not agenda_id.isdigit():
+            raise MongoAccessError(f"유효하지 않은 안건 ID '{agenda_id}'")
+        return [
+            {"$match": {"_id": room_id}},
+            {"$project": {"_id": 0, "chats": self._projected_chats(f"$messages.{agenda_id}", sort_in_db)}},
+        ]
+
+
+    async def _aggregate_one(self, pipeline: list[dict[str, Any]]) -> Optional[dict]:
+
+        """aggregation 결과 문서 하나 (없으면 None)"""
+
+        docs = await self.collection.aggregate(pipeline).to_list(length=1)
+        return docs[0] if docs else None
+
+
+    @staticmethod
+    async def _supports_sort_array() -> bool:
+
+        """연결된 MongoDB 서버가 $sortArray(MongoDB 5.2+)를 지원하는지 확인 (서버 버전은 처음 조회 후 재사용)"""
+
+        return await get_server_version() >= SORT_ARRAY_MIN_VERSION
+
 
-        room_msgs = RoomMessages(**doc)
-        return {agenda_id: sorted(room_msgs.messages[agenda_id], key=lambda chat: chat.timestamp)}
+    @classmethod
+    def _projected_chats(cls, chats_expr: str, sort_in_db: bool = True) -> dict[str, Any]:
+        """
+        채팅 배열에서 ChatMessage 필드만 남기는 aggregation expression
 
+        Args:
+            chats_expr: 채팅 배열 필드 경로 expression
+            sort_in_db: True면 $sortArray(MongoDB 5.2+)로 timestamp 순 정렬 (False면 저장 순서 그대로)
+        """
+        chats = {"$sortArray": {"input": chats_expr, "sortBy": {"timestamp": 1}}} if sort_in_db else chats_expr
+        return {"$map": {
+            "input": chats,
+            "as": "chat",
+            "in": {field: f"$$chat.{field}" for field in cls.CHAT_FIELDS},
+        }}
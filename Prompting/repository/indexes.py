@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from pymongo.database import Database
+
+from .mongo_client import (
+    get_db, REQUIRED_INDEXES,
+    AGENDA_COLLECTION, CHAT_COLLECTION, ROOM_COLLECTION, USER_COLLECTION, AGENDA_SUMMARY_COLLECTION
+)
+from Prompting.exceptions.errors import MongoAccessError
+from Prompting.exceptions.decorators import catch_and_raise
+
+PLAN_CHECK_ID = "QUERY_PLAN_CHECK"  # 실행 계획 확인용 조회 조건 값 (실제 데이터와 무관)
+
+# 실행 계획을 확인할 repository 조회 (repository 메서드, 콜렉션, 조회 조건)
+#  - aggregation/update 쿼리는 같은 조회 조건의 find 실행 계획으로 확인
+QUERY_PLAN_CHECKS: list[tuple[str, str, dict[str, Any]]] = [
+    ("AgendaRepository.get_agenda_by_room", AGENDA_COLLECTION, {"roomId": PLAN_CHECK_ID}),
+    ("AgendaRepository.update_status", AGENDA_COLLECTION, {"_id": PLAN_CHECK_ID}),
+    ("ChatRepository.get_chat_logs_by_room", CHAT_COLLECTION, {"_id": PLAN_CHECK_ID}),
+    ("RoomRepository.get_room_info", ROOM_COLLECTION, {"roomId": PLAN_CHECK_ID}),
+    ("RoomRepository.get_summary_by_fingerprint", ROOM_COLLECTION,
+     {"roomId": PLAN_CHECK_ID, "summaryFingerprint": PLAN_CHECK_ID}),
+    ("UserRepository.get_user_list_by_emails", USER_COLLECTION,
+     {"email": {"$in": [f"{PLAN_CHECK_ID}@example.com", f"{PLAN_CHECK_ID}2@example.com"]}}),
+    ("AgendaSummaryRepository.get_agenda_summaries", AGENDA_SUMMARY_COLLECTION, {"_id": PLAN_CHECK_ID}),
+]
+
+
+@dataclass
+class QueryPlan:
+    """
+    repository 조회의 실행 계획 요약
+
+    Attributes:
+        query: repository 메서드 이름
+        collection: 조회 콜렉션 이름
+        stages: 채택된 실행 계획(winningPlan)의 stage 이름 목록 (상위 stage부터)
+    """
+    query: str
+    collection: str
+    stages: list[str]
+
+    @property
+    def is_collection_scan(self) -> bool:
+        return "COLLSCAN" in self.stages
+
+
+@catch_and_raise("MongoDB 인덱스 생성", MongoAccessError)
+async def ensure_indexes(database: Optional[Database] = None) -> dict[str, list[str]]:
+    """
+    REQUIRED_INDEXES에 선언된 콜렉션별 인덱스 중 아직 없는 인덱스를 생성 (서버 시작마다 호출 가능)
+
+    Note:
+        - 같은 key pattern의 인덱스가 이름만 다르게 이미 있으면 (예: 다른 서비스가 만든 인덱스) 생성하지 않음
+          (MongoDB는 이름만 다른 같은 인덱스 생성을 IndexOptionsConflict로 거부)
+
+    Args:
+        database: 인덱스를 생성할 DB (기본값: 서비스 DB)
+
+    Returns:
+        콜렉션 이름 -> 새로 생성한 인덱스 이름 목록 (모두 이미 있으면 빈 리스트)
+    """
+    database = database if database is not None else get_db()
+    created = {}
+    for collection, indexes in REQUIRED_INDEXES.items():
+        existing_keys = {tuple(info["key"]) for info in (await database[collection].index_information()).values()}
+        missing = [index for index in indexes if tuple(index.document["key"].items()) not in existing_keys]
+        created[collection] = await database[collection].create_indexes(missing) if missing else []
+    return created
+
+
+@catch_and_raise("MongoDB 쿼리 실행 계획 확인", MongoAccessError)
+async def explain_repository_queries(database: Optional[Database] = None) -> list[QueryPlan]:
+    """
+    QUERY_PLAN_CHECKS의 repository 조회마다 explain을 실행해 채택된 실행 계획의 stage 목록을 반환
+
+    Args:
+        database: 실행 계획을 확인할 DB (기본값: 서비스 DB)
+
+    Returns:
+        repository 조회별 QueryPlan 리스트 (QUERY_PLAN_CHECKS 순서)
+    """
+    database = database if database is not None else get_db()
+    plans = []
+    for query, collection, condition in QUERY_PLAN_CHECKS:
+        explain = await database[collection].find(condition).explain()
+        winning_plan = explain.get("queryPlanner", {}).get("winningPlan", {})
+        plans.append(QueryPlan(query=query, collection=collection, stages=_plan_stages(winning_plan)))
+    return plans
+
+
+def _plan_stages(plan: Any) -> list[str]:
+
+    """실행 계획 트리(inputStage, inputStages, queryPlan 등)의 모든 stage 이름 (상위 stage부터)"""
+
+    if isinstance(plan, list):
+        return [stage for item in plan for stage in _plan_stages(item)]
+    if not isinstance(plan, dict):
+        return []
+    stages = [plan["stage"]] if "stage" in plan else []
+    for value in plan.values():
+        stages += _plan_stages(value)
+    return stages
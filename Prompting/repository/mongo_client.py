@@ -1,8 +1,18 @@
+import asyncio
+import logging
+from typing import Optional
+
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, IndexModel
 from pymongo.database import Database
 from dotenv import load_dotenv
 import os
 
+from Prompting.common.config import (
+    MONGO_MAX_POOL_SIZE, MONGO_MIN_POOL_SIZE, MONGO_WAIT_QUEUE_TIMEOUT_MS, MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    MONGO_COMPRESSORS, MONGO_ZLIB_COMPRESSION_LEVEL
+)
+
 load_dotenv()  # .env 파일 로드
 MONGO_URI = os.getenv("MONGO_URI")  # 환경 변수에서 mongo db uri 읽기
 MONGO_DB_NAME = "mindsync-fe"
@@ -11,6 +21,110 @@ AGENDA_COLLECTION = "agenda"
 CHAT_COLLECTION = "chat"
 ROOM_COLLECTION = "chatroom"
 USER_COLLECTION = "user"
+AGENDA_SUMMARY_COLLECTION = "agenda_summary"  # 논의 완료된 안건별 요약 (회의 요약 생성 시 재사용)
+TOKEN_COUNT_COLLECTION = "token_count"  # 토큰 수 계산 결과 캐시 (TTL 인덱스로 자동 만료)
+
+# 콜렉션별 필수 인덱스 (_id 외의 필드로 조회하는 repository 쿼리용, 서버 시작 시 repository.indexes.ensure_indexes로 생성)
+REQUIRED_INDEXES: dict[str, list[IndexModel]] = {
+    AGENDA_COLLECTION: [IndexModel([("roomId", ASCENDING)])],  # AgendaRepository.get_agenda_by_room
+    ROOM_COLLECTION: [IndexModel([("roomId", ASCENDING)])],  # RoomRepository의 채팅방 정보/요약 조회 및 요약 저장
+    USER_COLLECTION: [IndexModel([("email", ASCENDING)])],  # UserRepository.get_user_list_by_emails ($in 조회)
+}
+
+SORT_ARRAY_MIN_VERSION = (5, 2)  # 채팅 정렬을 MongoDB에서 처리($sortArray)할 수 있는 최소 서버 버전
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[AsyncIOMotorClient] = None  # 프로세스 전체에서 공유하는 MongoDB 클라이언트 (연결 풀)
+_server_version: Optional[tuple[int, ...]] = None  # 공유 클라이언트가 연결된 서버 버전 (처음 조회 후 재사용)
+
+
+def create_client(uri: Optional[str] = None, **options) -> AsyncIOMotorClient:
+    """
+    환경 변수의 연결 풀/압축 설정으로 MongoDB 클라이언트를 생성
+
+    Note:
+        - 기본값은 추가 패키지 없이 쓸 수 있는 zlib
+        - zstd/snappy 압축은 requirements.txt에 없는 추가 패키지(pymongo[zstd,snappy])가 필요하며,
+          설치되지 않은 압축 방식은 드라이버가 경고 후 제외
+        - 서버와 클라이언트가 모두 지원하는 압축 방식 중 MONGO_COMPRESSORS에 먼저 적힌 방식을 사용
+
+    Args:
+        uri: MongoDB 연결 URI (미지정 시 환경 변수 MONGO_URI)
+        options: 환경 변수 설정 대신 사용할 드라이버 옵션 (예: compressors="zlib")
+
+    Returns:
+        생성된 MongoDB 비동기 클라이언트 (연결은 첫 요청 시 생성)
+    """
+    settings = {
+        "maxPoolSize": MONGO_MAX_POOL_SIZE,
+        "minPoolSize": MONGO_MIN_POOL_SIZE,
+        "waitQueueTimeoutMS": MONGO_WAIT_QUEUE_TIMEOUT_MS or None,  # 0이면 연결이 빌 때까지 대기
+        "serverSelectionTimeoutMS": MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    }
+    if MONGO_COMPRESSORS:
+        settings["compressors"] = MONGO_COMPRESSORS
+        settings["zlibCompressionLevel"] = MONGO_ZLIB_COMPRESSION_LEVEL
+    settings.update(options)
+    return AsyncIOMotorClient(uri or MONGO_URI, **settings)
+
+
+async def connect(**options) -> AsyncIOMotorClient:
+    """
+    공유 MongoDB 클라이언트를 생성하고 연결을 미리 맺어둠 (lifespan 시작 시 호출, 기존 클라이언트는 닫음)
+
+    Note:
+        - ping을 max(1, minPoolSize)개 동시에 보내 서버 선택, 인증과 연결 생성을 첫 API 요청 전에 끝냄
+        - 서버 버전을 미리 조회해, SORT_ARRAY_MIN_VERSION 미만이면 채팅 정렬을 Python에서 처리한다는 경고를 남김
+        - warm-up 실패는 경고만 남기고 진행 (요청 처리 시 드라이버가 다시 연결 시도)
+
+    Args:
+        options: 환경 변수 설정 대신 사용할 드라이버 옵션
+
+    Returns:
+        공유 MongoDB 클라이언트
+    """
+    global _client
+    close()
+    _client = create_client(**options)
+    try:
+        await asyncio.gather(*[_client.admin.command("ping") for _ in range(max(1, MONGO_MIN_POOL_SIZE))])
+        version = await get_server_version()
+        if version < SORT_ARRAY_MIN_VERSION:
+            logger.warning("MongoDB %s는 $sortArray를 지원하지 않아 채팅 정렬을 Python에서 처리 (권장 버전: %s 이상)",
+                           ".".join(map(str, version)), ".".join(map(str, SORT_ARRAY_MIN_VERSION)))
+    except Exception as e:
+        logger.warning("MongoDB 연결 warm-up 실패: %s", e)
+    return _client
+
+
+def close():
+
+    """공유 MongoDB 클라이언트의 연결 풀을 닫음 (lifespan 종료 시 호출)"""
+
+    global _client, _server_version
+    if _client is not None:
+        _client.close()
+        _client = None
+    _server_version = None
+
+
+def get_db(name: str = MONGO_DB_NAME) -> Database:
+
+    """공유 MongoDB 클라이언트의 DB (lifespan 밖에서 처음 호출하면 환경 변수 설정으로 클라이언트 생성)"""
+
+    global _client
+    if _client is None:
+        _client = create_client()
+    return _client[name]
+
+
+async def get_server_version() -> tuple[int, ...]:
+
+    """공유 MongoDB 클라이언트가 연결된 서버 버전 (예: (7, 0, 12), 처음 조회 후 재사용)"""
 
-client = AsyncIOMotorClient(MONGO_URI)
-db: Database = client[MONGO_DB_NAME]
\ No newline at end of file
+    global _server_version
+    if _server_version is None:
+        info = await get_db().client.server_info()
+        _server_version = tuple(info["versionArray"][:3])
+    return _server_version
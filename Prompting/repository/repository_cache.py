@@ -0,0 +1,48 @@
+from typing import Any, Optional
+
+from Prompting.common.cache import LRUCache, VersionedLRUCache
+from Prompting.common.config import (
+    REPOSITORY_CACHE_SIZE, REPOSITORY_CACHE_ROOM_TTL_SECONDS, REPOSITORY_CACHE_USER_TTL_SECONDS,
+    REPOSITORY_CACHE_AGENDA_TTL_SECONDS
+)
+
+
+class RepositoryCache:
+    def __init__(self, maxsize: int = REPOSITORY_CACHE_SIZE,
+                 room_ttl: Optional[float] = REPOSITORY_CACHE_ROOM_TTL_SECONDS,
+                 user_ttl: Optional[float] = REPOSITORY_CACHE_USER_TTL_SECONDS,
+                 agenda_ttl: Optional[float] = REPOSITORY_CACHE_AGENDA_TTL_SECONDS):
+        """
+        RoomRepository, UserRepository, AgendaRepository 조회 결과의 read-through 캐시 (프로세스 전체에서 공유)
+
+        Note:
+            - 회의 중에는 거의 바뀌지 않는 채팅방 정보, 참여자 정보, 안건을 MBTI 봇 채팅/회의 요약 요청마다 다시 읽지 않도록 함
+            - 이 서비스의 쓰기(save_agenda, save_summary)는 각 repository가 쓰기 직후 해당 항목을 제거하고,
+              update_status는 업데이트 후 문서로 캐시를 갱신
+            - 채팅방/안건은 쓰기 일련번호를 확인해, 쓰기 이전에 시작한 조회 결과가 쓰기 이후에 저장되지 않도록 함
+            - 다른 서비스의 쓰기(참여자 추가 등)는 엔티티별 만료 시간(TTL)이 지나야 반영됨
+            - 엔티티별 항목 수 제한(LRU)과 적중률 통계는 LRUCache를 그대로 사용
+
+        Args:
+            maxsize: 엔티티별 최대 저장 항목 수
+            room_ttl: 채팅방 정보 만료 시간(초). None이면 만료 없음
+            user_ttl: 사용자 정보 만료 시간(초). None이면 만료 없음
+            agenda_ttl: 안건 만료 시간(초). None이면 만료 없음
+        """
+        self.rooms = VersionedLRUCache(maxsize=maxsize, ttl=room_ttl)  # 채팅방 ID -> RoomModel
+        self.users = LRUCache(maxsize=maxsize, ttl=user_ttl)  # 이메일 -> UserModel (이 서비스에서 쓰지 않음)
+        self.agendas = VersionedLRUCache(maxsize=maxsize, ttl=agenda_ttl)  # 채팅방 ID -> [안건 ID]-[AgendaItemModel] dict
+
+    def clear(self):
+
+        """전체 엔티티의 캐시 항목 제거"""
+
+        self.rooms.clear()
+        self.users.clear()
+        self.agendas.clear()
+
+    def stats(self) -> dict[str, Any]:
+
+        """엔티티별 캐시 크기 및 적중률 통계"""
+
+        return {"room": self.rooms.stats(), "user": self.users.stats(), "agenda": self.agendas.stats()}
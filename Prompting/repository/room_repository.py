@@ -1,33 +1,71 @@
-from .mongo_client import db, ROOM_COLLECTION
+from typing import Optional
+from .mongo_client import get_db, ROOM_COLLECTION
+from .repository_cache import RepositoryCache
 from Prompting.exceptions.errors import MongoAccessError
 from Prompting.exceptions.decorators import catch_and_raise
 from Prompting.models import RoomModel, AgendaSummaryModel
 
 
 class RoomRepository:
-    def __init__(self):
-        self.collection = db[ROOM_COLLECTION]
+    def __init__(self, cache: Optional[RepositoryCache] = None):
+        """
+        Args:
+            cache: 채팅방 정보 조회 결과를 공유할 read-through 캐시 (선택 사항)
+        """
+        self.collection = get_db()[ROOM_COLLECTION]
+        self.cache = cache
 
     @catch_and_raise("MongoDB 채팅방 정보 조회", MongoAccessError)
     async def get_room_info(self, room_id: str) -> RoomModel:
-        """채팅방 ID로 해당 방의 정보를 조회"""
+        """
+        채팅방 ID로 해당 방의 정보를 조회
+
+        Note:
+            - 캐시가 있으면 캐시를 먼저 조회하고, 캐시된 정보는 복사본 반환
+            - 조회 중에 같은 채팅방의 요약 저장이 있었으면 조회 결과를 캐시에 저장하지 않음
+        """
+        generation = 0
+        if self.cache:
+            room = self.cache.rooms.get(room_id)
+            if room is not None:
+                return room.model_copy(deep=True)
+            generation = self.cache.rooms.generation()
+
         doc = await self.collection.find_one({"roomId": room_id})
         if doc is None:
             raise MongoAccessError(f"roomId '{room_id}'에 해당하는 채팅방 없음")
-        return RoomModel(**doc)
+        room = RoomModel(**doc)
+        if self.cache:
+            self.cache.rooms.set_if_unchanged(room_id, room.model_copy(deep=True), generation)
+        return room
 
     @catch_and_raise("MongoDB 회의 요약 저장", MongoAccessError)
-    async def save_summary(self, room_id: str, summary: list[AgendaSummaryModel]):
+    async def save_summary(self, room_id: str, summary: list[AgendaSummaryModel], fingerprint: Optional[str] = None):
         """
         room_id를 가진 채팅방 문서에 'summary' 필드 추가 또는 갱신
 
         Args:
             room_id: 채팅방 ObjectId
             summary: 저장할 요약 데이터
+            fingerprint: 요약 생성 시점의 회의 해시값 (요약 재사용 판단용, 선택 사항)
         """
         result = await self.collection.update_one(
             {"roomId": room_id},
-            {"$set": {"summary": [item.dict() for item in summary]}}
+            {"$set": {"summary": [item.dict() for item in summary], "summaryFingerprint": fingerprint}}
         )
+        if self.cache:
+            self.cache.rooms.invalidate(room_id)  # 캐시된 채팅방 정보의 요약 필드 무효화
         if result.modified_count == 0 and result.upserted_id is None:
             raise MongoAccessError("회의 요약 저장 실패")
+
+
+    @catch_and_raise("MongoDB 회의 요약 조회", MongoAccessError)
+    async def get_summary_by_fingerprint(self, room_id: str, fingerprint: str) -> Optional[list[AgendaSummaryModel]]:
+        """채팅방에 저장된 회의 요약이 주어진 회의 해시값으로 생성된 경우에만 반환 (없거나 다르면 None)"""
+        doc = await self.collection.find_one(
+            {"roomId": room_id, "summaryFingerprint": fingerprint},
+            projection={"summary": 1, "_id": 0}
+        )
+        if doc is None or doc.get("summary") is None:
+            return None
+        return [AgendaSummaryModel(**item) for item in doc["summary"]]
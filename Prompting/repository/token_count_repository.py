@@ -0,0 +1,37 @@
+from datetime import datetime, timezone
+from typing import Optional
+from .mongo_client import get_db, TOKEN_COUNT_COLLECTION
+from Prompting.exceptions.errors import MongoAccessError
+from Prompting.exceptions.decorators import catch_and_raise
+
+
+class TokenCountRepository:
+    def __init__(self):
+        self.collection = get_db()[TOKEN_COUNT_COLLECTION]
+
+    @catch_and_raise("MongoDB 토큰 수 캐시 TTL 인덱스 생성", MongoAccessError)
+    async def ensure_ttl_index(self, ttl_seconds: int):
+        """저장 시각(createdAt) 기준으로 캐시 문서가 자동 만료되도록 TTL 인덱스 생성 (이미 있으면 무시)"""
+        await self.collection.create_index("createdAt", expireAfterSeconds=ttl_seconds)
+
+    @catch_and_raise("MongoDB 토큰 수 캐시 조회", MongoAccessError)
+    async def get_token_count(self, key: str) -> Optional[int]:
+        """텍스트-모델 해시 key로 저장된 토큰 수를 조회 (없으면 None)"""
+        doc = await self.collection.find_one({"_id": key}, projection={"tokens": 1})
+        return doc["tokens"] if doc else None
+
+    @catch_and_raise("MongoDB 토큰 수 캐시 저장", MongoAccessError)
+    async def save_token_count(self, key: str, model: str, tokens: int):
+        """
+        텍스트-모델 해시 key에 토큰 수를 저장
+
+        Args:
+            key: 텍스트와 모델명의 해시값
+            model: 토큰 수 계산 기준 모델명
+            tokens: 토큰 수
+        """
+        await self.collection.update_one(
+            {"_id": key},
+            {"$set": {"model": model, "tokens": tokens, "createdAt": datetime.now(timezone.utc)}},
+            upsert=True
+        )
@@ -1,24 +1,49 @@
-from .mongo_client import db, USER_COLLECTION
+from typing import Optional
+
+from .mongo_client import get_db, USER_COLLECTION
+from .repository_cache import RepositoryCache
 from Prompting.exceptions.errors import MongoAccessError
 from Prompting.exceptions.decorators import catch_and_raise
 from Prompting.models import UserModel
 
 
 class UserRepository:
-    def __init__(self):
-        self.collection = db[USER_COLLECTION]
+    def __init__(self, cache: Optional[RepositoryCache] = None):
+        """
+        Args:
+            cache: 사용자 정보 조회 결과를 공유할 read-through 캐시 (선택 사항)
+        """
+        self.collection = get_db()[USER_COLLECTION]
+        self.cache = cache
 
     @catch_and_raise("MongoDB 참여자 정보 목록 조회", MongoAccessError)
     async def get_user_list_by_emails(self, emails: list[str]) -> list[UserModel]:
         """
         이메일 목록을 기준으로 사용자 정보를 조회
 
+        Note:
+            캐시가 있으면 캐시에 없는 이메일의 사용자만 MongoDB에서 조회
+
         Args:
             emails: 조회할 사용자 이메일 목록
 
         Returns:
-            사용자 정보가 담긴 dict 객체 리스트
+            사용자 정보가 담긴 dict 객체 리스트 (이메일 목록 순서, 없는 사용자는 제외)
         """
-        cursor = self.collection.find({"email": {"$in": emails}})
-        docs = await cursor.to_list(length=None)
-        return [UserModel.model_validate(doc) for doc in docs]
\ No newline at end of file
+        emails = list(dict.fromkeys(emails))  # 중복 이메일 제거
+        users: dict[str, UserModel] = {}
+        if self.cache:
+            for email in emails:
+                user = self.cache.users.get(email)
+                if user is not None:
+                    users[email] = user.model_copy()
+
+        missing = [email for email in emails if email not in users]
+        if missing:
+            cursor = self.collection.find({"email": {"$in": missing}})
+            for doc in await cursor.to_list(length=None):
+                user = UserModel.model_validate(doc)
+                users[user.email] = user
+                if self.cache:
+                    self.cache.users.set(user.email, user.model_copy())
+        return [users[email] for email in emails if email in users]
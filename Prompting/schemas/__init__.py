@@ -1,4 +1,5 @@
 from .agenda_request import AgendaRequest
+from .agenda_batch_request import AgendaBatchRequest
 from .chat_request import ChatRequest
 from .chat_response import ChatResponse
 from .summary_request import SummaryRequest
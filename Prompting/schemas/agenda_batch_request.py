@@ -0,0 +1,5 @@
+from pydantic import BaseModel
+from .agenda_request import AgendaRequest
+
+class AgendaBatchRequest(BaseModel):
+    requests: list[AgendaRequest]  # 채팅방별 안건 생성 요청 (같은 채팅방이 중복되면 마지막 요청 사용)
\ No newline at end of file
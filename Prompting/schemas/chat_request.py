@@ -1,6 +1,9 @@
 from pydantic import BaseModel
+from typing import Optional
 
 class ChatRequest(BaseModel):
     roomId: str
     agendaId: str
-    is_previous_skipped: bool = False
\ No newline at end of file
+    is_previous_skipped: bool = False
+    all_bots: bool = False  # True면 모든 AI 참여자의 채팅을 한 번에 생성
+    bot_emails: Optional[list[str]] = None  # 채팅을 생성할 AI 참여자 이메일 목록 (지정 시 all_bots 무시)
\ No newline at end of file
@@ -2,4 +2,5 @@ from pydantic import BaseModel
 
 class SummaryRequest(BaseModel):
     roomId: str
-    is_last_agenda_skipped: bool = False
\ No newline at end of file
+    is_last_agenda_skipped: bool = False
+    use_cache: bool = True  # False면 저장된 요약을 재사용하지 않고 새로 생성
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""
+배치 안건 생성 벤치마크
+
+가짜 Gemini 클라이언트로 여러 채팅방의 안건을 생성할 때,
+채팅방별 단일 요청과 회의 설명을 묶은 배치 요청의 Gemini 요청 수, 입력 토큰 수, 소요 시간을 비교
+(일부 묶음 응답이 잘못된 경우 채팅방별 요청으로 대체되는지도 함께 확인)
+
+실행: python -m Prompting.scripts.benchmark.agenda_batch_benchmark  (프로젝트 루트에서)
+"""
+import asyncio
+import os
+import random
+import time
+
+os.environ.setdefault("GEMINI_API_KEY", "FAKE_API_KEY")  # 실제 API를 호출하지 않으므로 임의 키 사용
+
+from Prompting.services import AgendaGenerator
+from Prompting.scripts.benchmark.fake_gemini import FakeGenaiClient
+
+ROOM_COUNT = 48  # 한꺼번에 생성되는 채팅방 수
+LATENCY = 0.5  # 요청 1회의 기본 응답 지연 시간(초)
+PER_OUTPUT_TOKEN_LATENCY = 0.004  # 출력 토큰 1개당 생성 지연 시간(초)
+FAN_OUT = 8  # 동시 Gemini 요청 수 상한 (두 구성에 동일하게 적용)
+DESCRIPTION = "신규 서비스 출시 전 마케팅, 개발, 디자인 팀이 모여 일정과 역할 분담을 확정하는 회의입니다."
+
+
+async def run(batch_size: int, batch_error_rate: float = 0.0) -> dict:
+
+    """ROOM_COUNT개 채팅방의 안건을 생성하고 결과 통계를 반환 (batch_size=0이면 채팅방별 단일 요청)"""
+
+    random.seed(0)
+    fake = FakeGenaiClient(latency=LATENCY, per_output_token_latency=PER_OUTPUT_TOKEN_LATENCY,
+                           batch_error_rate=batch_error_rate)
+    generator = AgendaGenerator(batch_size=max(1, batch_size), max_fan_out=FAN_OUT)
+    generator.client.client = fake
+    descriptions = [f"{DESCRIPTION} (채팅방 {i})" for i in range(ROOM_COUNT)]
+
+    start = time.perf_counter()
+    if batch_size:
+        agenda_lists = await generator.generate_agendas_batch(descriptions)
+    else:
+        semaphore = asyncio.Semaphore(FAN_OUT)
+
+        async def generate(description: str) -> list[dict]:
+            async with semaphore:
+                return await generator.generate_agenda(description)
+
+        agenda_lists = await asyncio.gather(*[generate(d) for d in descriptions])
+    elapsed = time.perf_counter() - start
+
+    assert len(agenda_lists) == ROOM_COUNT and all(agenda_lists)
+    return {"calls": fake.generate_calls, "input_tokens": fake.input_tokens, "elapsed": elapsed}
+
+
+async def main():
+    print(f"채팅방 {ROOM_COUNT}개, 기본 지연 {LATENCY:.1f}s, 출력 토큰당 {PER_OUTPUT_TOKEN_LATENCY * 1000:.1f}ms, 동시 요청 {FAN_OUT}개")
+    print(f"{'구성':<26} | {'요청 수':>6} | {'입력 토큰':>9} | {'소요(s)':>7}")
+    for label, batch_size, error_rate in [
+        ("채팅방별 단일 요청", 0, 0.0),
+        ("배치 4개씩", 4, 0.0),
+        ("배치 8개씩", 8, 0.0),
+        ("배치 8개씩 (묶음 50% 실패)", 8, 0.5),
+    ]:
+        r = await run(batch_size, error_rate)
+        print(f"{label:<26} | {r['calls']:>6} | {r['input_tokens']:>9} | {r['elapsed']:>7.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,115 @@
+"""
+안건 생성 응답 캐시 벤치마크
+
+반복되는 정기 회의(같은 설명, 표기만 다른 설명, 회차만 다른 설명)와 주제가 다른 일회성 회의가 섞인 안건 생성 요청을 보내고,
+캐시 미사용/정확 일치만/정확 일치 + 유사 설명 재사용 구성의 Gemini 요청 수, 적중률, 평균 응답 시간을 비교
+(회차만 다른 설명은 숫자가 달라 유사 항목으로 재사용하지 않아야 함).
+가득 찬 캐시에서 유사 설명 조회 1회에 걸리는 시간도 함께 측정
+
+실행: python -m Prompting.scripts.benchmark.agenda_cache_benchmark  (프로젝트 루트에서)
+"""
+import asyncio
+import os
+import random
+import time
+from typing import Optional
+
+os.environ.setdefault("GEMINI_API_KEY", "FAKE_API_KEY")  # 실제 API를 호출하지 않으므로 임의 키 사용
+
+from Prompting.services import AgendaGenerator
+from Prompting.services.agenda_cache import AgendaResponseCache
+from Prompting.scripts.benchmark.fake_gemini import FakeGenaiClient
+
+LATENCY = 0.1  # 안건 생성 요청 1회의 응답 지연 시간(초)
+REQUESTS = 300  # 전체 안건 생성 요청 수
+RECURRING_RATIO = 0.7  # 정기 회의 요청 비율
+TEAMS = ["마케팅", "개발", "디자인", "영업", "인사", "재무", "고객지원", "기획", "데이터", "보안"]
+MEETINGS = ["주간 업무 공유 및 이슈 점검 회의", "스프린트 회고 및 다음 스프린트 계획 회의", "월간 성과 지표 리뷰 회의"]
+SUBJECTS = ["신규 결제 시스템 도입", "사내 교육 프로그램 개편", "고객 이탈 원인 분석", "물류 센터 이전", "모바일 앱 리뉴얼",
+            "연말 행사 준비", "보안 감사 대응", "해외 시장 진출", "채용 절차 개선", "데이터 파이프라인 재구축"]
+GOALS = ["예산과 일정을 확정", "담당자와 역할을 정리", "위험 요소를 검토", "성공 지표를 정의", "대안을 비교해 결론을 도출"]
+
+
+def recurring_description(rng: random.Random) -> str:
+
+    """정기 회의 설명 (같은 팀/회의 종류에 회차와 표기만 달라짐)"""
+
+    team, meeting = rng.choice(TEAMS), rng.choice(MEETINGS)
+    description = f"{team}팀 {meeting}입니다. 지난주 진행 상황을 공유하고 이번 주 우선순위를 정합니다. ({rng.randint(1, 52)}주차)"
+    if rng.random() < 0.3:  # 표기만 다른 설명
+        description = description.replace(" ", "  ").replace(".", "!")
+    return description
+
+
+def new_description(rng: random.Random) -> str:
+
+    """새로운 회의 설명 (주제와 목표 조합이 매번 다른 일회성 회의)"""
+
+    subject, other = rng.sample(SUBJECTS, 2)
+    goals = rng.sample(GOALS, 2)
+    return f"{subject} 건으로 모입니다. {other}와의 관계를 고려해 {goals[0]}하고 {goals[1]}합니다."
+
+
+async def run(cache: Optional[AgendaResponseCache]) -> dict:
+
+    """REQUESTS개의 안건 생성 요청을 순서대로 보내고 결과 통계를 반환"""
+
+    rng = random.Random(0)  # 모든 구성에 같은 요청 순서 적용
+    fake = FakeGenaiClient(latency=LATENCY)
+    generator = AgendaGenerator(cache=cache)
+    generator.client.client = fake
+
+    latencies = []
+    for i in range(REQUESTS):
+        description = recurring_description(rng) if rng.random() < RECURRING_RATIO else new_description(rng)
+        start = time.perf_counter()
+        await generator.generate_agenda(description)
+        latencies.append(time.perf_counter() - start)
+
+    return {"calls": fake.generate_calls, "avg_ms": sum(latencies) / len(latencies) * 1000,
+            "stats": cache.stats() if cache else None}
+
+
+def closest_other_meeting() -> float:
+
+    """서로 다른 정기 회의(팀 또는 회의 종류가 다름) 설명 사이의 최대 유사도 (임계값이 이보다 커야 잘못된 재사용이 없음)"""
+
+    descriptions = [f"{team}팀 {meeting}입니다. 지난주 진행 상황을 공유하고 이번 주 우선순위를 정합니다. (1주차)"
+                    for team in TEAMS for meeting in MEETINGS]
+    grams = [AgendaResponseCache.ngrams(AgendaResponseCache.normalize(d)) for d in descriptions]
+    return max(len(a & b) / len(a | b) for i, a in enumerate(grams) for b in grams[i + 1:])
+
+
+def measure_lookup(maxsize: int) -> float:
+
+    """maxsize개의 서로 다른 설명이 저장된 캐시에서 미적중 조회 1회의 평균 시간(ms)"""
+
+    rng = random.Random(1)
+    cache = AgendaResponseCache(maxsize=maxsize, ttl=None)
+    for i in range(maxsize):
+        cache.set(f"{i}번 {new_description(rng)}", [{"step": 1, "topic": "안건"}])
+    start = time.perf_counter()
+    for i in range(100):
+        cache.get(f"완전히 다른 주제의 회의 설명 {i}입니다. 예산 집행 현황과 분기 목표를 점검합니다.")
+    return (time.perf_counter() - start) / 100 * 1000
+
+
+async def main():
+    print(f"요청 {REQUESTS}개 (정기 회의 {RECURRING_RATIO:.0%}), 안건 생성 응답 지연 {LATENCY * 1000:.0f}ms")
+    print(f"{'구성':<24} | {'Gemini 요청 수':>12} | {'평균 응답(ms)':>12} | 캐시 통계")
+    for label, cache in [
+        ("캐시 없음", None),
+        ("정확 일치만", AgendaResponseCache(similarity_threshold=1.0)),
+        ("정확 일치 + 유사(0.95)", AgendaResponseCache(similarity_threshold=0.95)),
+        ("정확 일치 + 유사(0.9)", AgendaResponseCache(similarity_threshold=0.9)),
+    ]:
+        r = await run(cache)
+        print(f"{label:<24} | {r['calls']:>12} | {r['avg_ms']:>12.1f} | {r['stats']}")
+
+    print(f"서로 다른 정기 회의 설명 사이의 최대 유사도: {closest_other_meeting():.3f}")
+    for maxsize in [100, 1000, 5000]:
+        print(f"캐시 {maxsize}개 항목에서 유사 설명 조회(미적중) 1회: {measure_lookup(maxsize):.2f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
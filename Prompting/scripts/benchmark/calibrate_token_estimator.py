@@ -0,0 +1,72 @@
+"""
+로컬 토큰 추정기(TokenEstimator) 보정 스크립트
+
+샘플 회의록(한국어)과 MBTI 설명/프롬프트 템플릿(영어)에 대해 실제 Gemini count_tokens 결과를 기록하고,
+멀티바이트/ASCII 문자 1개당 토큰 수를 최소제곱법으로 다시 구해 TokenEstimator 상수 및 safety margin 값을 제안
+
+실행: python -m Prompting.scripts.benchmark.calibrate_token_estimator  (프로젝트 루트, 실제 GEMINI_API_KEY 필요)
+"""
+import json
+import os
+
+from Prompting.services import GeminiClient
+from Prompting.services.token_estimator import TokenEstimator
+from Prompting.services.templates import SUMMARY_PROMPT_EN, AGENDA_PROMPT_KR, CHAT_PROMPT_KR
+
+base_dir = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_FILE_PATHS = [os.path.join(base_dir, f"../data/meeting_log_sample_{i}.json") for i in (1, 2)]
+MBTI_FILE_PATH = os.path.join(base_dir, "../../services/context_builders/mbti_type_instructions.json")
+
+
+def load_samples() -> list[str]:
+
+    """보정에 사용할 샘플 텍스트 목록 (한국어 회의 발언 묶음, 영어 MBTI 설명, 프롬프트 템플릿)"""
+
+    samples = [SUMMARY_PROMPT_EN, AGENDA_PROMPT_KR, CHAT_PROMPT_KR]
+    for path in SAMPLE_FILE_PATHS:
+        with open(path, 'r', encoding="utf-8") as f:
+            data = json.loads(f.read())
+        for content in data.get("contents", []):
+            samples.append('\n'.join(u.get("msg", '') for u in content.get("utterance", [])))
+
+    with open(MBTI_FILE_PATH, 'r', encoding="utf-8") as f:
+        for profile in json.loads(f.read()).values():
+            samples.extend(profile.values())
+    return samples
+
+
+def split_char_counts(text: str) -> tuple[int, int]:
+
+    """텍스트의 (멀티바이트 문자 수, ASCII 문자 수) 계산 (TokenEstimator.estimate()와 동일한 방식)"""
+
+    multibyte_cnt = (len(text.encode("utf-8")) - len(text)) // 2
+    return multibyte_cnt, len(text) - multibyte_cnt
+
+
+def main():
+    client = GeminiClient()
+    samples = [s for s in load_samples() if s.strip()]
+    actual = [client.count_tokens(s) for s in samples]  # 실제 Gemini 토큰 수 기록
+    counts = [split_char_counts(s) for s in samples]
+
+    # 절편 없는 2변수 선형 회귀 (정규방정식)
+    smm = sum(m * m for m, _ in counts)
+    saa = sum(a * a for _, a in counts)
+    sma = sum(m * a for m, a in counts)
+    smy = sum(m * y for (m, _), y in zip(counts, actual))
+    say = sum(a * y for (_, a), y in zip(counts, actual))
+    det = smm * saa - sma * sma
+    multibyte_coef = (smy * saa - say * sma) / det
+    ascii_coef = (say * smm - smy * sma) / det
+
+    estimator = TokenEstimator(multibyte_tokens_per_char=multibyte_coef, ascii_tokens_per_char=ascii_coef)
+    errors = [abs(estimator.estimate(s) - y) / y for s, y in zip(samples, actual)]
+
+    print(f"샘플 수: {len(samples)}, 실제 토큰 수 합계: {sum(actual)}")
+    print(f"MULTIBYTE_TOKENS_PER_CHAR = {multibyte_coef:.3f}")
+    print(f"ASCII_TOKENS_PER_CHAR = {ascii_coef:.3f}")
+    print(f"평균 상대 오차: {sum(errors) / len(errors):.3f}, 최대 상대 오차: {max(errors):.3f} (safety margin 설정 참고)")
+
+
+if __name__ == "__main__":
+    main()
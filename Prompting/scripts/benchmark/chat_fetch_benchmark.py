@@ -0,0 +1,144 @@
+"""
+채팅 내역 조회 벤치마크 (MongoDB 필요)
+
+안건 8개에 채팅 메세지가 1만/4만 개 쌓인 채팅방 문서를 벤치마크 전용 DB에 넣고,
+방 문서 전체를 받아 Python에서 검증/정렬하는 (개선 전) 조회 방식과
+필요한 안건 채팅만 projection해 MongoDB에서 정렬된 상태로 받는 ChatRepository aggregation 조회 방식의
+전송 바이트 수(응답 BSON 크기), 디코딩(BSON -> dict -> ChatMessage 검증, 정렬) 시간, 전체 조회 시간을 비교
+
+Note:
+    - MONGO_URI 환경 변수(.env)의 MongoDB 5.2 이상 서버 필요 ($sortArray)
+    - BENCHMARK_DB_NAME DB만 사용하며, 종료 시 벤치마크 콜렉션을 삭제
+
+실행: python -m Prompting.scripts.benchmark.chat_fetch_benchmark  (프로젝트 루트에서)
+"""
+import asyncio
+import json
+import statistics
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+import bson
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+
+from Prompting.models import RoomMessages
+from Prompting.repository import ChatRepository
+from Prompting.repository.mongo_client import CHAT_COLLECTION, create_client
+from Prompting.scripts.benchmark.fake_gemini import SAMPLE_JSON_FILE_PATH
+
+BENCHMARK_DB_NAME = "mindsync-benchmark"  # 벤치마크 전용 DB
+MESSAGE_COUNTS = [10_000, 40_000]  # 채팅방 1개의 전체 채팅 메세지 수 (문서 크기 16MB 제한 이내)
+AGENDA_COUNT = 8  # 채팅방의 안건 수
+TARGET_AGENDA_ID = "2"  # 안건 채팅 조회 대상 (MBTI 봇 채팅 생성 시 직전 안건 조회)
+REPEAT = 5  # 측정 반복 횟수 (중앙값 사용)
+
+
+def build_room_messages(room_id: str, message_count: int) -> dict:
+
+    """샘플 회의록 발언을 반복해 안건별로 고르게 나눈 채팅방 채팅 문서"""
+
+    with open(SAMPLE_JSON_FILE_PATH, 'r', encoding="utf-8") as f:
+        data = json.loads(f.read())
+    speakers = {s["id"]: s["name"] for s in data.get("speakers", [])}
+    utterances = [u for c in data.get("contents", []) for u in c.get("utterance", [])]
+
+    start = datetime(2025, 1, 1, 9, 0, 0)
+    messages = {str(aid): [] for aid in range(1, AGENDA_COUNT + 1)}
+    for i in range(message_count):
+        u = utterances[i % len(utterances)]
+        aid = str(i * AGENDA_COUNT // message_count + 1)
+        messages[aid].append({
+            "name": speakers.get(u["speaker_id"], ''),
+            "email": f"user{u['speaker_id'] + 1}@example.com",
+            "message": u["msg"],
+            "agendaId": aid,
+            "timestamp": start + timedelta(seconds=5 * i),
+        })
+    return {"_id": room_id, "messages": messages, "meta": {"version": "v1"}}
+
+
+def decode_legacy_room(raw: RawBSONDocument) -> OrderedDict:
+
+    """(개선 전) 방 문서 전체를 검증한 뒤 안건별 채팅을 Python에서 정렬"""
+
+    agenda_chat_map = RoomMessages(**bson.decode(raw.raw)).messages
+    for aid in agenda_chat_map:
+        agenda_chat_map[aid].sort(key=lambda chat: chat.timestamp)
+    return OrderedDict(sorted(agenda_chat_map.items(), key=lambda item: int(item[0])))
+
+
+def decode_legacy_agenda(raw: RawBSONDocument) -> dict:
+
+    """(개선 전) 방 문서 전체를 검증한 뒤 대상 안건 채팅만 Python에서 정렬"""
+
+    room_msgs = RoomMessages(**bson.decode(raw.raw))
+    return {TARGET_AGENDA_ID: sorted(room_msgs.messages[TARGET_AGENDA_ID], key=lambda chat: chat.timestamp)}
+
+
+def decode_room(raw: RawBSONDocument) -> OrderedDict:
+    agenda_chat_map = RoomMessages(**bson.decode(raw.raw)).messages
+    return OrderedDict(sorted(agenda_chat_map.items(), key=lambda item: int(item[0])))
+
+
+def decode_agenda(raw: RawBSONDocument) -> dict:
+    return RoomMessages(messages={TARGET_AGENDA_ID: bson.decode(raw.raw)["chats"]}).messages
+
+
+async def measure(fetch, decode) -> tuple[int, float, float]:
+
+    """(응답 BSON 바이트 수, 디코딩 시간 중앙값(ms), 전체 조회 시간 중앙값(ms))"""
+
+    size, decode_times, total_times = 0, [], []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        raw = await fetch()
+        fetched = time.perf_counter()
+        decode(raw)
+        end = time.perf_counter()
+
+        size = len(raw.raw)
+        decode_times.append((end - fetched) * 1000)
+        total_times.append((end - start) * 1000)
+    return size, statistics.median(decode_times), statistics.median(total_times)
+
+
+async def main():
+    client = create_client()
+    collection = client[BENCHMARK_DB_NAME][CHAT_COLLECTION]
+    raw_collection = collection.with_options(codec_options=CodecOptions(document_class=RawBSONDocument))
+    repo = ChatRepository()
+    repo.collection = collection
+
+    async def aggregate_raw(pipeline):
+        return (await raw_collection.aggregate(pipeline).to_list(length=1))[0]
+
+    try:
+        print(f"안건 수 {AGENDA_COUNT}, 안건 채팅 조회 대상 안건 {TARGET_AGENDA_ID}, 반복 {REPEAT}회 중앙값")
+        print(f"{'메세지 수':>9} | {'조회':<12} | {'방식':<11} | {'전송 바이트':>12} | {'디코딩(ms)':>10} | {'전체(ms)':>9}")
+        for n in MESSAGE_COUNTS:
+            room_id = f"BENCHMARK_ROOM_{n}"
+            await collection.replace_one({"_id": room_id}, build_room_messages(room_id, n), upsert=True)
+
+            cases = [
+                ("전체 채팅", "find_one", lambda: raw_collection.find_one({"_id": room_id}), decode_legacy_room),
+                ("전체 채팅", "aggregation", lambda: aggregate_raw(repo.room_pipeline(room_id)), decode_room),
+                ("안건 채팅", "find_one", lambda: raw_collection.find_one({"_id": room_id}), decode_legacy_agenda),
+                ("안건 채팅", "aggregation",
+                 lambda: aggregate_raw(repo.agenda_pipeline(room_id, TARGET_AGENDA_ID)), decode_agenda),
+            ]
+            for label, method, fetch, decode in cases:
+                size, decode_ms, total_ms = await measure(fetch, decode)
+                print(f"{n:>9} | {label:<12} | {method:<11} | {size:>12,} | {decode_ms:>10.1f} | {total_ms:>9.1f}")
+
+            # 조회 결과가 개선 전 방식과 같은지 확인
+            expected = decode_legacy_agenda(await raw_collection.find_one({"_id": room_id}))
+            assert await repo.get_chat_logs_by_agenda_id(room_id, TARGET_AGENDA_ID) == expected
+    finally:
+        await collection.drop()
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,75 @@
+"""
+MBTI 봇 채팅 스트리밍 생성 벤치마크
+
+로컬 가짜 Gemini 서버(응답을 조각 단위로 천천히 전송)를 상대로 실제 HTTP 전송 계층을 거쳐
+일반 생성(전체 응답 대기)과 스트리밍 생성의 체감 지연 시간(첫 텍스트까지의 시간)을 비교하고,
+스트리밍 중에도 이벤트 루프가 막히지 않는지(다른 작업의 지연) 확인
+
+실행: python -m Prompting.scripts.benchmark.chat_streaming_benchmark  (프로젝트 루트에서)
+"""
+import asyncio
+import os
+import time
+
+os.environ.setdefault("GEMINI_API_KEY", "FAKE_API_KEY")  # 실제 API를 호출하지 않으므로 임의 키 사용
+
+from Prompting.services import GeminiClient, MbtiChatGenerator
+from Prompting.schemas import ChatRequest, ChatResponse
+from Prompting.scripts.benchmark.fake_gemini import build_sample_context
+from Prompting.scripts.benchmark.fake_quota_server import FakeQuotaServer
+
+OUTPUT_TEXT = "저는 이 안건에 대해 조금 다른 생각을 가지고 있어요. " * 6  # 가짜 봇 채팅 응답
+CHUNK_SIZE = 20  # 스트리밍 응답 조각 1개의 글자 수
+CHUNK_LATENCY = 0.1  # 스트리밍 응답 조각 사이의 지연 시간(초)
+TICK = 0.01  # 이벤트 루프 지연 측정 간격(초)
+
+
+async def measure_loop_lag(stop: asyncio.Event) -> float:
+
+    """stop이 설정될 때까지 TICK 간격으로 잠들었다 깨어나며 관측한 최대 지연 시간(초)을 반환"""
+
+    max_lag = 0.0
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        max_lag = max(max_lag, time.perf_counter() - start - TICK)
+    return max_lag
+
+
+async def main():
+    server = FakeQuotaServer(rpm=1000, tpm=10_000_000, latency=0.2, output_text=OUTPUT_TEXT,
+                             chunk_size=CHUNK_SIZE, chunk_latency=CHUNK_LATENCY).start()
+    bot = MbtiChatGenerator(client=GeminiClient(base_url=server.base_url))
+    context = build_sample_context(message_count=50)
+    request = ChatRequest(roomId="BENCHMARK_ROOM", agendaId="2")
+
+    start = time.perf_counter()
+    response = await bot.generate_chat(meeting_context=context, request=request)
+    full_elapsed = time.perf_counter() - start
+
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(measure_loop_lag(stop))
+    start = time.perf_counter()
+    first_chunk_elapsed, chunk_cnt, final = None, 0, None
+    async for item in bot.generate_chat_stream(meeting_context=context, request=request):
+        if isinstance(item, ChatResponse):
+            final = item
+            continue
+        first_chunk_elapsed = first_chunk_elapsed or time.perf_counter() - start
+        chunk_cnt += 1
+    stream_elapsed = time.perf_counter() - start
+    stop.set()
+    max_lag = await lag_task
+
+    bot.client.close()
+    server.stop()
+
+    assert final is not None and final.message == response.message == OUTPUT_TEXT  # 최종 응답은 일반 생성과 동일
+    print(f"응답 {len(OUTPUT_TEXT)}자, 조각 {CHUNK_SIZE}자 / {CHUNK_LATENCY * 1000:.0f}ms 간격")
+    print(f"일반 생성  : 첫 텍스트까지 {full_elapsed * 1000:>7.1f}ms (전체 응답 대기)")
+    print(f"스트리밍   : 첫 텍스트까지 {first_chunk_elapsed * 1000:>7.1f}ms, 전체 {stream_elapsed * 1000:.1f}ms ({chunk_cnt}개 조각)")
+    print(f"스트리밍 중 이벤트 루프 최대 지연: {max_lag * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
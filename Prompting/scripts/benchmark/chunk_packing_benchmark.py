@@ -0,0 +1,84 @@
+"""
+회의 Context 분할 방식 벤치마크
+
+(개선 전) 안건 리스트를 재귀적으로 반씩 나누는 방식과 안건별 토큰 수를 한 번씩만 세어 greedy하게 묶는 방식의
+토큰 수 계산 호출 수, 토큰 수를 계산한 텍스트의 총 토큰 수, 생성된 Context 수(= Gemini 요약 호출 수), CPU 시간을 비교
+
+Note:
+    - greedy 방식은 안건 block마다 1회 + 완성된 Context마다 검증 1회로 호출 수는 더 많지만(동시 호출),
+      재귀 방식은 분할 단계마다 전체 텍스트를 다시 세므로 계산하는 총 토큰 수는 greedy 방식이 더 적음
+
+실행: python -m Prompting.scripts.benchmark.chunk_packing_benchmark  (프로젝트 루트에서)
+"""
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+from Prompting.exceptions.errors import PromptBuildError
+from Prompting.services.context_builders import MeetingHistoryBuilder
+from Prompting.scripts.benchmark.fake_gemini import FakeGenaiClient, build_sample_context
+
+# (메세지 수, 안건 수, Context 할당 토큰 수)
+SCENARIOS = [
+    (10_000, 16, 140_000),
+    (100_000, 16, 1_000_000),
+    (100_000, 16, 1_850_000),
+    (100_000, 64, 300_000),
+]
+
+
+async def split_recursively(topic: str, target: list[str],
+                            count_tokens_callback: Callable[[str], Awaitable[int]], token_alloc: int) -> list[str]:
+
+    """(개선 전) 재귀적으로 반씩 분할하며 매 단계마다 전체 부분 문자열을 다시 이어 붙여 토큰 수를 계산하는 방식"""
+
+    input_string = topic + '\n'.join(target)
+    if await count_tokens_callback(input_string) > token_alloc:
+        if len(target) == 1:
+            raise PromptBuildError()
+        mid = len(target) // 2
+        left = await split_recursively(topic, target[:mid], count_tokens_callback, token_alloc)
+        right = await split_recursively(topic, target[mid:], count_tokens_callback, token_alloc)
+        return left + right
+    return [input_string]
+
+
+async def measure(history_builder: MeetingHistoryBuilder, token_alloc: int,
+                  greedy: bool) -> tuple[float, int, int, int]:
+
+    """CPU 시간(초), 토큰 수 계산 호출 수, 토큰 수를 계산한 텍스트의 총 토큰 수, 생성된 Context 수를 반환"""
+
+    calls, counted_tokens = 0, 0
+
+    async def count_tokens(text: str) -> int:
+        nonlocal calls, counted_tokens
+        calls += 1
+        tokens = FakeGenaiClient.estimate_tokens(text)
+        counted_tokens += tokens
+        return tokens
+
+    start = time.process_time()
+    if greedy:
+        chunks = await history_builder.build_prompt_chunks(count_tokens_callback=count_tokens, token_alloc=token_alloc)
+    else:
+        topic_str = f"회의 주제: {history_builder.topic}\n"
+        blocks = history_builder._get_context_string_list()
+        chunks = await split_recursively(topic_str, blocks, count_tokens, token_alloc)
+    return time.process_time() - start, calls, counted_tokens, len(chunks)
+
+
+async def main():
+    print(f"{'메세지 수':>9} {'안건 수':>6} {'할당 토큰':>10} | "
+          f"{'recursive cpu(s)':>16} {'counts':>6} {'counted tok':>11} {'chunks':>6} | "
+          f"{'greedy cpu(s)':>13} {'counts':>6} {'counted tok':>11} {'chunks':>6}")
+    for message_count, agenda_count, token_alloc in SCENARIOS:
+        history_builder = MeetingHistoryBuilder(build_sample_context(message_count, agenda_count))
+        recursive = await measure(history_builder, token_alloc, greedy=False)
+        greedy = await measure(history_builder, token_alloc, greedy=True)
+        print(f"{message_count:>9} {agenda_count:>6} {token_alloc:>10} | "
+              f"{recursive[0]:>16.3f} {recursive[1]:>6} {recursive[2]:>11,} {recursive[3]:>6} | "
+              f"{greedy[0]:>13.3f} {greedy[1]:>6} {greedy[2]:>11,} {greedy[3]:>6}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,56 @@
+"""
+Gemini 호출 동시성 벤치마크
+
+N개의 요청을 동시에 처리할 때, 이벤트 루프를 막는 (개선 전) 호출 방식과
+비동기 클라이언트 기반 호출 방식의 전체 소요 시간을 비교
+
+실행: python -m Prompting.scripts.benchmark.concurrency_benchmark  (프로젝트 루트에서)
+"""
+import asyncio
+import os
+import time
+
+os.environ.setdefault("GEMINI_API_KEY", "FAKE_API_KEY")  # 실제 API를 호출하지 않으므로 임의 키 사용
+
+from Prompting.services import AgendaGenerator, MeetingSummarizer, MbtiChatGenerator
+from Prompting.schemas import ChatRequest
+from Prompting.scripts.benchmark.fake_gemini import FakeGenaiClient, build_sample_context
+
+CALL_LATENCY = 0.5  # Gemini 호출 1회의 가짜 응답 지연 시간(초)
+PARALLEL_REQUESTS = [1, 4, 16]  # 동시 요청 수
+
+
+async def run_endpoints(n: int, blocking: bool) -> float:
+
+    """세 엔드포인트의 서비스 호출을 각각 n개씩 동시에 실행하고 소요 시간(초)을 반환"""
+
+    fake = FakeGenaiClient(latency=CALL_LATENCY, blocking=blocking)
+    agenda_service, summarizer, bot = AgendaGenerator(), MeetingSummarizer(), MbtiChatGenerator()
+    for service in (agenda_service, summarizer, bot):
+        service.client.client = fake
+
+    context = build_sample_context(message_count=200)
+    request = ChatRequest(roomId="BENCHMARK_ROOM", agendaId="2")
+
+    tasks = []
+    for _ in range(n):
+        tasks.append(agenda_service.generate_agenda(topic_request="주간 업무 공유 회의"))
+        tasks.append(summarizer.generate_summary(context))
+        tasks.append(bot.generate_chat(meeting_context=context, request=request))
+
+    start = time.perf_counter()
+    await asyncio.gather(*tasks)
+    return time.perf_counter() - start
+
+
+async def main():
+    print(f"Gemini 호출 1회 지연 시간: {CALL_LATENCY:.2f}s (엔드포인트 3종 x 동시 요청 수)")
+    print(f"{'동시 요청 수':>10} | {'blocking(s)':>12} | {'async(s)':>10}")
+    for n in PARALLEL_REQUESTS:
+        blocking_elapsed = await run_endpoints(n, blocking=True)
+        async_elapsed = await run_endpoints(n, blocking=False)
+        print(f"{n * 3:>10} | {blocking_elapsed:>12.2f} | {async_elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
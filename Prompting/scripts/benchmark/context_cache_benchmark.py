@@ -0,0 +1,101 @@
+"""
+정적 프롬프트 prefix의 context cache 벤치마크
+
+cached content 생성/연장/사용을 기록하는 가짜 Gemini 클라이언트를 상대로 여러 MBTI 유형의 봇 채팅과 회의 요약을 생성하고,
+context cache 미사용/사용 시 요청마다 전송한 입력 토큰 수와 cached content에서 읽은 토큰 수, 캐시 생성/연장 횟수를 비교.
+짧은 TTL로 만료 전 자동 연장과 제공자 측 만료(404) 후 재생성, 최소 캐시 크기 미달 시 캐시 없이 처리하는 경로도 확인
+
+실행: python -m Prompting.scripts.benchmark.context_cache_benchmark  (프로젝트 루트에서)
+"""
+import asyncio
+import os
+from typing import Optional
+
+os.environ.setdefault("GEMINI_API_KEY", "FAKE_API_KEY")  # 실제 API를 호출하지 않으므로 임의 키 사용
+
+from Prompting.common.config import GEMINI_CONTEXT_CACHE_MIN_TOKENS
+from Prompting.services import GeminiClient, MbtiChatGenerator, MeetingSummarizer
+from Prompting.services.context_cache import ContextCacheManager
+from Prompting.services.token_estimator import TokenEstimator
+from Prompting.schemas import ChatRequest
+from Prompting.usecases.meeting_context import UserInfo
+from Prompting.scripts.benchmark.fake_gemini import FakeGenaiClient, build_sample_context
+
+LATENCY = 0.01  # 생성 요청 1회의 응답 지연 시간(초)
+MBTI_TYPES = ["ENFP", "INTJ", "ISTP", "ESFJ"]  # 채팅을 생성할 봇의 MBTI 유형
+CHATS_PER_TYPE = 25  # MBTI 유형별 채팅 생성 요청 수
+SUMMARY_REQUESTS = 20  # 회의 요약 요청 수
+TTL_SECONDS = 2  # 만료/연장 확인용 짧은 TTL(초)
+REFRESH_MARGIN_SECONDS = 1  # 만료 몇 초 전부터 TTL을 연장할지
+ROUNDS = 4  # 요청 묶음 반복 횟수 (묶음 사이 ROUND_INTERVAL초 대기)
+ROUND_INTERVAL = 0.7
+
+
+async def run(context_cache: Optional[ContextCacheManager], cache_min_tokens: int = 0,
+              expire_before_last_round: bool = False) -> FakeGenaiClient:
+
+    """ROUNDS번에 걸쳐 MBTI 유형별 채팅과 회의 요약을 생성하고 가짜 클라이언트(사용 기록 포함)를 반환"""
+
+    client = GeminiClient(context_cache=context_cache)
+    fake = FakeGenaiClient(latency=LATENCY, cache_min_tokens=cache_min_tokens)
+    client.client = fake
+    bot = MbtiChatGenerator(client=client)
+    summarizer = MeetingSummarizer(client=client)
+
+    contexts = {}
+    for mbti in MBTI_TYPES:
+        context = build_sample_context(message_count=50)
+        context.participants[-1] = UserInfo(email=f"{mbti.lower()}@ai.com", name=mbti, mbti=mbti)
+        contexts[mbti] = context
+    summary_context = build_sample_context(message_count=200)
+    request = ChatRequest(roomId="BENCHMARK_ROOM", agendaId="2")
+
+    for i in range(ROUNDS):
+        if i:
+            await asyncio.sleep(ROUND_INTERVAL)
+        if expire_before_last_round and i == ROUNDS - 1:
+            fake.expire_all_caches()
+        await asyncio.gather(
+            *[bot.generate_chat(contexts[mbti], request)
+              for mbti in MBTI_TYPES for _ in range(CHATS_PER_TYPE // ROUNDS)],
+            *[summarizer.summarize_agendas(summary_context) for _ in range(SUMMARY_REQUESTS // ROUNDS)],
+        )
+    client.close()
+    return fake
+
+
+def new_manager(min_tokens: int = 0) -> ContextCacheManager:
+    return ContextCacheManager(token_counter=TokenEstimator().estimate, ttl_seconds=TTL_SECONDS,
+                               min_tokens=min_tokens, refresh_margin_seconds=REFRESH_MARGIN_SECONDS)
+
+
+def report(label: str, fake: FakeGenaiClient, manager: Optional[ContextCacheManager]):
+    sent = fake.input_tokens
+    print(f"{label:<28} | {fake.generate_calls:>6} | {sent:>14,} | {fake.cached_input_tokens:>14,} | "
+          f"{fake.cache_creates:>4} | {fake.cache_updates:>4} | {manager.stats() if manager else '-'}")
+
+
+async def main():
+    estimator = TokenEstimator()
+    bot, summarizer = MbtiChatGenerator(client=GeminiClient()), MeetingSummarizer(client=GeminiClient())
+    prefix_tokens = {mbti: estimator.estimate(bot._get_trait_prefix(mbti).text) for mbti in MBTI_TYPES}
+    prefix_tokens["summary"] = estimator.estimate(summarizer.prefix.text)
+    print(f"정적 prefix 추정 토큰 수: {prefix_tokens} (기본 최소 캐시 크기 {GEMINI_CONTEXT_CACHE_MIN_TOKENS})")
+    print(f"요청: MBTI {len(MBTI_TYPES)}개 유형 x 채팅 {CHATS_PER_TYPE}건 + 요약 {SUMMARY_REQUESTS}건, "
+          f"{ROUNDS}회 나누어 {ROUND_INTERVAL}s 간격 전송, 캐시 TTL {TTL_SECONDS}s")
+    print(f"{'구성':<28} | {'요청 수':>6} | {'전송 입력 토큰':>14} | {'캐시 입력 토큰':>14} | {'생성':>4} | {'연장':>4} | 관리자 통계")
+
+    report("context cache 미사용", await run(None), None)
+
+    manager = new_manager()
+    report("context cache 사용", await run(manager), manager)
+
+    manager = new_manager()
+    report("사용 + 마지막 묶음 전 만료", await run(manager, expire_before_last_round=True), manager)
+
+    manager = new_manager(min_tokens=GEMINI_CONTEXT_CACHE_MIN_TOKENS)
+    report(f"사용 + 최소 {GEMINI_CONTEXT_CACHE_MIN_TOKENS}토큰", await run(manager), manager)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
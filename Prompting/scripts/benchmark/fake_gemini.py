@@ -0,0 +1,292 @@
+"""
+벤치마크 스크립트에서 공통으로 사용하는 가짜 Gemini SDK 클라이언트 및 샘플 회의 데이터 생성 유틸
+
+- 실제 API 키나 네트워크 없이 GeminiClient의 동작(동시성, 호출 횟수, 지연 시간)을 측정하기 위한 용도
+- GeminiClient.client 속성을 FakeGenaiClient로 교체해 사용
+"""
+import asyncio
+import json
+import os
+import random
+import re
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Optional
+
+from google.genai import errors
+
+from Prompting.common import AgendaStatus
+from Prompting.models import AgendaItemModel
+from Prompting.usecases.meeting_context import MeetingContext, UserInfo, ChatLog
+
+base_dir = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_JSON_FILE_PATH = os.path.join(base_dir, "../data/meeting_log_sample_1.json")  # 샘플 회의록 경로
+AGENDA_TITLE_REGEX = r"안건 (\d+)\. (.*)"   # 회의 Context 문자열에서 안건 제목 추출 패턴
+PARTIAL_SUMMARIES_MARKER = "Partial Summaries:"   # 부분 요약 병합 프롬프트에서 부분 요약 JSON 시작 위치 표시
+BATCH_TEXT_REGEX = r"^\[(\d+)\] "   # 배치 안건 생성 프롬프트에서 회의 설명 번호 추출 패턴
+
+
+class _FakeModels:
+    def __init__(self, owner: "FakeGenaiClient"):
+        self.owner = owner
+
+    def generate_content(self, model: str, contents: str, config=None):
+        response, latency = self.owner.build_response(model, contents, config)
+        time.sleep(latency)  # 동기 SDK 호출처럼 현재 스레드를 점유
+        return response
+
+    def count_tokens(self, model: str, contents: str):
+        self.owner.count_calls += 1
+        time.sleep(self.owner.count_latency)
+        return SimpleNamespace(total_tokens=self.owner.estimate_tokens(contents))
+
+
+class _FakeAsyncModels:
+    def __init__(self, owner: "FakeGenaiClient"):
+        self.owner = owner
+
+    async def generate_content(self, model: str, contents: str, config=None):
+        response, latency = self.owner.build_response(model, contents, config)
+        if self.owner.blocking:
+            time.sleep(latency)  # 이벤트 루프를 막는 (개선 전) 호출 방식 재현
+        else:
+            await asyncio.sleep(latency)
+        return response
+
+    async def generate_content_stream(self, model: str, contents: str, config=None):
+        response, latency = self.owner.build_response(model, contents, config)
+        pieces = self.owner.split_text(response.text)
+        base_latency = latency - self.owner.estimate_tokens(response.text) * self.owner.per_output_token_latency
+
+        async def stream():
+            for i, piece in enumerate(pieces):  # 첫 조각은 기본 지연 시간 후, 이후 조각은 출력 토큰 생성 시간마다 전송
+                await asyncio.sleep((0 if i else base_latency)
+                                    + self.owner.estimate_tokens(piece) * self.owner.per_output_token_latency)
+                yield SimpleNamespace(text=piece, usage_metadata=None)
+        return stream()
+
+    async def count_tokens(self, model: str, contents: str):
+        self.owner.count_calls += 1
+        await asyncio.sleep(self.owner.count_latency)
+        return SimpleNamespace(total_tokens=self.owner.estimate_tokens(contents))
+
+
+class _FakeAsyncCaches:
+    def __init__(self, owner: "FakeGenaiClient"):
+        self.owner = owner
+
+    async def create(self, model: str, config=None):
+        text = config.system_instruction
+        tokens = self.owner.estimate_tokens(text)
+        if tokens < self.owner.cache_min_tokens:  # 제공자 최소 캐시 크기 미달
+            raise api_error(400, "Cached content is too small.", "INVALID_ARGUMENT")
+
+        self.owner.cache_creates += 1
+        name = f"cachedContents/fake-{self.owner.cache_creates}"
+        self.owner.cached_contents[name] = {"tokens": tokens, "expires_at": time.time() + parse_ttl(config.ttl)}
+        return self._to_cached_content(name)
+
+    async def update(self, name: str, config=None):
+        entry = self.owner.live_cached_content(name)
+        if entry is None:
+            raise api_error(404, "CachedContent not found.", "NOT_FOUND")
+        self.owner.cache_updates += 1
+        entry["expires_at"] = time.time() + parse_ttl(config.ttl)
+        return self._to_cached_content(name)
+
+    def _to_cached_content(self, name: str):
+        expires_at = self.owner.cached_contents[name]["expires_at"]
+        return SimpleNamespace(name=name, expire_time=datetime.fromtimestamp(expires_at, tz=timezone.utc))
+
+
+def api_error(code: int, message: str, status: str) -> errors.APIError:
+
+    """Gemini API 오류 응답과 같은 형태의 예외 (4xx: ClientError, 5xx: ServerError)"""
+
+    response = SimpleNamespace(body_segments=[{"error": {"code": code, "message": message, "status": status}}])
+    return errors.ClientError(code, response) if code < 500 else errors.ServerError(code, response)
+
+
+def parse_ttl(ttl: str) -> float:
+
+    """cached content TTL 문자열("3600s")을 초 단위로 변환"""
+
+    return float(ttl.rstrip('s'))
+
+
+class FakeGenaiClient:
+    STREAM_CHUNK_SIZE = 40  # 스트리밍 응답 조각 1개의 글자 수
+
+    def __init__(self, latency: float = 1.0, per_output_token_latency: float = 0.0,
+                 count_latency: float = 0.0, blocking: bool = False, statements_per_summary: int = 2,
+                 slow_probability: float = 0.0, slow_latency: float = 0.0, batch_error_rate: float = 0.0,
+                 model_latency_factor: Optional[dict[str, float]] = None, cache_min_tokens: int = 0,
+                 record_prompts: bool = False):
+        """
+        google.genai.Client의 models / aio.models 인터페이스를 흉내 내는 가짜 클라이언트
+
+        Args:
+            latency: 생성 요청 1회의 기본 응답 지연 시간(초)
+            per_output_token_latency: 출력 토큰 1개당 추가 지연 시간(초)
+            count_latency: 토큰 수 계산 요청 1회의 응답 지연 시간(초)
+            blocking: True면 비동기 호출도 time.sleep으로 이벤트 루프를 점유
+            statements_per_summary: 가짜 안건 요약 1개에 담을 주요 발언 수 (요약 응답의 출력 토큰 수 조절)
+            slow_probability: 생성 요청이 느린 응답(tail latency)이 될 확률
+            slow_latency: 느린 응답일 때의 기본 응답 지연 시간(초, latency 대신 사용)
+            batch_error_rate: 배치 안건 생성 응답에서 마지막 회의의 안건이 누락될 확률
+            model_latency_factor: 모델 이름별 응답 지연 시간 배율 (미지정 모델은 1)
+            cache_min_tokens: cached content 생성에 필요한 최소 토큰 수 (미만이면 400 응답)
+            record_prompts: True면 생성 요청의 프롬프트를 sent_prompts에 기록
+        """
+        self.latency = latency
+        self.per_output_token_latency = per_output_token_latency
+        self.count_latency = count_latency
+        self.blocking = blocking
+        self.statements_per_summary = statements_per_summary
+        self.slow_probability = slow_probability
+        self.slow_latency = slow_latency
+        self.batch_error_rate = batch_error_rate
+        self.model_latency_factor = model_latency_factor or {}
+        self.cache_min_tokens = cache_min_tokens
+        self.record_prompts = record_prompts
+
+        self.generate_calls = 0  # 생성 요청 횟수
+        self.count_calls = 0  # 토큰 수 계산 요청 횟수
+        self.input_tokens = 0  # 생성 요청의 입력 토큰 수 합계
+        self.calls_by_model: Counter = Counter()  # 모델별 생성 요청 횟수
+        self.input_tokens_by_model: Counter = Counter()  # 모델별 생성 요청 입력 토큰 수 합계
+        self.cached_contents: dict[str, dict] = {}  # cached content 이름 -> {"tokens": 토큰 수, "expires_at": 만료 시각}
+        self.cache_creates = 0  # cached content 생성 횟수
+        self.cache_updates = 0  # cached content TTL 연장 횟수
+        self.cached_requests = 0  # cached content를 사용한 생성 요청 수
+        self.cached_input_tokens = 0  # cached content에서 읽은 입력 토큰 수 합계
+        self.sent_prompts: list[str] = []  # 생성 요청 프롬프트 (record_prompts=True일 때, 요청 순서)
+
+        self.models = _FakeModels(self)
+        self.aio = SimpleNamespace(models=_FakeAsyncModels(self), caches=_FakeAsyncCaches(self))
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+
+        """가짜 토큰 수 (한글 1자 = 1토큰, 그 외 4자 = 1토큰)"""
+
+        hangul = len(re.findall(r"[가-힣]", text))
+        return hangul + (len(text) - hangul) // 4 + 1
+
+    def split_text(self, text: str) -> list[str]:
+
+        """스트리밍 응답 조각 목록 (STREAM_CHUNK_SIZE자 단위)"""
+
+        return [text[i:i + self.STREAM_CHUNK_SIZE] for i in range(0, len(text), self.STREAM_CHUNK_SIZE)]
+
+    def live_cached_content(self, name: str) -> Optional[dict]:
+
+        """만료되지 않은 cached content 정보 (없거나 만료되었으면 None)"""
+
+        entry = self.cached_contents.get(name)
+        return entry if entry and entry["expires_at"] > time.time() else None
+
+    def expire_all_caches(self):
+
+        """모든 cached content를 만료 처리 (제공자 측 삭제/만료 재현)"""
+
+        self.cached_contents.clear()
+
+    def build_response(self, model: str, contents: str, config=None) -> tuple[SimpleNamespace, float]:
+
+        """요청 프롬프트와 응답 schema에 맞는 가짜 응답 객체와 응답 지연 시간을 생성"""
+
+        cache_name = getattr(config, "cached_content", None)
+        if cache_name:
+            entry = self.live_cached_content(cache_name)
+            if entry is None:
+                raise api_error(404, "CachedContent not found (or permission denied).", "NOT_FOUND")
+            self.cached_requests += 1
+            self.cached_input_tokens += entry["tokens"]
+
+        input_tokens = self.estimate_tokens(contents)
+        self.generate_calls += 1
+        self.input_tokens += input_tokens
+        self.calls_by_model[model] += 1
+        self.input_tokens_by_model[model] += input_tokens
+        if self.record_prompts:
+            self.sent_prompts.append(contents)
+        schema = getattr(config, "response_schema", None) or {}
+        properties = schema.get("items", {}).get("properties", {}) if isinstance(schema, dict) else {}
+
+        if "sub_topic" in properties and PARTIAL_SUMMARIES_MARKER in contents:  # 부분 요약 병합 요청
+            partials = json.loads(contents.split(PARTIAL_SUMMARIES_MARKER, 1)[1])
+            parsed = [{**partials[0], "conclusion": f"{len(partials)}개 부분 요약을 병합한 가짜 결론입니다."}]
+        elif "sub_topic" in properties:  # 회의 요약 요청
+            parsed = [
+                {
+                    "step": int(step),
+                    "sub_topic": title.strip(),
+                    "key_statements": '\n'.join(
+                        f"참여자{i}: 가짜 요약 발언입니다." for i in range(1, self.statements_per_summary + 1)
+                    ),
+                    "conclusion": "가짜 결론입니다."
+                }
+                for step, title in dict(re.findall(AGENDA_TITLE_REGEX, contents)).items()
+            ]
+        elif "agendas" in properties:  # 배치 안건 생성 요청
+            indices = [int(i) for i in re.findall(BATCH_TEXT_REGEX, contents, flags=re.MULTILINE)]
+            if random.random() < self.batch_error_rate:
+                indices = indices[:-1]
+            parsed = [{"index": i, "agendas": [{"step": s, "topic": f"가짜 안건 {i}-{s}"} for s in range(1, 4)]}
+                      for i in indices]
+        elif "topic" in properties:  # 안건 생성 요청
+            parsed = [{"step": i, "topic": f"가짜 안건 {i}"} for i in range(1, 4)]
+        else:  # 일반 텍스트 요청
+            parsed = None
+
+        text = json.dumps(parsed, ensure_ascii=False) if parsed is not None else "가짜 봇 채팅 메세지입니다."
+        base_latency = self.slow_latency if random.random() < self.slow_probability else self.latency
+        latency = base_latency + self.estimate_tokens(text) * self.per_output_token_latency
+        latency *= self.model_latency_factor.get(model, 1.0)
+        return SimpleNamespace(text=text, parsed=parsed), latency
+
+
+def build_sample_context(message_count: int, agenda_count: Optional[int] = None,
+                         sample_json_file_path: str = SAMPLE_JSON_FILE_PATH) -> MeetingContext:
+    """
+    샘플 회의록 JSON의 발언을 반복해 원하는 메세지 수를 가진 MeetingContext를 생성
+
+    Args:
+        message_count: 생성할 전체 채팅 메세지 수
+        agenda_count: 안건 수 (미지정 시 샘플 회의록의 안건 수)
+        sample_json_file_path: 샘플 회의록 JSON 파일 경로 (미지정 시 meeting_log_sample_1.json)
+
+    Returns:
+        벤치마크용 MeetingContext
+    """
+    with open(sample_json_file_path, 'r', encoding="utf-8") as f:
+        data = json.loads(f.read())
+
+    speakers = data.get("speakers", [])
+    participants = [UserInfo(email=f"user{s['id'] + 1}@example.com", name=s["name"], mbti="ISTJ") for s in speakers]
+    participants.append(UserInfo(email="enfp@ai.com", name="ENFP", mbti="ENFP"))
+    host = next(f"user{s['id'] + 1}@example.com" for s in speakers if s.get("isModerator"))
+
+    utterances = [u for c in data.get("contents", []) for u in c.get("utterance", [])]
+    agenda_count = agenda_count or len(data.get("contents", []))
+
+    agendas = {
+        str(i): AgendaItemModel(title=f"샘플 안건 {i}", status=AgendaStatus.COMPLETE)
+        for i in range(1, agenda_count + 1)
+    }
+    chats = {aid: [] for aid in agendas}
+    for i in range(message_count):
+        u = utterances[i % len(utterances)]
+        aid = str(i * agenda_count // message_count + 1)  # 안건별로 메세지를 고르게 배분
+        chats[aid].append(ChatLog(sender=f"user{u['speaker_id'] + 1}@example.com", message=u["msg"], agenda_id=aid))
+
+    return MeetingContext(
+        topic=data.get("topic", ''),
+        agendas=agendas,
+        host=host,
+        participants=participants,
+        chats=chats
+    )
@@ -0,0 +1,169 @@
+"""
+요청 수/토큰 수 할당량을 강제하는 로컬 가짜 Gemini API 서버
+
+- generateContent 요청을 받아 period초 동안의 요청 수(rpm)와 토큰 수(tpm)가 할당량을 넘으면 429(RESOURCE_EXHAUSTED) 응답
+- error_rate 비율로 503 응답을 섞어 5xx 재시도 동작도 확인 가능
+- streamGenerateContent 요청은 응답 텍스트를 조각으로 나누어 chunk_latency 간격으로 SSE 스트림 전송
+- GeminiClient(base_url=server.base_url)로 실제 HTTP 전송 계층을 거쳐 호출
+"""
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+GENERATE_PATH_REGEX = r"/v1beta/models/([^/:]+):(generateContent|streamGenerateContent)"
+
+
+class _QuotaHTTPServer(ThreadingHTTPServer):
+    request_queue_size = 256  # 동시 연결 요청이 몰려도 연결이 거부되지 않도록 backlog 확대
+    daemon_threads = True
+
+
+class FakeQuotaServer:
+    def __init__(self, rpm: int, tpm: int, period: float = 60.0, latency: float = 0.05, error_rate: float = 0.0,
+                 output_text: str = "가짜 응답입니다.", chunk_size: int = 10, chunk_latency: float = 0.0):
+        """
+        Args:
+            rpm: period초 동안 허용하는 최대 요청 수
+            tpm: period초 동안 허용하는 최대 토큰 수 (입력 + 출력)
+            period: 할당량 기준 시간(초)
+            latency: 정상 응답 지연 시간(초)
+            error_rate: 할당량과 무관하게 503 응답을 반환할 비율
+            output_text: 생성 응답 텍스트
+            chunk_size: 스트리밍 응답 조각 1개의 글자 수
+            chunk_latency: 스트리밍 응답 조각 사이의 지연 시간(초)
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self.period = period
+        self.latency = latency
+        self.error_rate = error_rate
+        self.output_text = output_text
+        self.chunk_size = chunk_size
+        self.chunk_latency = chunk_latency
+
+        self._window: deque[tuple[float, int]] = deque()  # (요청 시각, 사용 토큰 수)
+        self._lock = threading.Lock()
+        self.accepted = 0
+        self.rejected = 0  # 429 응답 수
+        self.failed = 0  # 503 응답 수
+
+        self._server = _QuotaHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "FakeQuotaServer":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+
+        """가짜 토큰 수 (4자 = 1토큰)"""
+
+        return len(text) // 4 + 1
+
+    def split_output(self, text: str) -> list[str]:
+
+        """스트리밍 응답 조각 목록 (chunk_size자 단위)"""
+
+        return [text[i:i + self.chunk_size] for i in range(0, len(text), self.chunk_size)]
+
+    def admit(self, tokens: int) -> bool:
+
+        """sliding window 기준으로 요청 1회와 tokens개의 토큰을 허용할 수 있으면 기록하고 True 반환"""
+
+        with self._lock:
+            now = time.monotonic()
+            while self._window and now - self._window[0][0] >= self.period:
+                self._window.popleft()
+            used_tokens = sum(t for _, t in self._window)
+            if len(self._window) >= self.rpm or used_tokens + tokens > self.tpm:
+                self.rejected += 1
+                return False
+            self._window.append((now, tokens))
+            self.accepted += 1
+            return True
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive 연결 유지
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                match = re.fullmatch(GENERATE_PATH_REGEX, self.path.split("?")[0])
+                if not match:
+                    return self._send(404, {"error": {"code": 404, "message": "Not found", "status": "NOT_FOUND"}})
+
+                if random.random() < server.error_rate:
+                    server.failed += 1
+                    return self._send(503, {"error": {"code": 503, "message": "Overloaded", "status": "UNAVAILABLE"}})
+
+                prompt = ''.join(p.get("text", '') for c in body.get("contents", []) for p in c.get("parts", []))
+                prompt_tokens = server.estimate_tokens(prompt)
+                output_text = server.output_text
+                output_tokens = server.estimate_tokens(output_text)
+                if not server.admit(prompt_tokens + output_tokens):
+                    return self._send(429, {"error": {
+                        "code": 429, "message": "Resource has been exhausted (e.g. check quota).",
+                        "status": "RESOURCE_EXHAUSTED"
+                    }})
+
+                time.sleep(server.latency)
+                usage = {
+                    "promptTokenCount": prompt_tokens,
+                    "candidatesTokenCount": output_tokens,
+                    "totalTokenCount": prompt_tokens + output_tokens
+                }
+                if match.group(2) == "streamGenerateContent":
+                    return self._send_stream(output_text, usage)
+                time.sleep(server.chunk_latency * (len(server.split_output(output_text)) - 1))  # 전체 생성 시간
+                self._send(200, {
+                    "candidates": [{"content": {"parts": [{"text": output_text}], "role": "model"}, "finishReason": "STOP"}],
+                    "usageMetadata": usage
+                })
+
+            def _send_stream(self, output_text: str, usage: dict):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")  # 실제 API와 같이 조각마다 chunk로 전송
+                self.end_headers()
+
+                pieces = server.split_output(output_text)
+                for i, piece in enumerate(pieces):
+                    if i:
+                        time.sleep(server.chunk_latency)
+                    chunk = {"candidates": [{"content": {"parts": [{"text": piece}], "role": "model"}}]}
+                    if i == len(pieces) - 1:
+                        chunk["candidates"][0]["finishReason"] = "STOP"
+                        chunk["usageMetadata"] = usage
+                    data = f"data: {json.dumps(chunk, ensure_ascii=False)}\r\n\r\n".encode("utf-8")
+                    self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+                    self.wfile.flush()
+                self.wfile.write(b"0\r\n\r\n")
+
+            def _send(self, status: int, payload: dict):
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):  # 요청 로그 출력 생략
+                pass
+
+        return Handler
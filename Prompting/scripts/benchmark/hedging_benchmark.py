@@ -0,0 +1,74 @@
+"""
+MBTI 봇 채팅 hedged request 벤치마크
+
+가끔 매우 느린 응답(tail latency)을 내는 가짜 Gemini 클라이언트로 MBTI 봇 채팅을 반복 생성하고,
+hedge 미적용/적용 시의 응답 지연 시간 분포(p50/p95/p99)와 추가 요청 비율을 비교
+
+실행: python -m Prompting.scripts.benchmark.hedging_benchmark  (프로젝트 루트에서)
+"""
+import asyncio
+import os
+import random
+import statistics
+import time
+from typing import Optional
+
+os.environ.setdefault("GEMINI_API_KEY", "FAKE_API_KEY")  # 실제 API를 호출하지 않으므로 임의 키 사용
+
+from Prompting.services import MbtiChatGenerator
+from Prompting.services.hedging import HedgingPolicy
+from Prompting.schemas import ChatRequest
+from Prompting.scripts.benchmark.fake_gemini import FakeGenaiClient, build_sample_context
+
+LATENCY = 0.05  # 일반 응답 지연 시간(초)
+SLOW_PROBABILITY = 0.03  # 느린 응답 확률
+SLOW_LATENCY = 1.0  # 느린 응답 지연 시간(초)
+REQUESTS = 600  # 전체 채팅 생성 요청 수
+CONCURRENCY = 10  # 동시에 처리할 요청 수
+
+
+def percentile(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+
+async def run(policy: Optional[HedgingPolicy]) -> tuple[list[float], int]:
+
+    """REQUESTS개의 채팅 생성 요청 지연 시간 목록과 Gemini 생성 요청 수를 반환"""
+
+    random.seed(0)  # 두 구성에 같은 느린 응답 패턴 적용
+    fake = FakeGenaiClient(latency=LATENCY, slow_probability=SLOW_PROBABILITY, slow_latency=SLOW_LATENCY)
+    bot = MbtiChatGenerator()
+    bot.client.client = fake
+    bot.client.hedging_policy = policy
+
+    context = build_sample_context(message_count=50)
+    request = ChatRequest(roomId="BENCHMARK_ROOM", agendaId="2")
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    latencies = []
+
+    async def chat():
+        async with semaphore:
+            start = time.perf_counter()
+            await bot.generate_chat(meeting_context=context, request=request)
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*[chat() for _ in range(REQUESTS)])
+    return latencies, fake.generate_calls
+
+
+async def main():
+    print(f"일반 응답 {LATENCY * 1000:.0f}ms, 느린 응답 {SLOW_LATENCY * 1000:.0f}ms ({SLOW_PROBABILITY:.0%}), "
+          f"요청 {REQUESTS}개 (동시 {CONCURRENCY}개)")
+    print(f"{'구성':<14} | {'p50(ms)':>8} | {'p95(ms)':>8} | {'p99(ms)':>8} | {'평균(ms)':>8} | {'Gemini 요청 수':>12}")
+
+    for label, policy in [("hedge 없음", None), ("hedge p95", HedgingPolicy(percentile=0.95, max_extra_ratio=0.1))]:
+        latencies, calls = await run(policy)
+        print(f"{label:<14} | {percentile(latencies, 0.5) * 1000:>8.1f} | {percentile(latencies, 0.95) * 1000:>8.1f} | "
+              f"{percentile(latencies, 0.99) * 1000:>8.1f} | {statistics.mean(latencies) * 1000:>8.1f} | {calls:>12}")
+        if policy:
+            print(f"{'':<14}   hedging: {policy.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
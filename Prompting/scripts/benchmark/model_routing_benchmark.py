@@ -0,0 +1,111 @@
+"""
+서비스별 모델 라우팅 벤치마크
+
+MBTI 봇 채팅, 안건 생성, 일반 회의 요약, 입력 토큰 제한을 넘는 긴 회의 요약을 섞어 처리하면서
+모든 요청에 기본 모델(gemini-2.0-flash)만 쓰는 구성, 서비스별 라우팅 구성, 긴 요약을 long context 모델로 전환하는 구성의
+모델별 요청 수, 상대 입력 토큰 비용, 서비스별 평균 응답 시간을 비교
+
+Note:
+    - 가짜 Gemini 클라이언트의 응답 지연 시간에 MODEL_REGISTRY의 모델별 상대 지연 시간(relative_latency)을 곱해 재현하므로,
+      응답 시간 차이는 레지스트리에 등록한 상대값을 따름 (요청 수, 분할 수, 입력 토큰 수는 실제 라우팅 결과)
+
+실행: python -m Prompting.scripts.benchmark.model_routing_benchmark  (프로젝트 루트에서)
+"""
+import asyncio
+import os
+import time
+
+os.environ.setdefault("GEMINI_API_KEY", "FAKE_API_KEY")  # 실제 API를 호출하지 않으므로 임의 키 사용
+
+from Prompting.services import GeminiClient, AgendaGenerator, MbtiChatGenerator, MeetingSummarizer
+from Prompting.services.model_router import ModelRouter, MODEL_REGISTRY
+from Prompting.schemas import ChatRequest
+from Prompting.scripts.benchmark.fake_gemini import FakeGenaiClient, build_sample_context
+
+LATENCY = 0.2  # 기본 모델(gemini-2.0-flash) 생성 요청 1회의 응답 지연 시간(초)
+CHAT_REQUESTS = 100  # MBTI 봇 채팅 생성 요청 수
+AGENDA_REQUESTS = 30  # 안건 생성 요청 수
+SUMMARY_REQUESTS = 10  # 일반 회의 요약 요청 수
+LONG_MEETING_MESSAGES = 40_000  # 입력 토큰 제한을 넘는 긴 회의의 채팅 메세지 수
+
+
+def relative_cost(input_tokens_by_model: dict[str, int]) -> float:
+
+    """모델별 입력 토큰 수에 상대 요금을 곱한 합계 (gemini-2.0-flash 입력 토큰 1개 = 1)"""
+
+    return sum(tokens * MODEL_REGISTRY[model].relative_cost for model, tokens in input_tokens_by_model.items())
+
+
+async def timed(call) -> float:
+    start = time.perf_counter()
+    await call
+    return time.perf_counter() - start
+
+
+async def run(router: ModelRouter) -> dict:
+
+    """모든 서비스 요청을 처리하고 모델별 요청 수/입력 토큰 수와 서비스별 평균 응답 시간을 반환"""
+
+    client = GeminiClient(model_router=router)
+    client.client = FakeGenaiClient(
+        latency=LATENCY, model_latency_factor={name: spec.relative_latency for name, spec in MODEL_REGISTRY.items()}
+    )
+    bot = MbtiChatGenerator(client=client)
+    agenda = AgendaGenerator(client=client)
+    summarizer = MeetingSummarizer(client=client)
+
+    chat_context = build_sample_context(message_count=50)
+    summary_context = build_sample_context(message_count=300)
+    long_context = build_sample_context(message_count=LONG_MEETING_MESSAGES)
+    request = ChatRequest(roomId="BENCHMARK_ROOM", agendaId="2")
+
+    latencies = {
+        "chat": await asyncio.gather(*[timed(bot.generate_chat(chat_context, request)) for _ in range(CHAT_REQUESTS)]),
+        "agenda": await asyncio.gather(*[
+            timed(agenda.generate_agenda(f"{i}번째 주간 회의로 진행 상황과 이슈를 공유합니다."))
+            for i in range(AGENDA_REQUESTS)
+        ]),
+    }
+    short_call_cost = relative_cost(client.client.input_tokens_by_model)  # 채팅 + 안건 생성 비용
+    latencies["summary"] = await asyncio.gather(*[
+        timed(summarizer.summarize_agendas(summary_context)) for _ in range(SUMMARY_REQUESTS)
+    ])
+    calls_before_long = sum(client.client.calls_by_model.values())
+    latencies["long_summary"] = [await timed(summarizer.summarize_agendas(long_context))]
+    long_summary_calls = sum(client.client.calls_by_model.values()) - calls_before_long
+    client.close()
+
+    fake = client.client
+    return {
+        "calls_by_model": dict(fake.calls_by_model),
+        "short_call_cost": short_call_cost,
+        "relative_cost": relative_cost(fake.input_tokens_by_model),
+        "avg_ms": {service: sum(values) / len(values) * 1000 for service, values in latencies.items()},
+        "long_summary_calls": long_summary_calls,
+        "router": router.stats(),
+    }
+
+
+async def main():
+    print(f"채팅 {CHAT_REQUESTS}건, 안건 생성 {AGENDA_REQUESTS}건, 요약 {SUMMARY_REQUESTS}건, "
+          f"긴 회의 요약 1건 (메세지 {LONG_MEETING_MESSAGES}개), 기본 모델 응답 지연 {LATENCY * 1000:.0f}ms")
+    single_model = {service: GeminiClient.DEFAULT_MODEL
+                    for service in (ModelRouter.CHAT, ModelRouter.AGENDA, ModelRouter.SUMMARY)}
+    baseline = None  # 단일 모델 구성의 (채팅 + 안건 생성 비용, 전체 비용)
+    for label, router in [
+        ("단일 모델", ModelRouter(routes=single_model, long_context_model=None)),
+        ("서비스별 라우팅", ModelRouter(long_context_model=None)),
+        ("서비스별 라우팅 + long context 전환", ModelRouter(long_context_model="gemini-1.5-pro")),
+    ]:
+        r = await run(router)
+        baseline = baseline or (r["short_call_cost"], r["relative_cost"])
+        print(f"\n[{label}] {r['router']['routes']}, long context: {r['router']['long_context_model']}")
+        print(f"  모델별 요청 수        : {r['calls_by_model']}")
+        print(f"  상대 입력 토큰 비용   : 채팅 + 안건 생성 {r['short_call_cost'] / baseline[0]:.3f}, "
+              f"전체 {r['relative_cost'] / baseline[1]:.3f} (단일 모델 = 1)")
+        print(f"  긴 회의 요약 요청 수  : {r['long_summary_calls']}")
+        print("  평균 응답 시간(ms)    : " + ", ".join(f"{k} {v:.0f}" for k, v in r["avg_ms"].items()))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,109 @@
+"""
+MongoDB 전송 압축 벤치마크 (MongoDB 필요)
+
+채팅 메세지가 많이 쌓인 채팅방(안건 8개, 메세지 2만 개)의 회의 요약용 회의 맥락 로딩(load_summary_context_and_update_agenda_status)을
+동시에 반복 실행하면서, 압축 없음과 드라이버가 지원하는 압축 방식(zlib, snappy, zstd)별 처리량과 평균 로딩 시간을 비교
+
+Note:
+    - MONGO_URI 환경 변수(.env)의 MongoDB 서버 필요 (로컬 mongod 권장), BENCHMARK_DB_NAME DB만 사용하며 종료 시 삭제
+    - snappy/zstd는 추가 패키지(pymongo[snappy,zstd])가 설치된 경우에만 측정
+    - 같은 머신의 mongod는 네트워크 대역폭 제약이 없어 압축의 CPU 비용이 더 크게 나타날 수 있음
+      (원격 서버라면 MONGO_URI를 해당 서버로 지정해 측정)
+    - 연결 풀 설정은 환경 변수(MONGO_MAX_POOL_SIZE 등)를 그대로 사용
+
+실행: python -m Prompting.scripts.benchmark.mongo_compression_benchmark  (프로젝트 루트에서)
+"""
+import asyncio
+import time
+import warnings
+
+from pymongo.compression_support import validate_compressors
+
+from Prompting.repository import mongo_client, AgendaRepository, ChatRepository, RoomRepository, UserRepository
+from Prompting.repository.mongo_client import AGENDA_COLLECTION, CHAT_COLLECTION, ROOM_COLLECTION, USER_COLLECTION
+from Prompting.schemas import SummaryRequest
+from Prompting.usecases import load_summary_context_and_update_agenda_status
+from Prompting.scripts.benchmark.chat_fetch_benchmark import AGENDA_COUNT, build_room_messages
+
+BENCHMARK_DB_NAME = "mindsync-benchmark"  # 벤치마크 전용 DB
+ROOM_ID = "BENCHMARK_COMPRESSION_ROOM"
+MESSAGE_COUNT = 20_000  # 채팅방의 전체 채팅 메세지 수
+CONCURRENCY = 8  # 동시 로딩 요청 수
+LOADS = 64  # 압축 방식별 전체 로딩 횟수
+COMPRESSORS = ["zlib", "snappy", "zstd"]  # 비교할 압축 방식 (압축 없음은 항상 포함)
+
+
+def available_compressors() -> list[str]:
+
+    """COMPRESSORS 중 현재 설치된 패키지로 사용할 수 있는 압축 방식"""
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # 미설치 압축 방식 경고 생략
+        return validate_compressors(None, COMPRESSORS)
+
+
+async def seed(database):
+
+    """벤치마크 채팅방의 채팅방/안건/사용자/채팅 문서 저장"""
+
+    room_messages = build_room_messages(ROOM_ID, MESSAGE_COUNT)
+    emails = sorted({chat["email"] for chats in room_messages["messages"].values() for chat in chats})
+    await database[ROOM_COLLECTION].replace_one({"roomId": ROOM_ID}, {
+        "roomId": ROOM_ID, "host": emails[0], "content": "압축 벤치마크 회의", "participants": emails
+    }, upsert=True)
+    await database[AGENDA_COLLECTION].replace_one({"_id": ROOM_ID}, {
+        "roomId": ROOM_ID,
+        "agendas": {str(aid): {"title": f"안건 {aid}", "status": "PENDING"} for aid in range(1, AGENDA_COUNT + 1)}
+    }, upsert=True)
+    for i, email in enumerate(emails):
+        await database[USER_COLLECTION].replace_one({"email": email}, {
+            "email": email, "username": f"참여자{i + 1}", "usermbti": "ISTJ"
+        }, upsert=True)
+    await database[CHAT_COLLECTION].replace_one({"_id": ROOM_ID}, room_messages, upsert=True)
+
+
+async def run(compressors: list[str]) -> tuple[float, float]:
+
+    """공유 클라이언트를 압축 설정으로 다시 연결해 회의 맥락을 LOADS번 로딩하고 (초당 로딩 수, 평균 로딩 시간(ms))를 반환"""
+
+    await mongo_client.connect(compressors=compressors)
+    database = mongo_client.get_db(BENCHMARK_DB_NAME)
+    repos = (ChatRepository(), AgendaRepository(), RoomRepository(), UserRepository())
+    for repo, collection in zip(repos, (CHAT_COLLECTION, AGENDA_COLLECTION, ROOM_COLLECTION, USER_COLLECTION)):
+        repo.collection = database[collection]
+
+    request = SummaryRequest(roomId=ROOM_ID)
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    latencies = []
+
+    async def load():
+        async with semaphore:
+            start = time.perf_counter()
+            await load_summary_context_and_update_agenda_status(request, *repos)
+            latencies.append(time.perf_counter() - start)
+
+    await load()  # 첫 로딩(연결 생성 포함)은 측정에서 제외
+    latencies.clear()
+    start = time.perf_counter()
+    await asyncio.gather(*[load() for _ in range(LOADS)])
+    elapsed = time.perf_counter() - start
+    return LOADS / elapsed, sum(latencies) / len(latencies) * 1000
+
+
+async def main():
+    await mongo_client.connect()
+    await seed(mongo_client.get_db(BENCHMARK_DB_NAME))
+    try:
+        print(f"메세지 {MESSAGE_COUNT}개 채팅방 회의 맥락 로딩 {LOADS}회, 동시 {CONCURRENCY}개")
+        print(f"{'압축':<8} | {'처리량(회/s)':>12} | {'평균 로딩(ms)':>13}")
+        for compressors in [[]] + [[name] for name in available_compressors()]:
+            throughput, avg_ms = await run(compressors)
+            print(f"{compressors[0] if compressors else '없음':<8} | {throughput:>12.1f} | {avg_ms:>13.1f}")
+    finally:
+        await mongo_client.connect()
+        await mongo_client.get_db().client.drop_database(BENCHMARK_DB_NAME)
+        mongo_client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,57 @@
+"""
+병렬(map-reduce) 요약 모드 벤치마크
+
+출력 토큰 1개당 생성 지연 시간이 있는 가짜 Gemini 클라이언트로,
+안건 수별 단일 요청 요약과 안건(묶음)별 병렬 요약의 end-to-end 소요 시간을 비교
+
+실행: python -m Prompting.scripts.benchmark.parallel_summary_benchmark  (프로젝트 루트에서)
+"""
+import asyncio
+import os
+import time
+
+os.environ.setdefault("GEMINI_API_KEY", "FAKE_API_KEY")  # 실제 API를 호출하지 않으므로 임의 키 사용
+
+from Prompting.services import MeetingSummarizer
+from Prompting.scripts.benchmark.fake_gemini import FakeGenaiClient, build_sample_context
+
+BASE_LATENCY = 0.3  # 요청 1회의 기본 응답 지연 시간(초, 입력 처리 + 첫 토큰까지)
+PER_OUTPUT_TOKEN_LATENCY = 0.004  # 출력 토큰 1개당 생성 지연 시간(초, 약 250 tokens/s)
+STATEMENTS_PER_SUMMARY = 8  # 안건 요약 1개의 주요 발언 수 (안건당 출력 약 200토큰)
+MESSAGES_PER_AGENDA = 50  # 안건당 채팅 메세지 수
+AGENDA_COUNTS = [1, 2, 4, 8, 16]  # 비교할 안건 수
+FAN_OUT = 4  # 병렬 요약 모드의 동시 요청 수 상한
+
+
+async def run_summary(agenda_count: int, parallel: bool, agendas_per_request: int = 1) -> tuple[float, int]:
+
+    """요약 1건을 생성하고 (소요 시간(초), Gemini 생성 요청 수)를 반환"""
+
+    fake = FakeGenaiClient(latency=BASE_LATENCY, per_output_token_latency=PER_OUTPUT_TOKEN_LATENCY,
+                           statements_per_summary=STATEMENTS_PER_SUMMARY)
+    summarizer = MeetingSummarizer(parallel=parallel, max_fan_out=FAN_OUT, agendas_per_request=agendas_per_request)
+    summarizer.client.client = fake
+
+    context = build_sample_context(message_count=MESSAGES_PER_AGENDA * agenda_count, agenda_count=agenda_count)
+
+    start = time.perf_counter()
+    summary = await summarizer.generate_summary(context)
+    elapsed = time.perf_counter() - start
+
+    assert [s["step"] for s in summary] == list(range(1, agenda_count + 1))  # 안건 순서 및 누락 보충 확인
+    return elapsed, fake.generate_calls
+
+
+async def main():
+    print(f"기본 지연 {BASE_LATENCY:.2f}s, 출력 토큰당 {PER_OUTPUT_TOKEN_LATENCY * 1000:.1f}ms, 동시 요청 상한 {FAN_OUT}")
+    print(f"{'안건 수':>6} | {'단일 요청(s)':>12} | {'병렬 1안건(s)':>13} | {'병렬 2안건(s)':>13} | {'요청 수(단일/1/2)':>16}")
+    for agenda_count in AGENDA_COUNTS:
+        serial, serial_calls = await run_summary(agenda_count, parallel=False)
+        per_agenda, per_agenda_calls = await run_summary(agenda_count, parallel=True)
+        paired, paired_calls = await run_summary(agenda_count, parallel=True, agendas_per_request=2)
+        print(f"{agenda_count:>6} | {serial:>12.2f} | {per_agenda:>13.2f} | {paired:>13.2f} | "
+              f"{f'{serial_calls}/{per_agenda_calls}/{paired_calls}':>16}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
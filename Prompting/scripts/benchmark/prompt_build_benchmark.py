@@ -0,0 +1,64 @@
+"""
+요약 프롬프트 빌드(토큰 수 제한에 따른 분할 포함) 지연 시간 벤치마크
+
+원격 토큰 수 계산만 사용하는 방식과 로컬 토큰 추정기를 기본으로 사용하는 방식의
+프롬프트 빌드 소요 시간 및 원격 count_tokens 호출 횟수를 회의 규모별로 비교
+
+실행: python -m Prompting.scripts.benchmark.prompt_build_benchmark  (프로젝트 루트에서)
+"""
+import asyncio
+import os
+import time
+
+os.environ.setdefault("GEMINI_API_KEY", "FAKE_API_KEY")  # 실제 API를 호출하지 않으므로 임의 키 사용
+
+from Prompting.services import MeetingSummarizer, GeminiClient
+from Prompting.services.context_builders import MeetingHistoryBuilder
+from Prompting.scripts.benchmark.fake_gemini import FakeGenaiClient, build_sample_context
+
+COUNT_LATENCY = 0.15  # 원격 count_tokens 호출 1회의 가짜 응답 지연 시간(초)
+MESSAGE_COUNTS = [1_000, 10_000, 100_000]  # 회의 전체 채팅 메세지 수
+AGENDA_COUNT = 16  # 회의 안건 수
+
+
+async def build_with_remote_count(summarizer: MeetingSummarizer, history_builder: MeetingHistoryBuilder) -> list[str]:
+
+    """(개선 전) 템플릿과 분할 단계마다 원격 토큰 수 계산을 사용하는 프롬프트 빌드"""
+
+    prompt_base = summarizer.template.format(chat_history='')
+    token_alloc = GeminiClient.INPUT_TOKEN_LIMIT - await summarizer.client.count_tokens_async(prompt_base)
+    chunks = await history_builder.build_prompt_chunks(
+        count_tokens_callback=summarizer.client.count_tokens_async,
+        token_alloc=token_alloc
+    )
+    return [summarizer.template.format(chat_history=chunk) for chunk in chunks]
+
+
+async def measure(message_count: int, use_estimator: bool) -> tuple[float, int, int]:
+
+    """프롬프트 빌드 소요 시간(초), 원격 count_tokens 호출 수, 생성된 프롬프트 수를 반환"""
+
+    fake = FakeGenaiClient(count_latency=COUNT_LATENCY)
+    summarizer = MeetingSummarizer()
+    summarizer.client.client = fake
+    history_builder = MeetingHistoryBuilder(build_sample_context(message_count, AGENDA_COUNT))
+
+    start = time.perf_counter()
+    if use_estimator:
+        _, prompts = await summarizer._build_prompt_list(history_builder)
+    else:
+        prompts = await build_with_remote_count(summarizer, history_builder)
+    return time.perf_counter() - start, fake.count_calls, len(prompts)
+
+
+async def main():
+    print(f"원격 count_tokens 1회 지연 시간: {COUNT_LATENCY:.2f}s, 안건 수: {AGENDA_COUNT}")
+    print(f"{'메세지 수':>9} | {'remote(s)':>9} {'calls':>5} {'prompts':>7} | {'estimator(s)':>12} {'calls':>5} {'prompts':>7}")
+    for n in MESSAGE_COUNTS:
+        remote = await measure(n, use_estimator=False)
+        local = await measure(n, use_estimator=True)
+        print(f"{n:>9} | {remote[0]:>9.2f} {remote[1]:>5} {remote[2]:>7} | {local[0]:>12.2f} {local[1]:>5} {local[2]:>7}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
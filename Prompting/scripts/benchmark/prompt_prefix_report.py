@@ -0,0 +1,110 @@
+"""
+요청 간 공유 prefix 길이 리포트 (제공자 implicit prompt caching 적중 가능 범위 확인)
+
+샘플 회의 Context 묶음(샘플 회의록 x 회의 주제 x 봇 MBTI 유형)으로 MBTI 봇 채팅, 회의 요약, 안건 생성 요청을 차례로 보내면서
+실제 전송되는 프롬프트를 기록하고, 각 요청이 앞서 보낸 요청들과 바이트 단위로 동일하게 시작하는 부분(공유 prefix)의 토큰 수를 서비스별로 집계
+
+Note:
+    - 요청 i의 공유 prefix = 앞선 요청들과의 공통 prefix 중 가장 긴 것 (제공자가 앞선 요청의 prefix를 캐시했다고 가정)
+    - 전체 공통 prefix = 서비스의 모든 요청이 공유하는 prefix (요청 순서와 관계없이 항상 적중 가능한 부분)
+    - 토큰 수는 로컬 토큰 추정기 기준 추정값 (context cache를 사용하지 않을 때 전송되는 프롬프트 전체 기준)
+
+실행: python -m Prompting.scripts.benchmark.prompt_prefix_report  (프로젝트 루트에서)
+"""
+import asyncio
+import os
+from dataclasses import replace
+
+os.environ.setdefault("GEMINI_API_KEY", "FAKE_API_KEY")  # 실제 API를 호출하지 않으므로 임의 키 사용
+
+from Prompting.services import GeminiClient, AgendaGenerator, MbtiChatGenerator, MeetingSummarizer
+from Prompting.services.token_estimator import TokenEstimator
+from Prompting.schemas import ChatRequest
+from Prompting.usecases.meeting_context import MeetingContext, UserInfo
+from Prompting.scripts.benchmark.fake_gemini import FakeGenaiClient, build_sample_context, base_dir
+
+SAMPLE_FILES = ["meeting_log_sample_1.json", "meeting_log_sample_2.json"]  # scripts/data의 샘플 회의록
+TOPICS = ["조직 개편 및 인사 이동", "신규 서비스 출시 일정 점검", "하반기 마케팅 예산 배분"]  # 회의 주제
+MBTI_TYPES = ["ENFP", "INTJ", "ISTP", "ESFJ"]  # 채팅을 생성할 봇의 MBTI 유형
+MESSAGE_COUNT = 60  # 샘플 회의 1개의 채팅 메세지 수
+
+
+def build_corpus() -> list[MeetingContext]:
+
+    """샘플 회의록 x 회의 주제마다 안건명을 달리한 샘플 회의 Context 목록"""
+
+    corpus = []
+    for file_name in SAMPLE_FILES:
+        context = build_sample_context(MESSAGE_COUNT, sample_json_file_path=os.path.join(base_dir, "../data", file_name))
+        for topic in TOPICS:
+            agendas = {aid: agenda.model_copy(update={"title": f"{topic} 안건 {aid}"})
+                       for aid, agenda in context.agendas.items()}
+            corpus.append(replace(context, topic=topic, agendas=agendas))
+    return corpus
+
+
+def with_bot(context: MeetingContext, mbti: str) -> MeetingContext:
+
+    """마지막 참여자(AI 참여자)의 MBTI 유형을 바꾼 회의 Context"""
+
+    participants = context.participants[:-1] + [UserInfo(email=f"{mbti.lower()}@ai.com", name=mbti, mbti=mbti)]
+    return replace(context, participants=participants)
+
+
+async def collect_prompts() -> dict[str, list[str]]:
+
+    """서비스별로 실제 전송된 프롬프트 목록 (요청 순서)"""
+
+    client = GeminiClient()
+    client.client = FakeGenaiClient(latency=0, record_prompts=True)
+    bot, summarizer = MbtiChatGenerator(client=client), MeetingSummarizer(client=client)
+    agenda = AgendaGenerator(client=client)
+
+    prompts = {}
+    corpus = build_corpus()
+    for label, requests in [
+        ("chat", [bot.generate_chat(with_bot(context, mbti), ChatRequest(roomId="REPORT_ROOM", agendaId=aid))
+                  for context in corpus for mbti in MBTI_TYPES for aid in list(context.agendas)[1:]]),
+        ("summary", [summarizer.summarize_agendas(context) for context in corpus]),
+        ("agenda", [agenda.generate_agenda(f"{context.topic}에 대한 회의입니다. 안건을 제안해 주세요.")
+                    for context in corpus]),
+    ]:
+        start = len(client.client.sent_prompts)
+        for request in requests:  # 요청 순서가 고정되도록 차례로 처리
+            await request
+        prompts[label] = client.client.sent_prompts[start:]
+    client.close()
+    return prompts
+
+
+def common_prefix_length(a: str, b: str) -> int:
+
+    """두 문자열이 동일하게 시작하는 부분의 글자 수"""
+
+    return len(os.path.commonprefix([a, b]))
+
+
+def report(label: str, prompts: list[str], estimator: TokenEstimator):
+    total_tokens = [estimator.estimate(p) for p in prompts]
+    shared_tokens = [0]  # 첫 요청은 앞선 요청이 없으므로 공유 prefix 없음
+    for i in range(1, len(prompts)):
+        shared = max(common_prefix_length(prompts[i], prompts[j]) for j in range(i))
+        shared_tokens.append(estimator.estimate(prompts[i][:shared]))
+    always_shared = estimator.estimate(os.path.commonprefix(prompts))
+
+    print(f"{label:<8} | {len(prompts):>6} | {sum(total_tokens) / len(prompts):>10,.0f} | {always_shared:>10,} | "
+          f"{sum(shared_tokens[1:]) / max(1, len(prompts) - 1):>10,.0f} | {min(shared_tokens[1:], default=0):>8,} | "
+          f"{sum(shared_tokens) / sum(total_tokens):>7.1%}")
+
+
+async def main():
+    estimator = TokenEstimator()
+    prompts = await collect_prompts()
+    print(f"샘플 회의 Context: 샘플 회의록 {len(SAMPLE_FILES)}개 x 회의 주제 {len(TOPICS)}개, 봇 MBTI 유형 {MBTI_TYPES}")
+    print(f"{'서비스':<8} | {'요청 수':>6} | {'평균 토큰':>10} | {'전체 공통':>10} | {'평균 공유':>10} | {'최소 공유':>8} | {'공유 비율':>7}")
+    for label, service_prompts in prompts.items():
+        report(label, service_prompts, estimator)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
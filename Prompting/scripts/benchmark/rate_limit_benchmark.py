@@ -0,0 +1,77 @@
+"""
+Gemini rate limiter 검증 벤치마크
+
+요청 수/토큰 수 할당량을 강제하는 로컬 가짜 서버에 요청을 한꺼번에 몰아 보내고,
+rate limiter가 없을 때와 있을 때의 실패 요청 수(클라이언트에 전달된 에러), 서버 429 응답 수, 소요 시간을 비교
+
+실행: python -m Prompting.scripts.benchmark.rate_limit_benchmark  (프로젝트 루트에서)
+"""
+import asyncio
+import os
+import time
+from typing import Optional
+
+os.environ.setdefault("GEMINI_API_KEY", "FAKE_API_KEY")  # 실제 API를 호출하지 않으므로 임의 키 사용
+
+from google.genai import errors
+from Prompting.services import GeminiClient
+from Prompting.services.rate_limiter import GeminiRateLimiter
+from Prompting.scripts.benchmark.fake_quota_server import FakeQuotaServer
+
+PERIOD = 2.0  # 할당량 기준 시간(초, 테스트 시간 단축을 위해 1분 대신 사용)
+RPM = 20  # PERIOD당 요청 수 할당량
+TPM = 4000  # PERIOD당 토큰 수 할당량
+REQUESTS = 60  # 한꺼번에 보낼 요청 수
+PROMPT = "회의 안건을 정리해 주세요. " * 20  # 요청 1회의 프롬프트
+ERROR_RATE = 0.05  # 할당량과 무관한 503 응답 비율
+
+
+async def run(limiter: Optional[GeminiRateLimiter], server_rpm: int = RPM, server_tpm: int = TPM) -> dict:
+
+    """가짜 서버에 REQUESTS개의 요청을 동시에 보내고 결과 통계를 반환"""
+
+    server = FakeQuotaServer(rpm=server_rpm, tpm=server_tpm, period=PERIOD, error_rate=ERROR_RATE).start()
+    client = GeminiClient(base_url=server.base_url, rate_limiter=limiter, pool_size=REQUESTS)
+
+    async def call() -> bool:
+        try:
+            await client.generate_content_async(PROMPT)
+            return True
+        except errors.APIError:
+            return False
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*[call() for _ in range(REQUESTS)])
+    elapsed = time.perf_counter() - start
+
+    client.close()
+    server.stop()
+    return {
+        "success": sum(results), "failed": REQUESTS - sum(results),
+        "server_429": server.rejected, "server_503": server.failed, "elapsed": elapsed
+    }
+
+
+def new_limiter() -> GeminiRateLimiter:
+    return GeminiRateLimiter(rpm=RPM, tpm=TPM, period=PERIOD, max_retries=6, backoff_base=0.2, backoff_max=2.0)
+
+
+async def main():
+    print(f"할당량: {PERIOD:.0f}초당 요청 {RPM}회 / 토큰 {TPM}개, 동시 요청 {REQUESTS}개, 503 비율 {ERROR_RATE:.0%}")
+    print(f"{'구성':<28} | {'성공':>4} | {'실패':>4} | {'서버 429':>7} | {'서버 503':>7} | {'소요(s)':>7}")
+
+    for label, limiter, server_rpm, server_tpm in [
+        ("limiter 없음", None, RPM, TPM),
+        ("limiter (할당량 일치)", new_limiter(), RPM, TPM),
+        ("limiter (서버 요청 할당량 절반)", new_limiter(), RPM // 2, TPM),  # 설정보다 실제 할당량이 작을 때 적응 확인
+        ("limiter (서버 토큰 할당량 1/4)", new_limiter(), RPM, TPM // 4),
+    ]:
+        r = await run(limiter, server_rpm=server_rpm, server_tpm=server_tpm)
+        print(f"{label:<28} | {r['success']:>4} | {r['failed']:>4} | {r['server_429']:>7} | "
+              f"{r['server_503']:>7} | {r['elapsed']:>7.2f}")
+        if limiter:
+            print(f"{'':<28}   limiter: {limiter.stats()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,54 @@
+"""
+회의 요약 스트리밍 생성 벤치마크
+
+출력 토큰 1개당 생성 지연 시간이 있는 가짜 Gemini 클라이언트로, 안건 수별
+일반 요약(전체 응답 대기)과 스트리밍 요약(안건 object가 닫히는 즉시 반환)의 첫 안건 요약까지의 시간과 전체 소요 시간을 비교
+
+실행: python -m Prompting.scripts.benchmark.summary_streaming_benchmark  (프로젝트 루트에서)
+"""
+import asyncio
+import os
+import time
+
+os.environ.setdefault("GEMINI_API_KEY", "FAKE_API_KEY")  # 실제 API를 호출하지 않으므로 임의 키 사용
+
+from Prompting.services import MeetingSummarizer
+from Prompting.scripts.benchmark.fake_gemini import FakeGenaiClient, build_sample_context
+
+BASE_LATENCY = 0.3  # 요청 1회의 기본 응답 지연 시간(초, 입력 처리 + 첫 토큰까지)
+PER_OUTPUT_TOKEN_LATENCY = 0.004  # 출력 토큰 1개당 생성 지연 시간(초, 약 250 tokens/s)
+STATEMENTS_PER_SUMMARY = 8  # 안건 요약 1개의 주요 발언 수 (안건당 출력 약 200토큰)
+MESSAGES_PER_AGENDA = 50  # 안건당 채팅 메세지 수
+AGENDA_COUNTS = [1, 4, 8, 16]  # 비교할 안건 수
+
+
+def new_summarizer() -> MeetingSummarizer:
+    summarizer = MeetingSummarizer(parallel=False)
+    summarizer.client.client = FakeGenaiClient(latency=BASE_LATENCY, per_output_token_latency=PER_OUTPUT_TOKEN_LATENCY,
+                                               statements_per_summary=STATEMENTS_PER_SUMMARY)
+    return summarizer
+
+
+async def main():
+    print(f"기본 지연 {BASE_LATENCY:.2f}s, 출력 토큰당 {PER_OUTPUT_TOKEN_LATENCY * 1000:.1f}ms, 단일 요청 요약")
+    print(f"{'안건 수':>6} | {'일반 요약(s)':>12} | {'스트리밍 첫 안건(s)':>18} | {'스트리밍 전체(s)':>15}")
+    for agenda_count in AGENDA_COUNTS:
+        context = build_sample_context(message_count=MESSAGES_PER_AGENDA * agenda_count, agenda_count=agenda_count)
+
+        start = time.perf_counter()
+        summary = await new_summarizer().generate_summary(context)
+        full_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        first_elapsed, streamed = None, []
+        async for agenda_summary in new_summarizer().generate_summary_stream(context):
+            first_elapsed = first_elapsed or time.perf_counter() - start
+            streamed.append(agenda_summary)
+        stream_elapsed = time.perf_counter() - start
+
+        assert sorted(streamed, key=lambda s: int(s["step"])) == summary  # 정렬하면 일반 요약 결과와 동일
+        print(f"{agenda_count:>6} | {full_elapsed:>12.2f} | {first_elapsed:>18.2f} | {stream_elapsed:>15.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,39 @@
+"""
+repository 조회의 MongoDB 실행 계획 확인 CLI
+
+repository 조회마다 explain을 실행해 채택된 실행 계획을 출력하고,
+콜렉션 전체 스캔(COLLSCAN)하는 조회가 있으면 종료 코드 1로 종료 (배포 전 점검/CI용)
+
+실행: python -m Prompting.scripts.check_query_plans [--create-indexes]  (프로젝트 루트에서)
+    --create-indexes: 확인 전에 필수 인덱스를 생성 (서버 시작 시와 동일)
+"""
+import argparse
+import asyncio
+import sys
+
+from Prompting.repository.indexes import ensure_indexes, explain_repository_queries
+
+
+async def main(create_indexes: bool) -> int:
+    if create_indexes:
+        for collection, names in (await ensure_indexes()).items():
+            print(f"[인덱스] {collection}: {', '.join(names) or '이미 있음'}")
+
+    plans = await explain_repository_queries()
+    for plan in plans:
+        result = "FAIL" if plan.is_collection_scan else "OK"
+        print(f"[{result:<4}] {plan.query:<45} {plan.collection:<15} {' <- '.join(plan.stages)}")
+
+    scans = [plan.query for plan in plans if plan.is_collection_scan]
+    if scans:
+        print(f"콜렉션 전체 스캔 조회 {len(scans)}개: {', '.join(scans)}")
+        return 1
+    print("모든 repository 조회가 인덱스를 사용합니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="repository 조회의 MongoDB 실행 계획 확인")
+    parser.add_argument("--create-indexes", action="store_true", help="확인 전에 필수 인덱스 생성")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(main(args.create_indexes)))
@@ -1,3 +1,4 @@
+from .gemini_client import GeminiClient
 from .agenda_generator import AgendaGenerator
 from .mbti_chat_generator import MbtiChatGenerator
 from .meeting_summarizer import MeetingSummarizer
@@ -0,0 +1,125 @@
+import copy
+import re
+import unicodedata
+from typing import Any, Optional
+
+from Prompting.common.cache import LRUCache
+from Prompting.common.config import AGENDA_CACHE_SIZE, AGENDA_CACHE_TTL_SECONDS, AGENDA_CACHE_SIMILARITY_THRESHOLD
+
+NON_WORD_REGEX = r"[^\w\s]"  # 정규화 시 제거할 문장 부호 패턴
+DIGITS_REGEX = r"\d+"  # 유사 항목끼리 반드시 같아야 하는 숫자 패턴 (회차, 날짜, 금액 등)
+
+
+class AgendaResponseCache:
+    NGRAM_SIZE = 3  # 유사도 계산에 사용할 문자 n-gram 길이
+
+    def __init__(self, maxsize: int = AGENDA_CACHE_SIZE, ttl: Optional[float] = AGENDA_CACHE_TTL_SECONDS,
+                 similarity_threshold: float = AGENDA_CACHE_SIMILARITY_THRESHOLD):
+        """
+        회의 설명별 안건 생성 응답 캐시 (반복되는 회의의 안건을 Gemini 호출 없이 재사용)
+
+        Note:
+            - 회의 설명을 정규화(유니코드 NFKC, 소문자, 문장 부호 제거, 공백 정리)한 문자열이 같으면 그대로 재사용 (exact)
+            - 정확히 일치하는 항목이 없으면, 문자 n-gram 집합의 Jaccard 유사도가 similarity_threshold 이상인
+              가장 비슷한 회의 설명의 응답을 재사용 (near, 외부 서비스 없이 로컬 계산)
+            - 숫자(회차, 날짜, 금액 등)는 안건 내용을 바꿀 수 있으므로 n-gram에 그대로 포함하고,
+              설명에 나온 숫자가 모두 같을 때만 유사 항목으로 적중 (숫자만 다른 설명은 Gemini로 새로 생성)
+            - 유사도 비교는 캐시 항목 전체를 순회하므로 비용이 maxsize에 비례 (n-gram 수 차이로 먼저 걸러 계산을 줄임)
+            - 항목 수 제한(LRU)과 만료 시간(TTL)은 LRUCache를 그대로 사용
+
+        Args:
+            maxsize: 최대 저장 항목 수
+            ttl: 항목 만료 시간(초). None이면 만료 없음
+            similarity_threshold: 같은 회의로 볼 최소 n-gram 유사도 (0~1, 1 이상이면 유사도 비교 생략)
+        """
+        self.entries = LRUCache(maxsize=maxsize, ttl=ttl)  # 정규화된 회의 설명 -> (n-gram 집합, 숫자 목록, 안건 응답)
+        self.similarity_threshold = similarity_threshold
+
+        # 통계 지표
+        self.exact_hits = 0
+        self.near_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize(text: str) -> str:
+
+        """회의 설명 정규화 (표기 차이만 있는 설명이 같은 key가 되도록)"""
+
+        text = unicodedata.normalize("NFKC", text).lower()
+        return ' '.join(re.sub(NON_WORD_REGEX, ' ', text).split())
+
+    @classmethod
+    def ngrams(cls, normalized: str) -> frozenset[str]:
+
+        """정규화된 회의 설명의 문자 n-gram 집합 (공백 제외, 설명이 n보다 짧으면 설명 전체)"""
+
+        compact = normalized.replace(' ', '')
+        if len(compact) <= cls.NGRAM_SIZE:
+            return frozenset([compact])
+        return frozenset(compact[i:i + cls.NGRAM_SIZE] for i in range(len(compact) - cls.NGRAM_SIZE + 1))
+
+    def get(self, topic_request: str) -> Optional[list[dict]]:
+        """
+        회의 설명과 같거나 충분히 비슷한 회의 설명의 안건 응답을 조회
+
+        Args:
+            topic_request: 회의 안건 제안에 대한 요청 사항
+
+        Returns:
+            캐시된 안건 응답의 복사본 (없으면 None)
+        """
+        key = self.normalize(topic_request)
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.exact_hits += 1
+            return copy.deepcopy(entry[2])
+
+        entry = self._find_similar(self.ngrams(key), tuple(re.findall(DIGITS_REGEX, key)))
+        if entry is not None:
+            self.near_hits += 1
+            return copy.deepcopy(entry[2])
+
+        self.misses += 1
+        return None
+
+    def set(self, topic_request: str, agenda_list: list[dict]):
+
+        """회의 설명의 안건 응답 저장"""
+
+        key = self.normalize(topic_request)
+        self.entries.set(key, (self.ngrams(key), tuple(re.findall(DIGITS_REGEX, key)), copy.deepcopy(agenda_list)))
+
+    def stats(self) -> dict[str, Any]:
+
+        """캐시 크기, 정확/유사 적중 횟수 및 적중률"""
+
+        lookups = self.exact_hits + self.near_hits + self.misses
+        return {
+            "size": self.entries.stats()["size"],
+            "maxsize": self.entries.maxsize,
+            "exact_hits": self.exact_hits,
+            "near_hits": self.near_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.exact_hits + self.near_hits) / lookups, 4) if lookups else 0.0,
+        }
+
+    def _find_similar(self, ngrams: frozenset[str],
+                      numbers: tuple[str, ...]) -> Optional[tuple[frozenset[str], tuple[str, ...], list[dict]]]:
+
+        """숫자 목록이 같고 n-gram 유사도가 기준값 이상인 항목 중 가장 비슷한 항목 (없으면 None)"""
+
+        if self.similarity_threshold >= 1:
+            return None
+
+        best_entry, best_score = None, self.similarity_threshold
+        for _, entry in self.entries.items():
+            other = entry[0]
+            if entry[1] != numbers:  # 회차, 날짜, 금액 등이 다르면 다른 회의
+                continue
+            # Jaccard 유사도 상한(작은 집합 크기 / 큰 집합 크기)이 현재 최고값보다 낮으면 계산 생략
+            if min(len(ngrams), len(other)) < best_score * max(len(ngrams), len(other)):
+                continue
+            score = len(ngrams & other) / len(ngrams | other)
+            if score >= best_score:
+                best_entry, best_score = entry, score
+        return best_entry
@@ -1,23 +1,41 @@
+import asyncio
+import itertools
+import logging
 from .gemini_client import GeminiClient
+from .agenda_cache import AgendaResponseCache
+from .model_router import ModelRouter
 from google.genai.types import GenerateContentConfig
-from typing import cast
-from .templates import AGENDA_PROMPT_KR, AGENDA_PROMPT_EN
+from typing import cast, Optional
+from .templates import AGENDA_PROMPT_KR, AGENDA_PROMPT_EN, AGENDA_BATCH_PROMPT_KR
+from Prompting.common.config import AGENDA_BATCH_SIZE, AGENDA_BATCH_FAN_OUT
 from Prompting.exceptions import GeminiCallError, GeminiParseError, catch_and_raise
 
+logger = logging.getLogger(__name__)
+
 
 class AgendaGenerator:
-    def __init__(self, temperature: float = 1, top_p: float = 0.95, top_k: int = 40, max_output_tokens: int = 2000):
+    def __init__(self, client: Optional[GeminiClient] = None,
+                 temperature: float = 1, top_p: float = 0.95, top_k: int = 40, max_output_tokens: int = 2000,
+                 batch_size: int = AGENDA_BATCH_SIZE, max_fan_out: int = AGENDA_BATCH_FAN_OUT,
+                 cache: Optional[AgendaResponseCache] = None):
         """
         Gemini API로 주제에 적절한 회의 안건 제안을 생성
          - 요청을 기반으로 예상되는 회의 규모에 따라 3~10개의 안건 아이템을 생성
+         - 여러 회의의 안건은 회의 설명을 묶어 요청 1회로 생성 가능 (배치 안건 생성)
+         - cache가 주어지면 같거나 비슷한 회의 설명의 안건 응답을 Gemini 호출 없이 재사용
 
         Args:
+            client: 공유 Gemini API 클라이언트 (미지정 시 새로 생성)
             temperature: 모델의 온도 설정 (기본값: 1, 설정 가능 범위: 0~2)
             top_p: (단어의) 확률 기반 샘플링을 위한 top_p 값 (기본값: 0.95)
             top_k: (단어의) 확률 기반 샘플링을 위한 top_k 값 (기본값: 40)
-            max_output_tokens: 최대 출력 토큰 수 (기본값: 2000)
+            max_output_tokens: 회의 1개당 최대 출력 토큰 수 (기본값: 2000)
+            batch_size: 배치 안건 생성에서 요청 1회에 묶을 회의 설명 수
+            max_fan_out: 배치 안건 생성 1건당 동시 Gemini 요청 수 상한
+            cache: 회의 설명별 안건 생성 응답 캐시 (선택 사항)
         """
-        self.client = GeminiClient()  # Gemini API 클라이언트 초기화
+        self.client = client or GeminiClient()  # Gemini API 클라이언트 초기화
+        self.cache = cache  # 안건 생성 응답 캐시
         self.template = AGENDA_PROMPT_KR  # 프롬프트 템플릿
 
         # 모델 config 값 설정
@@ -26,6 +44,10 @@ class AgendaGenerator:
         self.top_k = top_k
         self.max_output_tokens = max_output_tokens
 
+        # 배치 안건 생성 설정값
+        self.batch_size = max(1, batch_size)
+        self.max_fan_out = max(1, max_fan_out)
+
         # 응답 형식 설정값
         self.response_mime_type = 'application/json'
         self.response_schema = {  # 세부 Schema 정의
@@ -42,12 +64,27 @@ class AgendaGenerator:
             },
             'type': 'ARRAY',  # 위 요소를 갖는 안건 object가 담긴 배열을 반환하도록 정의
         }
+        self.batch_response_schema = {  # 배치 요청 Schema 정의 (회의 설명별 안건 배열의 배열)
+            'items': {
+                'type': 'OBJECT',
+                'required': [
+                    'index',
+                    'agendas'
+                ],
+                'properties': {
+                    'index': {'type': 'INTEGER'},  # 몇 번째 회의 설명인지
+                    'agendas': self.response_schema,  # 해당 회의의 안건 배열
+                }
+            },
+            'type': 'ARRAY',
+        }
 
 
     @catch_and_raise("Gemini 안건 생성", GeminiCallError)
     async def generate_agenda(self, topic_request: str) -> list[dict]:
         """
         Gemini API를 호출해 회의 안건 생성을 요청하고 응답을 반환
+        (cache가 있으면 같거나 비슷한 회의 설명의 캐시된 응답을 Gemini 호출 없이 반환)
 
         Args:
             topic_request: 회의 안건 제안에 대한 요청 사항
@@ -55,19 +92,119 @@ class AgendaGenerator:
         Returns:
             Gemini 응답 파싱 결과 (회의 안건 정보가 담긴 dict 리스트)
         """
+        if self.cache is not None:
+            cached = self.cache.get(topic_request)
+            if cached is not None:
+                return cached
+
+        agenda_list = await self._generate_single_agendas(topic_request)
+        if self.cache is not None and agenda_list:
+            self.cache.set(topic_request, agenda_list)
+        return agenda_list
+
+
+    @catch_and_raise("Gemini 배치 안건 생성", GeminiCallError)
+    async def generate_agendas_batch(self, topic_requests: list[str]) -> list[list[dict]]:
+        """
+        여러 회의의 안건을 회의 설명 batch_size개씩 묶어 생성
+
+        Note:
+            - 긴 안건 생성 지침을 묶음마다 한 번만 보내므로, 회의마다 요청할 때보다 요청 수와 입력 토큰 수가 줄어듦
+            - 묶음 요청이 실패하거나 응답이 회의 설명 수와 맞지 않으면, 그 묶음만 회의별 단일 요청으로 나누어 동시에 다시 생성
+            - 묶음 요청과 단일 요청 모두 동시 요청 수를 max_fan_out개로 제한
+            - cache가 있으면 캐시된 회의는 묶음에서 제외하고, 새로 생성한 안건은 캐시에 저장
+
+        Args:
+            topic_requests: 회의별 안건 제안 요청 사항 리스트
+
+        Returns:
+            Gemini 응답 파싱 결과 리스트 (topic_requests 순서의 회의별 안건 dict 리스트)
+        """
+        results: list[Optional[list[dict]]] = [None] * len(topic_requests)
+        if self.cache is not None:  # 캐시에 있는 회의는 묶음 요청에서 제외
+            results = [self.cache.get(topic_request) for topic_request in topic_requests]
+        pending = [i for i, result in enumerate(results) if result is None]
+
+        semaphore = asyncio.Semaphore(self.max_fan_out)
+        packs = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+        generated = await asyncio.gather(*[
+            self._generate_pack([topic_requests[i] for i in pack], semaphore) for pack in packs
+        ])
+
+        for i, agenda_list in zip(itertools.chain.from_iterable(packs), itertools.chain.from_iterable(generated)):
+            results[i] = agenda_list
+            if self.cache is not None and agenda_list:
+                self.cache.set(topic_requests[i], agenda_list)
+        return cast(list[list[dict]], results)
+
+
+    async def _generate_pack(self, pack: list[str], semaphore: asyncio.Semaphore) -> list[list[dict]]:
+
+        """회의 설명 묶음의 안건을 요청 1회로 생성하고, 실패 시 회의별 단일 요청으로 대체"""
+
+        if len(pack) > 1:
+            try:
+                async with semaphore:
+                    return await self._generate_packed_agendas(pack)
+            except Exception as e:
+                logger.warning("묶음 안건 생성 실패 (회의 %d개), 회의별 요청으로 대체: %r", len(pack), e)
+
+        async def generate_single(topic_request: str) -> list[dict]:
+            async with semaphore:
+                return await self._generate_single_agendas(topic_request)
+
+        return list(await asyncio.gather(*[generate_single(topic_request) for topic_request in pack]))
+
+
+    async def _generate_single_agendas(self, topic_request: str) -> list[dict]:
+
+        """회의 설명 하나의 안건을 Gemini로 생성 (캐시 미사용)"""
+
         prompt = self._build_prompt(topic_request)
-        config = GenerateContentConfig(
+        model = self.client.model_router.route(ModelRouter.AGENDA, self.client.token_estimator.estimate(prompt))
+        config = self._build_config(self.response_schema, min(self.max_output_tokens, model.output_token_limit))
+        response = await self.client.generate_content_async(prompt, config, model.name)
+        return cast(list[dict], response.parsed)  # json 형식으로 파싱(IDE 타입 hint 겁사 때문에 cast 적용)
+
+
+    async def _generate_packed_agendas(self, pack: list[str]) -> list[list[dict]]:
+        """
+        회의 설명 묶음을 하나의 프롬프트로 보내 회의별 안건 리스트를 생성
+
+        Args:
+            pack: 회의별 안건 제안 요청 사항 리스트
+
+        Returns:
+            pack 순서의 회의별 안건 dict 리스트
+
+        Raises:
+            GeminiParseError: 응답의 회의 번호가 요청한 회의 설명과 맞지 않거나 안건이 비어 있는 경우
+        """
+        topic_requests = '\n'.join(f"[{i}] {topic_request}" for i, topic_request in enumerate(pack))
+        prompt = AGENDA_BATCH_PROMPT_KR.format(topic_requests=topic_requests)
+        model = self.client.model_router.route(ModelRouter.AGENDA, self.client.token_estimator.estimate(prompt))
+        max_output_tokens = min(self.max_output_tokens * len(pack), model.output_token_limit)
+        config = self._build_config(self.batch_response_schema, max_output_tokens)
+        response = await self.client.generate_content_async(prompt, config, model.name)
+
+        agendas_by_index = {item.get("index"): item.get("agendas") for item in (response.parsed or [])}
+        if set(agendas_by_index) != set(range(len(pack))) or not all(agendas_by_index.values()):
+            raise GeminiParseError("묶음 안건 응답의 회의 수 불일치")
+        return [cast(list[dict], agendas_by_index[i]) for i in range(len(pack))]
+
+
+    def _build_config(self, response_schema: dict, max_output_tokens: int) -> GenerateContentConfig:
+
+        """안건 생성 요청에 사용할 Generation 설정"""
+
+        return GenerateContentConfig(
             temperature=self.temperature,
             top_p=self.top_p,
             top_k=self.top_k,
-            max_output_tokens=self.max_output_tokens,
+            max_output_tokens=max_output_tokens,
             response_mime_type=self.response_mime_type,
-            response_schema=self.response_schema
+            response_schema=response_schema
         )
-        response = self.client.generate_content(prompt, config)
-        agenda_list = cast(list[dict], response.parsed)  # json 형식으로 파싱(IDE 타입 hint 겁사 때문에 cast 적용)
-
-        return agenda_list
 
 
     @catch_and_raise("Gemini 안건 응답 파싱", GeminiParseError)
@@ -1,38 +1,44 @@
+import asyncio
 from collections import Counter
 import itertools
 import re
 from Prompting.usecases.meeting_context import MeetingContext, UserInfo, ChatLog
 from Prompting.exceptions.errors import PromptBuildError
-from typing import Optional, Iterator, Callable
+from typing import Optional, Iterator, Callable, Awaitable
 
 
 class MeetingHistoryBuilder:
-    def __init__(self, context: MeetingContext):
+    def __init__(self, context: MeetingContext, bot: Optional[UserInfo] = None):
         """
         프롬프트 빌드에 필요한 회의 Context 문자열을 생성하고 처리하는 클래스
 
         주요 기능:
          - Gemini API 프롬프트 첨부용 회의 Context 텍스트 구성
          - 토큰 수 제한에 맞춰 텍스트를 분할
+
+        Args:
+            context: 회의 맥락이 담긴 data class 객체
+            bot: 채팅 내역에서 (YOU)로 표시할 AI 봇 (미지정 시 첫 번째 AI 참여자)
         """
         self.topic: str = context.topic  # 회의 주제
         self.agendas: dict[str, str] = {aid: context.agendas[aid].title for aid in context.agendas}  # 회의 안건들(번호-주제 쌍)
         self.host: str = context.host  # 회의 개최자(이메일)
         self.participants: list[UserInfo] = context.participants  # 회의 참여자 리스트
         self.chats: dict[str, list[ChatLog]] = context.chats  # 채팅 기록 리스트
-        self.bot: Optional[UserInfo] = self._get_bot_info()  # AI 봇 정보
+        self.bots: list[UserInfo] = self._get_bot_infos()  # 회의에 참여한 AI 봇 목록
+        self.bot: Optional[UserInfo] = bot or next(iter(self.bots), None)  # 채팅을 생성할 AI 봇 정보
         self.email_to_name: dict[str, str] = self._generate_speaker_name_map()  # 발언자 이메일-이름 매핑 생성
 
 
-    def build_prompt_chunks(
+    async def build_prompt_chunks(
             self,
-            count_tokens_callback: Optional[Callable[[str], int]] = None,
+            count_tokens_callback: Optional[Callable[[str], Awaitable[int]]] = None,
             token_alloc: Optional[int] = None) -> list[str]:
         """
         프롬프트에 첨부하기 위한 회의 Context 텍스트를 토큰 수 제한을 고려하여 분할해 리스트에 담아 반환
 
         Args:
-            count_tokens_callback: 토큰 수 계산 콜백 함수 (선택 사항)
+            count_tokens_callback: 토큰 수 계산 비동기 콜백 함수 (선택 사항)
             token_alloc: Context에 할당된 최대 토큰 수 (선택 사항)
 
         Returns:
@@ -44,22 +50,19 @@ class MeetingHistoryBuilder:
 
         # 토큰 수 제한에 따른 분할 처리
         if count_tokens_callback and token_alloc:
-            return self._split_data_within_token_allocation(
+            return await self._pack_blocks_within_token_allocation(
                 topic_str, context_string_list, count_tokens_callback, token_alloc
             )
         else:  # 토큰 수 제한이 없는 경우 전체 텍스트 반환
             return [topic_str + '\n'.join(context_string_list)]
 
 
-    def _get_bot_info(self) -> Optional[UserInfo]:
+    def _get_bot_infos(self) -> list[UserInfo]:
         """
-        회의 참여자 목록에서 AI 봇을 찾아내 봇의 정보(UserInfo)를 반환
+        회의 참여자 목록에서 AI 봇을 모두 찾아내 봇의 정보(UserInfo) 리스트를 반환 (참여자 순서 유지)
         """
         pattern = r".*@ai\.com"
-        for p in self.participants:
-            if re.search(pattern, p.email):
-                return p
-        return None
+        return [p for p in self.participants if re.search(pattern, p.email)]
 
 
     def _generate_speaker_name_map(self) -> dict[str, str]:
@@ -98,59 +101,166 @@ class MeetingHistoryBuilder:
         안건 순서대로 정렬된 문자열 리스트를 반환(agenda_id 정렬 책임은 레포지토리에 있음)
         """
         context_string_list = []
-        for agenda_id, chat_list in self.chats.items():
-
-            # 채팅이 속한 안건 ID를 기반으로 안건명 구해 제목 텍스트 설정
+        for agenda_id in self.chats:
             sub_topic = self.agendas.get(agenda_id, '')
-            agenda_context_lines = [f"안건 {agenda_id}. {sub_topic}\n"]
+            agenda_context_lines = [f"안건 {agenda_id}. {sub_topic}\n"] + self._get_chat_lines(agenda_id)
+            context_string_list.append('\n'.join(agenda_context_lines))
 
-            for chat in chat_list:
-                # 채팅 송신자의 역할 알아내기
-                if chat.sender == self.host:  # 진행자 여부 검사
-                    speaker_role = "(진행자)"
-                elif chat.sender == self.bot.email:  # ai 봇 여부 검사
-                    speaker_role = "(YOU)"
-                else:
-                    speaker_role = ""
+        return context_string_list
 
-                speaker_name_str = self.email_to_name[chat.sender] + speaker_role
-                chat_str = f"{speaker_name_str}: {chat.message}\n"
+    def _get_chat_lines(self, agenda_id: str) -> list[str]:
+        """
+        특정 안건의 채팅 내역을 발언자 이름(역할 포함)과 발언으로 구성된 채팅 문자열 리스트로 변환
 
-                agenda_context_lines.append(chat_str)  # 해당 안건의 context에 채팅 문자열을 추가
+        Args:
+            agenda_id: 안건 ID
 
-            agenda_context_string = '\n'.join(agenda_context_lines)
-            context_string_list.append(agenda_context_string)
+        Returns:
+            채팅 1건당 1개의 문자열로 구성된 리스트 (시간 순서)
+        """
+        chat_lines = []
+        for chat in self.chats.get(agenda_id, []):
+            # 채팅 송신자의 역할 알아내기
+            if chat.sender == self.host:  # 진행자 여부 검사
+                speaker_role = "(진행자)"
+            elif chat.sender == self.bot.email:  # ai 봇 여부 검사
+                speaker_role = "(YOU)"
+            else:
+                speaker_role = ""
 
-        return context_string_list
+            speaker_name_str = self.email_to_name[chat.sender] + speaker_role
+            chat_lines.append(f"{speaker_name_str}: {chat.message}\n")
 
-    def _split_data_within_token_allocation(
-            self, topic: str, target: list[str],
-            count_tokens_callback: Callable[[str], int], token_alloc: int) -> list[str]:
+        return chat_lines
+
+    async def _pack_blocks_within_token_allocation(
+            self, topic: str, blocks: list[str],
+            count_tokens_callback: Callable[[str], Awaitable[int]], token_alloc: int) -> list[str]:
         """
-        재귀 호출 기반으로 할당된 토큰 수 내에서 텍스트를 분할해 리스트로 반환
+        안건별 Context 문자열(block)을 순서대로 묶어, 할당된 토큰 수를 넘지 않는 최소 개수의 Context 리스트로 반환
+
+        Note:
+            - 각 block의 토큰 수는 (동시에) 한 번씩만 계산하고, 앞에서부터 채워 넣는 단일 패스(greedy)로 묶음
+              (안건 순서를 유지하는 분할에서는 greedy 방식이 최소 분할 개수를 보장)
+            - 토큰 수 계산 호출 수는 (block 수 + 1 + Context 수)로 재귀 분할 방식보다 많지만, 호출을 동시에 보내고
+              전체 텍스트를 분할 단계마다 다시 세지 않으므로 계산하는 총 토큰 수는 더 적음
+            - 단일 안건의 block이 할당량을 넘으면 채팅 단위로 나눈 부분 block(window)들로 대체
+            - Context 문자열은 block 리스트를 모아 한 번만 join하여 생성
+            - block별 토큰 수 합은 근사값이므로 완성된 Context마다 한 번 더 검증하고,
+              초과 시 마지막 block을 다음 Context로 넘김
 
         Args:
-            topic_str: 회의 주제
-            target_list: 안건별 Context 문자열 리스트
-            count_tokens_callback: 토큰 수 계산 콜백 함수 (선택 사항)
-            token_alloc: Context에 할당된 최대 토큰 수 (선택 사항)
+            topic: 회의 주제 문자열 (모든 Context의 앞에 첨부)
+            blocks: 안건별 Context 문자열 리스트 (self.chats의 안건 순서)
+            count_tokens_callback: 토큰 수 계산 비동기 콜백 함수
+            token_alloc: Context에 할당된 최대 토큰 수
 
         Returns:
             토큰 수 제한에 맞게 분할된 회의 Context 리스트
+
+        Raises:
+            PromptBuildError: 회의 주제나 단일 채팅 메세지만으로도 토큰 수 제한을 초과할 경우
         """
-        input_string = topic + '\n'.join(target)
-        if count_tokens_callback(input_string) > token_alloc:  # 토큰 수 제한 초과 시
-            if len(target) == 1:
-                raise PromptBuildError()    # 단일 요소도 제한 초과하면 예외 처리(발생 확률 매우 희박)
+        if not blocks:
+            return [topic]
 
-            # 반으로 분할해 토큰 수 제한에 걸리면 다시 분할하도록 재귀 호출
-            mid = len(target) // 2
-            left = self._split_data_within_token_allocation(
-                topic, target[:mid], count_tokens_callback, token_alloc
-            )
-            right = self._split_data_within_token_allocation(
-                topic, target[mid:], count_tokens_callback, token_alloc
-            )
-            return left + right     # 분할 완료
-        else:
-            return [input_string]   # 토큰 수 제한 초과하지 않으면 전체 텍스트 반환
+        # 주제와 각 block의 토큰 수를 동시에 한 번씩만 계산 (구분자 '\n' 몫으로 block당 1토큰 추가)
+        topic_tokens, *block_tokens = await asyncio.gather(
+            count_tokens_callback(topic), *[count_tokens_callback(block) for block in blocks]
+        )
+        block_budget = token_alloc - topic_tokens
+        if block_budget <= 0:
+            raise PromptBuildError("회의 주제만으로 Context 토큰 할당량 초과")
+
+        # 할당량을 넘는 안건은 채팅 단위의 부분 block으로 나누기
+        packable_blocks, packable_tokens = [], []
+        for agenda_id, block, tokens in zip(self.chats, blocks, block_tokens):
+            if tokens + 1 > block_budget:
+                windows = await self._split_agenda_into_windows(agenda_id, tokens, count_tokens_callback, block_budget)
+                packable_blocks.extend(window for window, _ in windows)
+                packable_tokens.extend(window_tokens + 1 for _, window_tokens in windows)
+            else:
+                packable_blocks.append(block)
+                packable_tokens.append(tokens + 1)
+
+        chunks = []
+        start = 0
+        while start < len(packable_blocks):
+            # 할당량을 넘기 전까지 block을 순서대로 채워 넣기 (첫 block은 항상 포함)
+            end, used = start, topic_tokens
+            while end < len(packable_blocks) and (end == start or used + packable_tokens[end] <= token_alloc):
+                used += packable_tokens[end]
+                end += 1
+
+            # 완성된 Context의 실제 토큰 수 검증 (초과 시 뒤쪽 block을 다음 Context로 넘김)
+            chunk = topic + '\n'.join(packable_blocks[start:end])
+            while await count_tokens_callback(chunk) > token_alloc:
+                if end - start == 1:
+                    raise PromptBuildError()  # 부분 block도 제한 초과하면 예외 처리(발생 확률 매우 희박)
+                end -= 1
+                chunk = topic + '\n'.join(packable_blocks[start:end])
+
+            chunks.append(chunk)
+            start = end
+
+        return chunks
+
+    async def _split_agenda_into_windows(
+            self, agenda_id: str, agenda_tokens: int,
+            count_tokens_callback: Callable[[str], Awaitable[int]], block_budget: int) -> list[tuple[str, int]]:
+        """
+        토큰 수 제한을 넘는 단일 안건의 채팅 내역을 채팅 메세지 경계에서 나누어 부분 block(window) 리스트로 반환
+
+        Note:
+            - 필요한 window 수를 토큰 수 비율로 먼저 구한 뒤, 채팅 문자열 길이 기준으로 고르게 나눔 (메세지 중간은 자르지 않음)
+            - 나눈 window 중 하나라도 제한을 넘으면 window 수를 두 배로 늘려 다시 나눔
+            - 각 window 제목에 안건 번호를 그대로 유지해, 요약 결과를 같은 안건(step)으로 병합할 수 있도록 함
+
+        Args:
+            agenda_id: 나눌 안건 ID
+            agenda_tokens: 안건 전체 Context의 토큰 수
+            count_tokens_callback: 토큰 수 계산 비동기 콜백 함수
+            block_budget: block 1개에 할당 가능한 최대 토큰 수
+
+        Returns:
+            (window 문자열, window 토큰 수) 리스트 (채팅 시간 순서)
+
+        Raises:
+            PromptBuildError: block 할당량이 없거나, 단일 채팅 메세지만으로도 토큰 수 제한을 초과할 경우
+        """
+        if block_budget <= 0:
+            raise PromptBuildError("안건 Context에 할당 가능한 토큰 없음")
+        chat_lines = self._get_chat_lines(agenda_id)
+        if not chat_lines:
+            raise PromptBuildError()  # 채팅 없이 안건 제목만으로 제한 초과
+        sub_topic = self.agendas.get(agenda_id, '')
+        window_cnt = min(len(chat_lines), -(-agenda_tokens // block_budget))  # 올림 나눗셈
+
+        while True:
+            line_groups = self._divide_lines_evenly(chat_lines, window_cnt)
+            windows = [
+                '\n'.join([f"안건 {agenda_id}. {sub_topic} (부분 {i}/{len(line_groups)})\n"] + lines)
+                for i, lines in enumerate(line_groups, start=1)
+            ]
+            window_tokens = await asyncio.gather(*[count_tokens_callback(window) for window in windows])
+
+            if all(tokens + 1 <= block_budget for tokens in window_tokens):
+                return list(zip(windows, window_tokens))
+            if window_cnt >= len(chat_lines):
+                raise PromptBuildError()  # 단일 메세지도 제한 초과하면 예외 처리(발생 확률 매우 희박)
+            window_cnt = min(len(chat_lines), window_cnt * 2)
+
+    @staticmethod
+    def _divide_lines_evenly(lines: list[str], group_cnt: int) -> list[list[str]]:
+
+        """문자열 리스트를 순서를 유지한 채 문자열 길이 합이 비슷한 group_cnt개의 그룹으로 나눔"""
+
+        per_group = sum(len(line) for line in lines) / group_cnt
+        groups: list[list[str]] = [[]]
+        acc = 0
+        for line in lines:
+            if groups[-1] and acc >= per_group * len(groups) and len(groups) < group_cnt:
+                groups.append([])
+            groups[-1].append(line)
+            acc += len(line)
+        return groups
@@ -0,0 +1,179 @@
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from google.genai import errors
+from google.genai.types import Content, CreateCachedContentConfig, Part, UpdateCachedContentConfig
+
+from Prompting.common.config import (
+    GEMINI_CONTEXT_CACHE_TTL_SECONDS, GEMINI_CONTEXT_CACHE_MIN_TOKENS, GEMINI_CONTEXT_CACHE_REFRESH_MARGIN_SECONDS
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StaticPrefix:
+    """
+    여러 요청이 그대로 공유하는 프롬프트 앞부분(정적 지시문)
+
+    Attributes:
+        name: prefix 종류 이름 (예: "chat:ENFP", "summary")
+        text: prefix 텍스트
+        version: 텍스트 내용 해시 (템플릿이 바뀌면 다른 캐시를 사용하도록 key에 포함)
+    """
+    name: str
+    text: str
+    version: str = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "version", hashlib.sha256(self.text.encode("utf-8")).hexdigest()[:12])
+
+
+@dataclass
+class _CacheEntry:
+    name: str  # 제공자 측 cached content 이름 (cachedContents/...)
+    expires_at: float  # 만료 시각 (time.time() 기준)
+
+
+class ContextCacheManager:
+    def __init__(self, token_counter: Callable[[str], int],
+                 ttl_seconds: int = GEMINI_CONTEXT_CACHE_TTL_SECONDS,
+                 min_tokens: int = GEMINI_CONTEXT_CACHE_MIN_TOKENS,
+                 refresh_margin_seconds: int = GEMINI_CONTEXT_CACHE_REFRESH_MARGIN_SECONDS):
+        """
+        정적 프롬프트 prefix를 Gemini 제공자 측 context cache(cached content)로 만들어 재사용하는 관리자
+
+        Note:
+            - (모델, prefix 이름, prefix 버전)마다 cached content를 하나 만들고, 이후 요청은 cached_content 이름만 전달
+            - prefix는 캐시 없이 보낼 때처럼 사용자 입력(contents)으로 캐시해, 캐시 사용 여부와 관계없이 모델이 같은 위치에서 읽도록 함
+              (system_instruction으로 옮기면 캐시 적중 여부에 따라 응답 경향이 달라질 수 있음)
+            - 만료 refresh_margin_seconds초 전부터는 TTL 연장(update)을 요청하고, 연장에 실패하면 새로 생성
+            - 같은 key의 생성/연장 요청이 동시에 들어오면 한 번만 보냄 (key별 lock)
+            - prefix가 min_tokens보다 짧거나 제공자가 생성을 거부(4xx)한 key는 이후 캐시 없이 처리 (호출 측에서 prefix를 인라인)
+            - 429/5xx 등 일시적인 생성 실패는 해당 요청만 캐시 없이 처리하고 다음 요청에서 다시 시도
+
+        Args:
+            token_counter: prefix 토큰 수 계산 함수 (min_tokens 비교용, 로컬 추정기 사용)
+            ttl_seconds: cached content 유지 시간(초)
+            min_tokens: context cache를 만들 최소 prefix 토큰 수 (제공자 최소 캐시 크기, gemini-2.0-flash 계열은 4096)
+            refresh_margin_seconds: 만료 몇 초 전부터 TTL을 연장할지
+        """
+        self.token_counter = token_counter
+        self.ttl_seconds = ttl_seconds
+        self.min_tokens = min_tokens
+        self.refresh_margin_seconds = refresh_margin_seconds
+
+        self._entries: dict[tuple[str, str, str], _CacheEntry] = {}  # (모델, prefix 이름, 버전) -> cached content
+        self._uncacheable: set[tuple[str, str, str]] = set()  # 캐시를 만들 수 없는 key
+        self._locks: dict[tuple[str, str, str], asyncio.Lock] = {}
+
+        # 통계 지표
+        self.hits = 0
+        self.creates = 0
+        self.refreshes = 0
+        self.bypassed = 0  # 캐시 없이 처리한 요청 수
+        self.failures = 0  # 생성/연장 실패 수
+
+    async def get_cache_name(self, caches, model: str, prefix: StaticPrefix) -> Optional[str]:
+        """
+        prefix의 cached content 이름을 반환 (없거나 만료가 가까우면 생성/연장)
+
+        Args:
+            caches: cached content 생성/연장에 사용할 google.genai 비동기 caches API (client.aio.caches)
+            model: 요청에 사용할 Gemini 모델 이름
+            prefix: 캐시할 정적 prefix
+
+        Returns:
+            cached content 이름 (캐시를 사용할 수 없으면 None)
+        """
+        key = (model, prefix.name, prefix.version)
+        entry = self._entries.get(key)
+        if entry and not self._needs_refresh(entry):
+            self.hits += 1
+            return entry.name
+        if key in self._uncacheable:
+            self.bypassed += 1
+            return None
+
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            entry = self._entries.get(key)
+            if entry is None or self._needs_refresh(entry):  # lock 대기 중 다른 요청이 갱신했으면 그대로 사용
+                entry = await self._create_or_refresh(caches, key, model, prefix, entry)
+
+        if entry is None:
+            self.bypassed += 1
+            return None
+        self.hits += 1
+        return entry.name
+
+    def invalidate(self, model: str, prefix: StaticPrefix):
+
+        """제공자 측에서 사라진(만료/삭제) cached content를 목록에서 제거 (다음 요청에서 새로 생성)"""
+
+        self._entries.pop((model, prefix.name, prefix.version), None)
+
+    def stats(self) -> dict[str, Any]:
+
+        """유지 중인 cached content 수, cached content를 사용한(hits)/캐시 없이 처리한(bypassed) 요청 수, 생성/연장/실패 횟수"""
+
+        return {
+            "entries": len(self._entries),
+            "uncacheable": len(self._uncacheable),
+            "hits": self.hits,
+            "creates": self.creates,
+            "refreshes": self.refreshes,
+            "bypassed": self.bypassed,
+            "failures": self.failures,
+        }
+
+    def _needs_refresh(self, entry: _CacheEntry) -> bool:
+        return entry.expires_at - self.refresh_margin_seconds <= time.time()
+
+    async def _create_or_refresh(self, caches, key: tuple[str, str, str], model: str, prefix: StaticPrefix,
+                                 entry: Optional[_CacheEntry]) -> Optional[_CacheEntry]:
+
+        """만료가 가까운 cached content의 TTL을 연장하고, 없거나 연장에 실패하면 새로 생성 (실패 시 None)"""
+
+        if entry is None and self.token_counter(prefix.text) < self.min_tokens:
+            self._uncacheable.add(key)
+            return None
+
+        ttl = f"{self.ttl_seconds}s"
+        try:
+            if entry is not None and entry.expires_at > time.time():
+                try:
+                    cached = await caches.update(name=entry.name, config=UpdateCachedContentConfig(ttl=ttl))
+                    self.refreshes += 1
+                    return self._store(key, cached.name or entry.name, cached.expire_time)
+                except errors.ClientError:  # 이미 만료/삭제된 경우 새로 생성
+                    pass
+
+            cached = await caches.create(model=model, config=CreateCachedContentConfig(
+                contents=[Content(role="user", parts=[Part(text=prefix.text)])],
+                ttl=ttl, display_name=f"{prefix.name}:{prefix.version}"
+            ))
+            self.creates += 1
+            return self._store(key, cached.name, cached.expire_time)
+        except Exception as e:
+            self.failures += 1
+            self._entries.pop(key, None)
+            if isinstance(e, errors.ClientError) and e.code != 429:  # 모델 미지원, 최소 크기 미달 등 재시도해도 실패하는 경우
+                self._uncacheable.add(key)
+                logger.warning("context cache 생성 불가, 이후 캐시 없이 처리 (%s): %s", prefix.name, e)
+            elif entry is not None and entry.expires_at > time.time():  # 연장에 실패했지만 아직 만료 전이면 계속 사용
+                logger.warning("context cache 연장 실패, 만료 전까지 기존 캐시 사용 (%s): %s", prefix.name, e)
+                self._entries[key] = entry
+                return entry
+            else:
+                logger.warning("context cache 생성 실패, 이번 요청은 캐시 없이 처리 (%s): %s", prefix.name, e)
+        return None
+
+    def _store(self, key: tuple[str, str, str], name: str, expire_time) -> _CacheEntry:
+        expires_at = expire_time.timestamp() if expire_time else time.time() + self.ttl_seconds
+        entry = _CacheEntry(name=name, expires_at=expires_at)
+        self._entries[key] = entry
+        return entry
@@ -1,40 +1,228 @@
-import os
-from dotenv import load_dotenv
-from typing import Optional, cast
+import json
+from typing import AsyncIterator, Optional, cast
 
-from google.genai import Client
+import requests
+from requests.adapters import HTTPAdapter
+from google.genai import Client, errors, __version__ as GENAI_VERSION
+from google.genai._api_client import HttpRequest, HttpResponse
 from google.genai.types import GenerateContentResponse, GenerateContentConfig
 
+from Prompting.common.config import GEMINI_API_KEY, GEMINI_POOL_SIZE
+from .token_count_cache import TokenCountCache
+from .token_estimator import TokenEstimator
+from .rate_limiter import GeminiRateLimiter
+from .hedging import HedgingPolicy
+from .model_router import ModelRouter, MODEL_REGISTRY
+from .context_cache import ContextCacheManager, StaticPrefix
+
 import asyncio                  # 비동기 처리
 import concurrent.futures       # API 호출용 스레드 관리
 import functools                # 키워드 인자를 미리 함수에 고정하기 위해 사용
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 전송 계층 교체(SDK 내부 구현 의존)를 검증한 google-genai 버전 (requirements.txt의 고정 버전과 함께 갱신)
+SUPPORTED_GENAI_VERSIONS = ("1.0.0",)
+
+
+def _supports_sdk_internals(target, attributes: tuple[str, ...]) -> bool:
+
+    """SDK 내부 구현을 교체할 수 있는지 확인 (검증한 google-genai 버전이고 target에 교체할 내부 속성이 모두 있을 때만 True)"""
+
+    return GENAI_VERSION in SUPPORTED_GENAI_VERSIONS and all(hasattr(target, name) for name in attributes)
+
+
+class _ExecutorStreamResponse(HttpResponse):
+    def __init__(self, headers: dict[str, str], response_stream, executor: concurrent.futures.ThreadPoolExecutor):
+        """
+        스트리밍 응답의 다음 조각을 공유 스레드 풀에서 읽는 HttpResponse
+
+        Note:
+            - SDK(google-genai 1.0.0)의 HttpResponse는 비동기 순회 시에도 소켓에서 다음 줄을 동기적으로 읽어
+              이벤트 루프를 막으므로, 다음 조각 읽기를 스레드 풀에 위임
+            - SDK HttpResponse의 내부 속성(segment_iterator)에 의존하므로 is_supported()가 True일 때만 사용
+        """
+        super().__init__(headers, response_stream)
+        self._executor = executor
+
+    async def __anext__(self):
+        loop = asyncio.get_running_loop()
+        segment = await loop.run_in_executor(self._executor, next, self.segment_iterator, None)
+        if segment is None:
+            raise StopAsyncIteration
+        return segment
+
+    @staticmethod
+    def is_supported() -> bool:
+
+        """현재 SDK 버전에서 다음 조각 읽기를 스레드 풀에 위임할 수 있는지 확인"""
+
+        return _supports_sdk_internals(HttpResponse(headers={}), ("response_stream", "segment_iterator"))
 
 
 class GeminiClient:
     DEFAULT_MODEL = "gemini-2.0-flash"  # 사용할 Gemini 모델 이름 미설정 시 기본값
-    INPUT_TOKEN_LIMIT = 1048576  # 기본 모델 입력 토큰 제한 수
-    OUTPUT_TOKEN_LIMIT = 8192  # 기본 모델 출력 토큰 제한 수
+    INPUT_TOKEN_LIMIT = MODEL_REGISTRY[DEFAULT_MODEL].input_token_limit  # 기본 모델 입력 토큰 제한 수
+    OUTPUT_TOKEN_LIMIT = MODEL_REGISTRY[DEFAULT_MODEL].output_token_limit  # 기본 모델 출력 토큰 제한 수
+    EXPECTED_OUTPUT_TOKENS = 1024  # rate limiter에 요청 전 미리 차감할 예상 출력 토큰 수 (응답 후 실제 사용량으로 정산)
 
-    def __init__(self):
+    def __init__(self, executor: Optional[concurrent.futures.ThreadPoolExecutor] = None,
+                 pool_size: int = GEMINI_POOL_SIZE, api_key: Optional[str] = None,
+                 token_count_cache: Optional[TokenCountCache] = None,
+                 rate_limiter: Optional[GeminiRateLimiter] = None, base_url: Optional[str] = None,
+                 hedging_policy: Optional[HedgingPolicy] = None, model_router: Optional[ModelRouter] = None,
+                 context_cache: Optional[ContextCacheManager] = None):
         """
         Gemini 호출을 위한 공통 API 클라이언트 정의
 
         주요 기능:
          - 요청 텍스트의 토큰 수 계산
          - 텍스트(JSON 문자열 포함) 생성을 요청
-         - 비동기적인 API 호출을 지원 (지원되지 않는 배치 처리 구현을 위해)
+         - 비동기적인 API 호출을 지원 (이벤트 루프 비점유 및 다수 프롬프트 동시 처리)
+
+        Note:
+            - 프로세스 전체에서 하나의 인스턴스를 공유하도록 설계 (FastAPI lifespan에서 생성, di.py로 주입)
+            - SDK(google-genai 1.0.0)는 요청마다 새 HTTP 세션을 만들고 비동기 호출을 기본 스레드 풀에 위임하므로,
+              keep-alive 연결을 재사용하는 공유 세션과 크기가 제한된 공유 스레드 풀로 전송 계층을 교체
+            - rate_limiter가 있으면 모든 생성 요청이 RPM/TPM 할당량 대기열을 거치고, 429/5xx 응답은 백오프 후 재시도
+            - hedging_policy가 있으면 hedge=True로 요청한 짧은 대화형 호출이 느릴 때 중복 요청을 보내 먼저 온 응답을 사용
+            - 각 서비스는 model_router로 요청별 모델을 선택해 model 인자로 전달 (미지정 시 DEFAULT_MODEL)
+            - 생성 요청에 정적 prefix를 함께 전달하면, context_cache가 있을 때 제공자 측 cached content로 재사용하고
+              없거나 캐시를 만들 수 없으면 prefix를 프롬프트 앞에 그대로 붙여 전송
+
+        Args:
+            executor: API 호출에 사용할 공유 스레드 풀 (미지정 시 pool_size 크기로 자체 생성)
+            pool_size: 재사용할 HTTP keep-alive 연결 수
+            api_key: Gemini API 키 (미지정 시 환경 변수 GEMINI_API_KEY 사용)
+            token_count_cache: 토큰 수 계산 결과 캐시 (미지정 시 캐시 없이 매번 계산)
+            rate_limiter: 프로세스 공유 RPM/TPM limiter (미지정 시 할당량 대기 및 재시도 없이 바로 호출)
+            base_url: Gemini API 주소 (미지정 시 SDK 기본값, 로컬 테스트 서버 연결용)
+            hedging_policy: 대화형 호출의 hedged request 정책 (미지정 시 hedge 없이 호출)
+            model_router: 서비스별 모델 라우팅 정책 (미지정 시 환경 변수 기반 기본 정책)
+            context_cache: 정적 prefix의 제공자 측 context cache 관리자 (미지정 시 prefix를 매 요청에 포함)
+        """
+        http_options = {"base_url": base_url} if base_url else None
+        self.client = Client(api_key=api_key or GEMINI_API_KEY, http_options=http_options)  # Gemini 클라이언트 초기화
+
+        # 연결 재사용을 위한 공유 HTTP 세션
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)  # base_url로 지정한 로컬 테스트 서버용
+
+        # API 호출용 공유 스레드 풀 (외부에서 주입받은 경우 종료 책임은 주입한 쪽에 있음)
+        self._owns_executor = executor is None
+        self.executor = executor or concurrent.futures.ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix="gemini"
+        )
+
+        self.token_count_cache = token_count_cache  # 동일 텍스트의 반복 토큰 수 계산 방지용 캐시
+        self.rate_limiter = rate_limiter  # RPM/TPM 할당량 limiter
+        self.hedging_policy = hedging_policy  # 대화형 호출의 tail latency 단축용 hedge 정책
+        self.model_router = model_router or ModelRouter()  # 서비스/입력 토큰 수별 모델 선택 정책
+        self.context_cache = context_cache  # 정적 prefix 재사용용 제공자 측 context cache
+        self.token_estimator = TokenEstimator()  # limiter 사전 차감용 입력 토큰 수 추정기
+
+        self._install_pooled_transport()
+
+
+    def _install_pooled_transport(self):
+        """
+        SDK 내부 API 클라이언트의 HTTP 요청 경로를 공유 세션/공유 스레드 풀 기반으로 교체
+
+        Note:
+            - SDK의 private 메서드를 덮어쓰므로, 검증하지 않은 SDK 버전이거나 교체할 내부 속성이 없으면
+              경고를 남기고 SDK 기본 전송 계층을 그대로 사용
+            - 스트리밍 응답 조각 읽기의 스레드 풀 위임도 같은 방식으로 확인해, 지원하지 않으면 SDK 스트리밍 응답을 그대로 사용
         """
-        load_dotenv()  # .env 파일 로드
-        GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")  # 환경 변수에서 Gemini API 키 읽기
-        self.client = Client(api_key=GEMINI_API_KEY)  # Gemini 클라이언트 초기화
+        api_client = getattr(self.client, "_api_client", None)
+        if not _supports_sdk_internals(api_client, ("_request", "_request_unauthorized", "_async_request")):
+            logger.warning("google-genai %s는 공유 HTTP 세션 전송 계층을 지원하지 않아 SDK 기본 전송 계층 사용 (지원 버전: %s)",
+                           GENAI_VERSION, ", ".join(SUPPORTED_GENAI_VERSIONS))
+            return
+
+        session = self.session
+        executor = self.executor
+        stream_in_executor = _ExecutorStreamResponse.is_supported()
+        if not stream_in_executor:
+            logger.warning("google-genai %s는 스트리밍 응답 조각의 스레드 풀 읽기를 지원하지 않아 SDK 스트리밍 응답 사용",
+                           GENAI_VERSION)
+
+        def request_unauthorized(http_request: HttpRequest, stream: bool = False) -> HttpResponse:
+            data = None
+            if http_request.data:
+                data = http_request.data if isinstance(http_request.data, bytes) else json.dumps(http_request.data)
+
+            response = session.request(
+                method=http_request.method,
+                url=http_request.url,
+                headers=http_request.headers,
+                data=data,
+                timeout=http_request.timeout,
+                stream=stream,
+            )
+            errors.APIError.raise_for_response(response)
+            return HttpResponse(response.headers, response if stream else [response.text])
+
+        async def async_request(http_request: HttpRequest, stream: bool = False) -> HttpResponse:
+            loop = asyncio.get_running_loop()
+            request_with_options = functools.partial(api_client._request, http_request, stream=stream)
+            response = await loop.run_in_executor(executor, request_with_options)
+            if stream and stream_in_executor:  # 스트리밍 응답 조각도 이벤트 루프를 막지 않고 읽기
+                return _ExecutorStreamResponse(response.headers, response.response_stream, executor)
+            return response
+
+        api_client._request_unauthorized = request_unauthorized
+        api_client._async_request = async_request
+
+
+    async def warm_up(self):
+
+        """서버 시작 시 Gemini API와의 연결을 미리 맺어 첫 요청의 연결 수립 비용을 제거 (실패해도 서버 기동은 계속)"""
+
+        try:
+            await self.client.aio.models.get(model=self.DEFAULT_MODEL)
+        except Exception as e:
+            logger.warning("Gemini API 연결 warm-up 실패: %s", e)
+
+
+    def close(self):
 
+        """(자체 생성한) 스레드 풀과 공유 HTTP 세션을 정리 (진행 중인 호출이 끝난 뒤 세션을 닫음)"""
 
-    def count_tokens(self, text: str) -> int:
+        if self._owns_executor:
+            self.executor.shutdown(wait=True)
+        self.session.close()
 
-        """주어진 텍스트의 토큰 수 계산"""
+
+    def count_tokens(self, text: str, model: Optional[str] = None) -> int:
+
+        """주어진 텍스트의 model 기준 토큰 수 계산 (model 미지정 시 DEFAULT_MODEL)"""
 
         token_cnt = self.client.models.count_tokens(
-            model='gemini-2.0-flash',   # 토큰 수 계산 기준 모델 지정
+            model=model or self.DEFAULT_MODEL,   # 토큰 수 계산 기준 모델 지정
+            contents=text)
+        return token_cnt.total_tokens
+
+
+    async def count_tokens_async(self, text: str, model: Optional[str] = None) -> int:
+
+        """주어진 텍스트의 model 기준 토큰 수를 비동기적으로 계산 (이벤트 루프를 막지 않음, 캐시가 있으면 캐시 우선 조회)"""
+
+        model = model or self.DEFAULT_MODEL
+        count_remote = functools.partial(self._count_tokens_remote, model=model)
+        if self.token_count_cache:
+            return await self.token_count_cache.get_or_count(text, model, count_remote)
+        return await count_remote(text)
+
+
+    async def _count_tokens_remote(self, text: str, model: Optional[str] = None) -> int:
+
+        """Gemini API로 주어진 텍스트의 model 기준 토큰 수를 계산"""
+
+        token_cnt = await self.client.aio.models.count_tokens(
+            model=model or self.DEFAULT_MODEL,   # 토큰 수 계산 기준 모델 지정
             contents=text)
         return token_cnt.total_tokens
 
@@ -46,12 +234,16 @@ class GeminiClient:
             model: Optional[str] = None
     ) -> GenerateContentResponse:
         """
-        Gemini API로 텍스트 생성을 요청하여 응답을 반환
+        Gemini API로 텍스트 생성을 요청하여 응답을 반환 (동기 호출)
+
+        Note:
+             - 호출 동안 현재 스레드를 점유하므로 FastAPI 엔드포인트 등 이벤트 루프 위에서는
+               self.generate_content_async()를 사용할 것
 
         Args:
             prompt: 입력 프롬프트 텍스트
             config: 요청에 사용될 Generation 설정
-            model: 사용할 Gemini 모델 이름 (기본값: gemini-2.0-flash)
+            model: 사용할 Gemini 모델 이름 (기본값: DEFAULT_MODEL)
 
         Returns:
             생성된 텍스트 응답 객체 (GenerateContentResponse)
@@ -68,41 +260,178 @@ class GeminiClient:
             self,
             prompt: str,
             config: Optional[GenerateContentConfig] = None,
-            model: Optional[str] = None
+            model: Optional[str] = None,
+            hedge: bool = False,
+            prefix: Optional[StaticPrefix] = None
     ) -> GenerateContentResponse:
         """
         Gemini API 텍스트 생성 요청을 비동기적으로 실행하여 응답을 반환
 
         Note:
-             - self.process_prompts()에서 다수의 프롬프트 요청 처리를 위해 고안
-             - 단일 요청은 self.generate_content() 활용할 것)
-        """
-        with concurrent.futures.ThreadPoolExecutor() as executor:  # 스레드 풀을 사용하여 API 호출
-            loop = asyncio.get_running_loop()  # 현재 실행 중인 이벤트 루프 가져오기
-
-            # functools.partial을 사용하여 키워드 인자 고정
-            generate_content_with_config = functools.partial(
-                self.client.models.generate_content,
-                model=model if model else self.DEFAULT_MODEL,
-                contents=prompt,
-                config=config,
+             - SDK의 비동기 클라이언트(client.aio)를 사용하므로 응답 대기 중에도 이벤트 루프가 다른 요청을 처리할 수 있음
+             - 단일 요청과 self.process_prompts()의 다수 요청 처리 모두에 사용
+             - rate_limiter가 있으면 할당량 여유가 생길 때까지 대기한 뒤 호출하고, 429/5xx 응답은 재시도
+             - hedge=True이고 hedging_policy가 있으면 느린 요청에 중복 요청을 보내 먼저 성공한 응답을 사용
+               (중복 요청도 rate_limiter를 거침, 출력이 짧은 대화형 호출에만 사용할 것)
+
+        Args:
+            prompt: 입력 프롬프트 텍스트
+            config: 요청에 사용될 Generation 설정
+            model: 사용할 Gemini 모델 이름 (기본값: DEFAULT_MODEL)
+            hedge: hedged request 적용 여부 (기본값: False)
+            prefix: 프롬프트 앞에 붙는 정적 prefix (context cache 대상, 미지정 시 prompt만 전송)
+
+        Returns:
+            생성된 텍스트 응답 객체 (GenerateContentResponse)
+        """
+        call = functools.partial(self._generate_content_once, prompt, config, model, prefix)
+        if hedge and self.hedging_policy is not None:
+            return await self.hedging_policy.run(call)
+        return await call()
+
+
+    async def _generate_content_once(
+            self,
+            prompt: str,
+            config: Optional[GenerateContentConfig],
+            model: Optional[str],
+            prefix: Optional[StaticPrefix] = None
+    ) -> GenerateContentResponse:
+
+        """Gemini API 텍스트 생성 요청 1회 (prefix 캐시 적용, 사라진 캐시는 prefix를 붙여 한 번 더 요청)"""
+
+        model = model if model else self.DEFAULT_MODEL
+        contents, request_config = await self._attach_prefix(prompt, config, model, prefix)
+        try:
+            return await self._send_generate_request(contents, request_config, model)
+        except errors.ClientError as e:
+            if not self._is_missing_cached_content(e, request_config):
+                raise
+            self.context_cache.invalidate(model, prefix)
+            return await self._send_generate_request(prefix.text + prompt, config, model)
+
+
+    async def _send_generate_request(
+            self,
+            prompt: str,
+            config: Optional[GenerateContentConfig],
+            model: str
+    ) -> GenerateContentResponse:
+
+        """Gemini API 텍스트 생성 요청 전송 (rate_limiter가 있으면 할당량 대기 및 재시도 포함)"""
+
+        call = functools.partial(
+            self.client.aio.models.generate_content,
+            model=model,
+            contents=prompt,
+            config=config,
+        )
+        if self.rate_limiter is None:
+            return await call()
+
+        max_output_tokens = (config.max_output_tokens if config else None) or self.OUTPUT_TOKEN_LIMIT
+        estimated_tokens = self.token_estimator.estimate(prompt) + min(max_output_tokens, self.EXPECTED_OUTPUT_TOKENS)
+        return await self.rate_limiter.run(call, estimated_tokens)
+
+
+    async def generate_content_stream_async(
+            self,
+            prompt: str,
+            config: Optional[GenerateContentConfig] = None,
+            model: Optional[str] = None,
+            prefix: Optional[StaticPrefix] = None
+    ) -> AsyncIterator[str]:
+        """
+        Gemini API 스트리밍 텍스트 생성을 요청하여, 생성되는 텍스트 조각을 차례로 반환
+
+        Note:
+             - 첫 조각이 생성되는 즉시 반환하므로, 전체 응답 생성 시간 대신 첫 토큰까지의 시간만 기다리면 됨
+             - rate_limiter가 있으면 할당량 여유가 생길 때까지 대기한 뒤 요청 (스트림 도중 실패는 재시도하지 않음)
+
+        Args:
+            prompt: 입력 프롬프트 텍스트
+            config: 요청에 사용될 Generation 설정
+            model: 사용할 Gemini 모델 이름 (기본값: DEFAULT_MODEL)
+            prefix: 프롬프트 앞에 붙는 정적 prefix (context cache 대상, 미지정 시 prompt만 전송)
+
+        Returns:
+            생성된 텍스트 조각의 비동기 iterator
+        """
+        model = model if model else self.DEFAULT_MODEL
+        contents, request_config = await self._attach_prefix(prompt, config, model, prefix)
+
+        estimated_tokens = 0
+        if self.rate_limiter is not None:
+            max_output_tokens = (config.max_output_tokens if config else None) or self.OUTPUT_TOKEN_LIMIT
+            estimated_tokens = self.token_estimator.estimate(contents) + min(max_output_tokens, self.EXPECTED_OUTPUT_TOKENS)
+            await self.rate_limiter.acquire(estimated_tokens)
+
+        try:
+            stream = await self.client.aio.models.generate_content_stream(
+                model=model, contents=contents, config=request_config
+            )
+        except errors.ClientError as e:
+            if not self._is_missing_cached_content(e, request_config):
+                raise
+            self.context_cache.invalidate(model, prefix)
+            stream = await self.client.aio.models.generate_content_stream(
+                model=model, contents=prefix.text + prompt, config=config
             )
+        chunk = None
+        async for chunk in stream:
+            if chunk.text:
+                yield chunk.text
 
-            # 별도의 스레드에서 API 호출 실행
-            response = await loop.run_in_executor(executor, generate_content_with_config)
-            return response
+        if self.rate_limiter is not None and chunk is not None:  # 마지막 조각의 사용량으로 할당량 정산
+            self.rate_limiter.settle(estimated_tokens, self.rate_limiter.used_tokens(chunk))
 
 
     async def process_prompts(
             self,
             prompts: list[str],
             config: Optional[GenerateContentConfig] = None,
-            model: Optional[str] = None
+            model: Optional[str] = None,
+            prefix: Optional[StaticPrefix] = None
     ) -> list[GenerateContentResponse]:
         """
         여러 개의 요청 프롬프트를 비동기적으로 처리하여 응답 리스트를 반환
-        (프롬프트 입력 순서에 따른 응답 순서 보장)
+        (프롬프트 입력 순서에 따른 응답 순서 보장, prefix는 모든 프롬프트에 공통 적용)
         """
-        tasks = [self.generate_content_async(prompt, config, model) for prompt in prompts]
+        tasks = [self.generate_content_async(prompt, config, model, prefix=prefix) for prompt in prompts]
         results = await asyncio.gather(*tasks)
         return cast(list[GenerateContentResponse], results)
+
+
+    async def _attach_prefix(
+            self,
+            prompt: str,
+            config: Optional[GenerateContentConfig],
+            model: str,
+            prefix: Optional[StaticPrefix]
+    ) -> tuple[str, Optional[GenerateContentConfig]]:
+        """
+        정적 prefix를 요청에 반영한 (전송할 프롬프트, Generation 설정)을 반환
+
+        Note:
+            - context cache를 사용할 수 있으면 prompt는 그대로 두고 설정에 cached content 이름을 지정
+            - 사용할 수 없으면(context_cache 미사용, 최소 크기 미달, 생성 실패 등) prefix를 prompt 앞에 붙임
+        """
+        if prefix is None:
+            return prompt, config
+
+        cache_name = None
+        if self.context_cache is not None:
+            cache_name = await self.context_cache.get_cache_name(self.client.aio.caches, model, prefix)
+        if cache_name is None:
+            return prefix.text + prompt, config
+
+        config = (config or GenerateContentConfig()).model_copy(update={"cached_content": cache_name})
+        return prompt, config
+
+
+    @staticmethod
+    def _is_missing_cached_content(error: errors.ClientError, config: Optional[GenerateContentConfig]) -> bool:
+
+        """cached content를 지정한 요청이 캐시 만료/삭제로 거부되었는지 확인"""
+
+        return bool(config and config.cached_content) and error.code in (403, 404)
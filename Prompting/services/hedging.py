@@ -0,0 +1,141 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from Prompting.common.config import GEMINI_HEDGE_PERCENTILE, GEMINI_HEDGE_MAX_EXTRA_RATIO, GEMINI_HEDGE_MIN_SAMPLES
+
+T = TypeVar("T")
+
+
+class HedgingPolicy:
+    LATENCY_WINDOW_SIZE = 200  # hedge 기준 지연 시간 계산에 사용할 최근 응답 수
+
+    def __init__(self, percentile: float = GEMINI_HEDGE_PERCENTILE,
+                 max_extra_ratio: float = GEMINI_HEDGE_MAX_EXTRA_RATIO,
+                 min_samples: int = GEMINI_HEDGE_MIN_SAMPLES):
+        """
+        짧은 대화형 Gemini 호출의 tail latency를 줄이기 위한 hedged request 정책
+
+        Note:
+            - 요청이 최근 응답 지연 시간의 percentile 값(예: p95)까지 끝나지 않으면 같은 요청을 한 번 더 보내고,
+              먼저 성공한 응답을 사용한 뒤 나머지 요청은 취소
+            - 추가 요청 수는 전체 요청 수의 max_extra_ratio 비율 이하로 제한 (Gemini 사용량 상한)
+            - 최근 응답이 min_samples개 미만이면 기준값을 정할 수 없으므로 hedge하지 않음
+            - 지연 시간 표본은 응답한 요청 자신의 지연 시간 (hedge 요청은 hedge를 보낸 시점부터 측정해,
+              먼저 보낸 요청의 대기 시간이 표본에 섞여 기준값이 점점 커지지 않도록 함)
+            - hedge로 절약한 시간은, 먼저 보낸 요청이 hedge 승리 시점보다 오래 걸렸던 최근 응답들의 평균 지연 시간으로 추정
+
+        Args:
+            percentile: hedge 요청을 보낼 기준 지연 시간 percentile (0~1)
+            max_extra_ratio: 전체 요청 수 대비 추가(hedge) 요청 수 상한 비율
+            min_samples: hedge를 시작하기 위한 최소 지연 시간 표본 수
+        """
+        self.percentile = percentile
+        self.max_extra_ratio = max_extra_ratio
+        self.min_samples = min_samples
+        self._latencies: deque[float] = deque(maxlen=self.LATENCY_WINDOW_SIZE)  # 최근 응답 지연 시간(초)
+
+        # 통계 지표
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.latency_saved_seconds = 0.0
+
+    def hedge_delay(self) -> Optional[float]:
+
+        """hedge 요청을 보낼 기준 지연 시간(초). 표본이 부족하면 None"""
+
+        if len(self._latencies) < self.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * self.percentile))]
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        call을 실행하고, 기준 지연 시간이 지나도 끝나지 않으면 hedge 요청을 추가로 보내 먼저 성공한 결과를 반환
+
+        Args:
+            call: Gemini API를 호출하는 비동기 함수 (인자 없이 호출, hedge 시 한 번 더 호출)
+
+        Returns:
+            먼저 성공한 요청의 반환값
+
+        Raises:
+            Exception: 모든 요청이 실패한 경우 먼저 실패한 요청의 예외
+        """
+        self.requests += 1
+        start = time.monotonic()
+        primary = asyncio.ensure_future(call())
+        delay = self.hedge_delay()
+
+        if delay is not None and self._within_budget():
+            try:
+                done, _ = await asyncio.wait({primary}, timeout=delay)
+            except asyncio.CancelledError:
+                primary.cancel()  # 호출한 쪽이 취소되면 진행 중인 요청도 취소
+                raise
+            if not done:
+                return await self._race_with_hedge(primary, call, start)
+
+        result = await primary
+        self._latencies.append(time.monotonic() - start)
+        return result
+
+    def stats(self) -> dict[str, Any]:
+
+        """hedge 비율, hedge 승리 횟수, 추정 절약 시간 및 현재 기준 지연 시간"""
+
+        delay = self.hedge_delay()
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_rate": round(self.hedged / self.requests, 4) if self.requests else 0.0,
+            "hedge_wins": self.hedge_wins,
+            "latency_saved_seconds": round(self.latency_saved_seconds, 4),
+            "hedge_delay_seconds": round(delay, 4) if delay is not None else None,
+        }
+
+    async def _race_with_hedge(self, primary: asyncio.Future, call: Callable[[], Awaitable[T]], start: float) -> T:
+
+        """hedge 요청을 보내고 두 요청 중 먼저 성공한 결과를 반환 (남은 요청은 취소)"""
+
+        self.hedged += 1
+        hedge_start = time.monotonic()
+        hedge = asyncio.ensure_future(call())
+        pending = {primary, hedge}
+        first_error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        first_error = first_error or task.exception()
+                        continue
+
+                    now = time.monotonic()
+                    elapsed = now - start
+                    if task is hedge:
+                        self.hedge_wins += 1
+                        self.latency_saved_seconds += self._estimate_unhedged_latency(elapsed) - elapsed
+                        self._latencies.append(now - hedge_start)  # hedge 요청 자신의 지연 시간
+                    else:
+                        self._latencies.append(elapsed)
+                    return task.result()
+            raise first_error
+        finally:
+            for task in pending:
+                task.cancel()  # 늦은 요청 취소
+
+    def _estimate_unhedged_latency(self, elapsed: float) -> float:
+
+        """먼저 보낸 요청이 elapsed초 넘게 걸렸을 때의 예상 지연 시간 (elapsed보다 오래 걸린 최근 응답들의 평균)"""
+
+        slower = [latency for latency in self._latencies if latency > elapsed]
+        return sum(slower) / len(slower) if slower else elapsed
+
+    def _within_budget(self) -> bool:
+
+        """추가 요청 수가 상한 비율 이내인지 확인"""
+
+        return self.hedged < self.requests * self.max_extra_ratio
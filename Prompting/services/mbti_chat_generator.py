@@ -1,8 +1,14 @@
+import asyncio
+import functools
+from typing import AsyncIterator, Optional, Union
 from .gemini_client import GeminiClient
+from .model_router import ModelRouter, ModelSpec
+from .context_cache import StaticPrefix
+from .token_estimator import TokenEstimator, LimitAwareTokenCounter
 from google.genai.types import GenerateContentConfig
 from Prompting.services.context_builders import MbtiTraitBuilder, MeetingHistoryBuilder
-from .templates import CHAT_CONTEXT_KR, CHAT_PROMPT_KR
-from Prompting.usecases.meeting_context import MeetingContext
+from .templates import CHAT_CONTEXT_KR, CHAT_INSTRUCTION_KR, CHAT_MEETING_KR, CHAT_TRAIT_KR
+from Prompting.usecases.meeting_context import MeetingContext, UserInfo
 from Prompting.exceptions import GeminiCallError, PromptBuildError, catch_and_raise
 from Prompting.schemas import ChatRequest, ChatResponse
 
@@ -10,20 +16,27 @@ from Prompting.schemas import ChatRequest, ChatResponse
 class MbtiChatGenerator:
     HANGEUL_ZA_LIMIT = 300  # 봇의 채팅을 한글 기준 몇 자 이내로 생성할 지
 
-    def __init__(self, mbti_instruction_file_path: str = None,
+    def __init__(self, client: Optional[GeminiClient] = None, token_estimator: Optional[TokenEstimator] = None,
+                 mbti_instruction_file_path: str = None,
                  temperature: float = 1.5, top_p: float = 0.95, top_k: int = 40):
         """
         Gemini API로 MBTI 성향이 반영된 가상 참여자의 채팅을 생성
 
         Args:
+            client: 공유 Gemini API 클라이언트 (미지정 시 새로 생성)
+            token_estimator: 직전 채팅 내역 분할에 사용할 로컬 토큰 추정기 (미지정 시 기본 추정기 사용)
             mbti_instruction_file_path: 모델이 참조할 MBTI 정보가 담긴 JSON 파일의 경로
             temperature: 모델의 온도 설정 (기본값: 1, 설정 가능 범위: 0~2)
             top_p: (단어의) 확률 기반 샘플링을 위한 top_p 값 (기본값: 0.95)
             top_k: (단어의) 확률 기반 샘플링을 위한 top_k 값 (기본값: 40)
         """
-        self.client = GeminiClient()  # Gemini API 클라이언트 초기화
-        self.template = CHAT_PROMPT_KR  # 회의록 생성을 위한 프롬프트 템플릿
+        self.client = client or GeminiClient()  # Gemini API 클라이언트 초기화
+        self.instruction_template = CHAT_INSTRUCTION_KR  # 모든 요청이 공유하는 지시문 템플릿
+        self.trait_template = CHAT_TRAIT_KR  # MBTI 성향 참고 자료 템플릿
+        self.meeting_template = CHAT_MEETING_KR  # 회의 주제와 안건 템플릿
         self.context_template = CHAT_CONTEXT_KR  # 이전 채팅 내역 첨부를 위한 템플릿
+        self._trait_prefixes: dict[str, StaticPrefix] = {}  # MBTI 유형 -> 지시문 + 성향 참고 자료 prefix
+        self.token_estimator = token_estimator or TokenEstimator()  # 네트워크 호출 없는 토큰 수 추정기
 
         # 모델 config 값 설정
         self.temperature = temperature
@@ -43,42 +56,139 @@ class MbtiChatGenerator:
 
         Args:
             meeting_context: 회의 맥락이 담긴 data class 객체 (주제, 안건, 채팅 내역, 주최자와 참여자)
-            step: 새로 시작하는 안건 번호(=안건 ID)
+            request: 채팅 생성 요청 (채팅방 ID, 새로 시작하는 안건 번호 등)
 
         Returns:
             Gemini 응답 파싱 결과 (AI 참여자 챗봇의 채팅 텍스트)
         """
+        return await self._generate_bot_chat(meeting_context, request)
+
+
+    @catch_and_raise("Gemini 다중 봇 챗 생성", GeminiCallError)
+    async def generate_chats(self, meeting_context: MeetingContext, request: ChatRequest,
+                             bot_emails: Optional[list[str]] = None) -> list[ChatResponse]:
+        """
+        회의에 참여한 여러 AI 참여자 챗봇의 채팅을 동시에 생성
+
+        Note:
+            - 한 번 불러온 회의 맥락으로 봇별 프롬프트를 만들고, 봇별 Gemini 요청을 동시에 처리
+            - 모든 봇이 같은 시점의 채팅 내역을 보고 발언하므로, 같은 요청에서 생성되는 다른 봇의 발언은 참조하지 않음
+
+        Args:
+            meeting_context: 회의 맥락이 담긴 data class 객체 (주제, 안건, 채팅 내역, 주최자와 참여자)
+            request: 채팅 생성 요청 (채팅방 ID, 새로 시작하는 안건 번호 등)
+            bot_emails: 채팅을 생성할 AI 참여자 이메일 목록 (미지정 시 모든 AI 참여자)
+
+        Returns:
+            AI 참여자별 ChatResponse 리스트 (bot_emails 순서, 미지정 시 참여자 순서)
+
+        Raises:
+            PromptBuildError: 회의에 AI 참여자가 없거나, bot_emails에 AI 참여자가 아닌 이메일이 포함된 경우
+        """
+        bots = self._select_bots(meeting_context, bot_emails)
+        return list(await asyncio.gather(*[self._generate_bot_chat(meeting_context, request, bot) for bot in bots]))
+
+
+    async def _generate_bot_chat(self, meeting_context: MeetingContext, request: ChatRequest,
+                                 bot: Optional[UserInfo] = None) -> ChatResponse:
+
+        """bot(미지정 시 첫 번째 AI 참여자)의 채팅을 생성"""
+
+        history_builder = MeetingHistoryBuilder(meeting_context, bot=bot)
+        model = self.client.model_router.route(ModelRouter.CHAT)
+        prefix, prompt = await self._build_prompt(step=request.agendaId, history_builder=history_builder, model=model)
+        response = await self.client.generate_content_async(prompt, self._build_config(), model.name,
+                                                            hedge=True, prefix=prefix)  # 사용자 대기 응답이므로 hedge 적용
+        return self._to_chat_response(request, history_builder.bot, response.text)
+
+
+    @staticmethod
+    def _select_bots(meeting_context: MeetingContext, bot_emails: Optional[list[str]]) -> list[UserInfo]:
+
+        """회의의 AI 참여자 중 채팅을 생성할 봇 목록 (bot_emails 미지정 시 전체, 중복 이메일은 한 번만)"""
+
+        bots = MeetingHistoryBuilder(meeting_context).bots
+        if bot_emails is not None:
+            bot_by_email = {bot.email: bot for bot in bots}
+            if any(email not in bot_by_email for email in bot_emails):
+                raise PromptBuildError("AI 참여자가 아닌 봇 이메일 포함")
+            bots = [bot_by_email[email] for email in dict.fromkeys(bot_emails)]
+
+        if not bots:
+            raise PromptBuildError("채팅을 생성할 AI 참여자 없음")
+        return bots
+
+
+    @catch_and_raise("Gemini 챗 스트리밍 생성", GeminiCallError)
+    async def generate_chat_stream(self, meeting_context: MeetingContext,
+                                   request: ChatRequest) -> AsyncIterator[Union[str, ChatResponse]]:
+        """
+        Gemini 스트리밍 생성으로 AI 참여자 챗봇의 채팅을 생성하며, 생성되는 텍스트 조각을 차례로 반환
+
+        Note:
+            - 텍스트 조각(str)을 생성되는 대로 반환하고, 마지막에 전체 채팅이 담긴 ChatResponse를 한 번 반환
+
+        Args:
+            meeting_context: 회의 맥락이 담긴 data class 객체 (주제, 안건, 채팅 내역, 주최자와 참여자)
+            request: 채팅 생성 요청 (채팅방 ID, 새로 시작하는 안건 번호 등)
+
+        Returns:
+            텍스트 조각(str)들과 마지막 ChatResponse의 비동기 iterator
+        """
         history_builder = MeetingHistoryBuilder(meeting_context)
-        prompt = self._build_prompt(step=request.agendaId, history_builder=history_builder)
-        config = GenerateContentConfig(
+        model = self.client.model_router.route(ModelRouter.CHAT)
+        prefix, prompt = await self._build_prompt(step=request.agendaId, history_builder=history_builder, model=model)
+
+        chunks = []
+        async for chunk in self.client.generate_content_stream_async(prompt, self._build_config(), model.name, prefix):
+            chunks.append(chunk)
+            yield chunk
+        yield self._to_chat_response(request, history_builder.bot, ''.join(chunks))
+
+
+    def _build_config(self) -> GenerateContentConfig:
+
+        """채팅 생성 요청에 사용할 Generation 설정"""
+
+        return GenerateContentConfig(
             temperature=self.temperature,
             top_p=self.top_p,
             top_k=self.top_k,
             max_output_tokens=self.max_output_tokens,
         )
-        response = self.client.generate_content(prompt, config)
-        chat = response.text
-        bot = history_builder.bot
+
+
+    @staticmethod
+    def _to_chat_response(request: ChatRequest, bot: UserInfo, message: str) -> ChatResponse:
+
+        """생성된 채팅 텍스트를 봇 정보와 함께 ChatResponse로 변환"""
+
         return ChatResponse(
             roomId=request.roomId,
             name=bot.name,
             email=bot.email,
             agenda_id=request.agendaId,
-            message=chat
+            message=message
         )
 
 
     @catch_and_raise("Gemini 챗 생성 프롬프트 빌드", PromptBuildError)
-    def _build_prompt(self, step: str, history_builder: MeetingHistoryBuilder) -> str:
+    async def _build_prompt(self, step: str, history_builder: MeetingHistoryBuilder,
+                            model: ModelSpec) -> tuple[StaticPrefix, str]:
         """
         프롬프트 템플릿에 필요한 요소를 삽입하여 최종 프롬프트를 생성
 
+        Note:
+            - 요청마다 달라지는 값(회의 주제, 안건명, 직전 채팅 내역)은 모두 정적 prefix 뒤의 프롬프트에만 포함
+              (같은 MBTI 유형의 요청은 prefix 전체를, 다른 유형의 요청도 지시문 부분을 바이트 단위로 공유)
+
         Args:
             step: 새로 시작하는 안건 번호(=안건 ID)
             history_builder: 회의 맥락을 관리하고 프롬프트에 필요한 chunk를 생성하는 MeetingHistoryBuilder
+            model: 채팅 생성에 사용할 (라우팅된) 모델 (직전 채팅 내역 분할 기준)
 
         Returns:
-            AI 참여자의 채팅 생성 요청 프롬프트
+            (지시문 + MBTI 성향 참고 자료 prefix, prefix 뒤에 붙는 회의 주제/안건 및 직전 채팅 내역 프롬프트)
         """
         mbti = history_builder.bot.mbti  # 참여자 봇의 mbti
         agenda_title = history_builder.agendas.get(step)
@@ -87,24 +197,37 @@ class MbtiChatGenerator:
         if not agenda_title or not mbti:
             raise PromptBuildError("안건명 및 봇 MBTI 정보 누락")
 
-        mbti_info = self.trait_builder.build_trait_summary(mbti)
+        prefix = self._get_trait_prefix(mbti)
 
-        prompt = self.template.format(
-            mbti=mbti,
-            topic=topic,
-            sub_topic=agenda_title,
-            hangul_length_limit=self.HANGEUL_ZA_LIMIT,
-            mbti_info=mbti_info
-        )
+        prompt = self.meeting_template.format(topic=topic, sub_topic=agenda_title)
 
         # 유효한 직전 안건 대화 context가 존재할 시 함께 전달
         if history_builder.chats:
-            chunks = history_builder.build_prompt_chunks()
-            if len(chunks) > 1:
-                raise PromptBuildError("의도치 않은 프롬프트 분할 발생")  # context 뭉치가 분할 처리되었으면 에러 발생시키기
-
-            context = self.context_template.format(prev_chat_history=chunks[0])
+            # 직전 안건 대화가 입력 토큰 수 제한을 넘으면 채팅 단위로 분할되므로, 새 안건과 가장 가까운 마지막 부분을 참조
+            prompt_base = prefix.text + prompt + '\n' + self.context_template.format(prev_chat_history='')
+            history_token_alloc = model.input_token_limit - self.token_estimator.upper_bound(prompt_base)
+            token_counter = LimitAwareTokenCounter(
+                self.token_estimator, functools.partial(self.client.count_tokens_async, model=model.name)
+            )
+            chunks = await history_builder.build_prompt_chunks(
+                count_tokens_callback=functools.partial(token_counter.count, token_limit=history_token_alloc),
+                token_alloc=history_token_alloc
+            )
+
+            context = self.context_template.format(prev_chat_history=chunks[-1])
             prompt += '\n' + context
 
-        return prompt
+        return prefix, prompt
+
+
+    def _get_trait_prefix(self, mbti: str) -> StaticPrefix:
+
+        """지시문과 MBTI 유형의 성향 참고 자료로 이루어진 정적 prefix (유형별로 한 번만 생성)"""
+
+        if mbti not in self._trait_prefixes:
+            mbti_info = self.trait_builder.build_trait_summary(mbti)
+            prefix_text = self.instruction_template.format(hangul_length_limit=self.HANGEUL_ZA_LIMIT) \
+                + self.trait_template.format(mbti=mbti, mbti_info=mbti_info)
+            self._trait_prefixes[mbti] = StaticPrefix(f"chat:{mbti}", prefix_text)
+        return self._trait_prefixes[mbti]
 
@@ -1,35 +1,58 @@
+import asyncio
+import functools
 import itertools
+import json
+from dataclasses import replace
 
 from .gemini_client import GeminiClient
+from .model_router import ModelRouter, ModelSpec
+from .context_cache import StaticPrefix
+from .token_estimator import TokenEstimator, LimitAwareTokenCounter
 from google.genai.types import GenerateContentConfig
-from .templates import SUMMARY_PROMPT_EN
+from .templates import SUMMARY_PROMPT_EN, SUMMARY_INSTRUCTION_EN, SUMMARY_TEXT_EN, SUMMARY_MERGE_PROMPT_EN
 from Prompting.usecases.meeting_context import MeetingContext
 from Prompting.exceptions.decorators import catch_and_raise
 from Prompting.exceptions.errors import GeminiCallError, GeminiParseError, MongoAccessError, PromptBuildError
 from .context_builders import MeetingHistoryBuilder
-from typing import cast
+from typing import AsyncIterator, cast, Optional
 from Prompting.common import AgendaStatus
+from Prompting.common.json_stream import JsonArrayStreamParser
+from Prompting.common.config import SUMMARY_PARALLEL_MODE, SUMMARY_PARALLEL_FAN_OUT, SUMMARY_AGENDAS_PER_REQUEST
 from Prompting.models import AgendaSummaryModel
 
 
 class MeetingSummarizer:
-    def __init__(self, temperature: float = 1, top_p: float = 0.95, top_k: int = 40,
-                 max_output_tokens: int = GeminiClient.OUTPUT_TOKEN_LIMIT):
+    MERGE_FAN_IN = 8  # 부분 요약 병합 요청 1회에 묶을 최대 부분 요약 수
+
+    def __init__(self, client: Optional[GeminiClient] = None, token_estimator: Optional[TokenEstimator] = None,
+                 temperature: float = 1, top_p: float = 0.95, top_k: int = 40,
+                 max_output_tokens: int = GeminiClient.OUTPUT_TOKEN_LIMIT,
+                 parallel: bool = SUMMARY_PARALLEL_MODE, max_fan_out: int = SUMMARY_PARALLEL_FAN_OUT,
+                 agendas_per_request: int = SUMMARY_AGENDAS_PER_REQUEST):
         """
         Gemini API를 사용하여 회의록을 요약하는 클래스
 
         Note:
             - 회의 채팅 내역을 기반으로 각 안건별 주요 내용을 정리하고 결론을 도출
             - 안건별 주요 내용 정리는 각 발언자의 의견과 태도를 정리하는 형식으로 생성
+            - 병렬 요약 모드에서는 안건(묶음)별로 요청을 나누어 동시에 요약한 뒤 결과를 이어 붙임 (출력 토큰 생성 시간 단축)
 
         Args:
+            client: 공유 Gemini API 클라이언트 (미지정 시 새로 생성)
+            token_estimator: 프롬프트 분할에 사용할 로컬 토큰 추정기 (미지정 시 기본 추정기 사용)
             temperature: 모델의 온도 설정 (기본값: 1, 설정 가능 범위: 0~2)
             top_p: (단어의) 확률 기반 샘플링을 위한 top_p 값 (기본값: 0.95)
             top_k: (단어의) 확률 기반 샘플링을 위한 top_k 값 (기본값: 40)
             max_output_tokens: 최대 출력 토큰 수 (기본값: 8192 -> *Gemini 출력 토큰 최댓값)
+            parallel: 안건(묶음)별 병렬 요약 모드 사용 여부 (기본값: 환경 변수 SUMMARY_PARALLEL_MODE)
+            max_fan_out: 병렬 요약 모드에서 요약 1건당 동시 Gemini 요청 수 상한
+            agendas_per_request: 병렬 요약 모드에서 요청 1회에 묶을 안건 수
         """
-        self.client = GeminiClient()  # Gemini API 클라이언트 초기화
-        self.template = SUMMARY_PROMPT_EN  # 회의록 생성을 위한 프롬프트 템플릿
+        self.client = client or GeminiClient()  # Gemini API 클라이언트 초기화
+        self.template = SUMMARY_PROMPT_EN  # 회의록 생성을 위한 프롬프트 템플릿 (토큰 수 예산 계산 기준)
+        self.prefix = StaticPrefix("summary", SUMMARY_INSTRUCTION_EN)  # 모든 요약 요청이 공유하는 지시문 (context cache 대상)
+        self.text_template = SUMMARY_TEXT_EN  # 지시문 뒤에 붙는 회의 내역 템플릿
+        self.token_estimator = token_estimator or TokenEstimator()  # 네트워크 호출 없는 토큰 수 추정기
 
         # 모델 config 값 설정
         self.temperature = temperature
@@ -37,6 +60,11 @@ class MeetingSummarizer:
         self.top_k = top_k
         self.max_output_tokens = max_output_tokens
 
+        # 병렬 요약 모드 설정값
+        self.parallel = parallel
+        self.max_fan_out = max(1, max_fan_out)
+        self.agendas_per_request = max(1, agendas_per_request)
+
         # 응답 형식 설정값
         self.response_mime_type = 'application/json'  # JSON 형식
         self.response_schema = {    # 세부 Schema 정의
@@ -59,21 +87,136 @@ class MeetingSummarizer:
         }
 
     @catch_and_raise("Gemini 요약 생성", GeminiCallError)
-    async def generate_summary(self, meeting_context: MeetingContext) -> list[dict]:
+    async def generate_summary(self, meeting_context: MeetingContext,
+                               precomputed: Optional[dict[str, dict]] = None) -> list[dict]:
         """
         Gemini API로 회의 요약을 생성.
-        채팅 내역이 길어질 시 분할 처리가 필요할 수 있으므로 다수의 요청을 처리하여 응답을 병합할 수 있도록 구현.
+        안건 논의 완료 시점에 미리 생성해 둔 안건별 요약이 있으면 재사용하고, 나머지 안건만 새로 요약.
 
         Args:
             meeting_context: 회의 맥락이 담긴 data class 객체 (주제, 안건, 채팅 내역, 주최자와 참여자)
+            precomputed: 재사용할 안건별 요약 (안건 ID -> Gemini 요약 응답 dict, 선택 사항)
 
         Returns:
             Gemini 응답 파싱 결과 (회의 요약 정보가 담긴 dict 리스트)
         """
-        history_builder = MeetingHistoryBuilder(meeting_context)
-        prompt_list = self._build_prompt_list(history_builder=history_builder)
+        precomputed = precomputed or {}
+        remaining_chats = {aid: chats for aid, chats in meeting_context.chats.items() if aid not in precomputed}
+
+        generated = []
+        if remaining_chats:  # 미리 요약되지 않은 안건만 Gemini로 요약
+            generated = await self.summarize_agendas(replace(meeting_context, chats=remaining_chats))
+        summary_data = sorted(
+            [dict(summary) for summary in precomputed.values()] + generated,
+            key=lambda summary: int(summary["step"])
+        )
+
+        for summary in summary_data:
+            self._mark_skipped(summary, meeting_context)
+        summary_data += self._missing_summaries(meeting_context, summary_data)  # 누락된 안건 추가
+
+        return cast(list[dict], summary_data)
+
+    @catch_and_raise("Gemini 요약 스트리밍 생성", GeminiCallError)
+    async def generate_summary_stream(self, meeting_context: MeetingContext,
+                                      precomputed: Optional[dict[str, dict]] = None) -> AsyncIterator[dict]:
+        """
+        generate_summary와 같은 형식의 안건별 요약을, 안건 요약이 완성되는 대로 하나씩 반환
+
+        Note:
+            - 재사용할 요약을 먼저 반환하고, 새로 요약하는 안건은 Gemini 스트리밍 응답에서 요약 object가 닫히는 즉시 반환
+            - 요약에서 누락된 안건(생략 처리)은 마지막에 반환
+            - 반환 순서가 안건 순서와 다를 수 있으므로, 전체 결과는 step 기준으로 정렬해 사용
+
+        Args:
+            meeting_context: 회의 맥락이 담긴 data class 객체 (주제, 안건, 채팅 내역, 주최자와 참여자)
+            precomputed: 재사용할 안건별 요약 (안건 ID -> Gemini 요약 응답 dict, 선택 사항)
+
+        Returns:
+            안건별 요약 dict의 비동기 iterator
+        """
+        precomputed = precomputed or {}
+        remaining_chats = {aid: chats for aid, chats in meeting_context.chats.items() if aid not in precomputed}
+
+        summary_data = []
+        for summary in sorted(precomputed.values(), key=lambda s: int(s["step"])):
+            summary_data.append(self._mark_skipped(dict(summary), meeting_context))
+            yield summary_data[-1]
+
+        if remaining_chats:  # 미리 요약되지 않은 안건만 Gemini로 요약
+            async for summary in self.summarize_agendas_stream(replace(meeting_context, chats=remaining_chats)):
+                summary_data.append(self._mark_skipped(summary, meeting_context))
+                yield summary
+
+        for summary in self._missing_summaries(meeting_context, summary_data):
+            yield summary
+
+    @catch_and_raise("Gemini 안건별 요약 생성", GeminiCallError)
+    async def summarize_agendas(self, meeting_context: MeetingContext) -> list[dict]:
+        """
+        Gemini API로 meeting_context에 채팅 내역이 담긴 안건들의 요약을 생성.
+        병렬 요약 모드에서는 안건을 agendas_per_request개씩 묶어 max_fan_out개 이하의 요청을 동시에 처리.
 
-        config = GenerateContentConfig(  # Gemini API 상세 설정
+        Args:
+            meeting_context: 회의 맥락이 담긴 data class 객체 (chats에 요약할 안건의 채팅 내역만 포함)
+
+        Returns:
+            Gemini 응답 파싱 결과 (안건별 요약 dict 리스트, 누락 안건 보충 및 생략 여부 표시 전)
+        """
+        config = self._build_config()
+        if self.parallel and len(meeting_context.chats) > self.agendas_per_request:
+            return await self._summarize_agenda_groups_in_parallel(meeting_context, config)
+        return await self._summarize_context(meeting_context, config)
+
+    @catch_and_raise("Gemini 안건별 요약 스트리밍 생성", GeminiCallError)
+    async def summarize_agendas_stream(self, meeting_context: MeetingContext) -> AsyncIterator[dict]:
+        """
+        summarize_agendas와 같은 안건별 요약을, 안건 요약이 완성되는 대로 하나씩 반환
+
+        Note:
+            - 단일 요청으로 요약할 수 있으면 Gemini 스트리밍 응답의 JSON 배열을 증분 파싱해 안건 object가 닫히는 즉시 반환
+            - 병렬 요약 모드에서는 먼저 끝난 묶음의 요약부터 반환
+            - 토큰 수 제한으로 분할 요청이 필요하면 부분 요약 병합이 끝나야 안건 요약이 확정되므로 모두 끝난 뒤 반환
+
+        Args:
+            meeting_context: 회의 맥락이 담긴 data class 객체 (chats에 요약할 안건의 채팅 내역만 포함)
+
+        Returns:
+            Gemini 응답 파싱 결과 (안건별 요약 dict, 누락 안건 보충 및 생략 여부 표시 전)의 비동기 iterator
+        """
+        config = self._build_config()
+        if self.parallel and len(meeting_context.chats) > self.agendas_per_request:
+            semaphore = asyncio.Semaphore(self.max_fan_out)
+            tasks = [
+                asyncio.ensure_future(self._summarize_group(group_context, config, semaphore))
+                for group_context in self._split_agenda_groups(meeting_context)
+            ]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    for summary in await next_done:
+                        yield summary
+            finally:
+                for task in tasks:
+                    task.cancel()  # 스트림이 중간에 닫히면 남은 요청 취소
+            return
+
+        model, prompt_list = await self._build_prompt_list(history_builder=MeetingHistoryBuilder(meeting_context))
+        if len(prompt_list) > 1:
+            for summary in await self._summarize_prompts(prompt_list, config, model):
+                yield summary
+            return
+
+        parser = JsonArrayStreamParser()
+        config = self._fit_config_to_model(config, model)
+        async for text in self.client.generate_content_stream_async(prompt_list[0], config, model.name, self.prefix):
+            for summary in parser.feed(text):
+                yield summary
+
+    def _build_config(self) -> GenerateContentConfig:
+
+        """요약 요청에 사용할 Gemini API 상세 설정"""
+
+        return GenerateContentConfig(
             temperature=self.temperature,
             top_p=self.top_p,
             top_k=self.top_k,
@@ -82,33 +225,166 @@ class MeetingSummarizer:
             response_schema=self.response_schema
         )
 
+    @staticmethod
+    def _fit_config_to_model(config: GenerateContentConfig, model: ModelSpec) -> GenerateContentConfig:
+
+        """최대 출력 토큰 수를 라우팅된 모델의 출력 토큰 제한 이하로 맞춘 Generation 설정"""
+
+        if not config.max_output_tokens or config.max_output_tokens <= model.output_token_limit:
+            return config
+        return config.model_copy(update={"max_output_tokens": model.output_token_limit})
+
+    @staticmethod
+    def _mark_skipped(summary: dict, meeting_context: MeetingContext) -> dict:
+
+        """안건 논의 상태에 따라 요약의 생략 여부(is_skipped)를 표시"""
+
+        summary["is_skipped"] = (meeting_context.agendas[str(summary["step"])].status != AgendaStatus.COMPLETE)
+        return summary
+
+    @staticmethod
+    def _missing_summaries(meeting_context: MeetingContext, summary_data: list[dict]) -> list[dict]:
+
+        """요약에 포함되지 않은 안건을 생략 처리한 요약 리스트"""
+
+        included_ids = {str(summary["step"]) for summary in summary_data}
+        return [
+            {"step": int(aid), "sub_topic": agenda.title, "is_skipped": True}
+            for aid, agenda in meeting_context.agendas.items() if aid not in included_ids
+        ]
+
+    async def _summarize_agenda_groups_in_parallel(self, meeting_context: MeetingContext,
+                                                   config: GenerateContentConfig) -> list[dict]:
+        """
+        안건을 agendas_per_request개씩 묶어 묶음별 요약을 동시에 생성하고, 안건 순서대로 이어 붙여 반환 (map-reduce)
+
+        Note:
+            - 동시 요청 수는 semaphore로 max_fan_out개까지 제한 (요약 1건이 공유 스레드 풀을 독점하지 않도록)
+            - 묶음별 Context가 토큰 수 제한을 넘으면 묶음 안에서 기존 분할/병합 로직을 그대로 적용
+
+        Args:
+            meeting_context: 회의 맥락이 담긴 data class 객체 (chats에 요약할 안건의 채팅 내역만 포함)
+            config: 요약 요청에 사용할 Generation 설정
+
+        Returns:
+            안건별 요약 dict 리스트 (안건 순서 유지)
+        """
+        semaphore = asyncio.Semaphore(self.max_fan_out)
+        results = await asyncio.gather(*[
+            self._summarize_group(group_context, config, semaphore)
+            for group_context in self._split_agenda_groups(meeting_context)
+        ])
+        return list(itertools.chain.from_iterable(results))  # 묶음별 응답 배열 병합
+
+    def _split_agenda_groups(self, meeting_context: MeetingContext) -> list[MeetingContext]:
+
+        """채팅 내역이 담긴 안건을 agendas_per_request개씩 묶어 묶음별 MeetingContext 리스트로 반환 (안건 순서 유지)"""
+
+        agenda_ids = list(meeting_context.chats)
+        groups = [agenda_ids[i:i + self.agendas_per_request] for i in range(0, len(agenda_ids), self.agendas_per_request)]
+        return [replace(meeting_context, chats={aid: meeting_context.chats[aid] for aid in group}) for group in groups]
+
+    async def _summarize_group(self, group_context: MeetingContext, config: GenerateContentConfig,
+                               semaphore: asyncio.Semaphore) -> list[dict]:
+
+        """semaphore로 동시 요청 수를 제한하며 안건 묶음 하나를 요약"""
+
+        async with semaphore:
+            return await self._summarize_context(group_context, config)
+
+    async def _summarize_context(self, meeting_context: MeetingContext, config: GenerateContentConfig) -> list[dict]:
+        """
+        meeting_context의 채팅 내역 전체를 요약 요청으로 보내 안건별 요약을 생성.
+        채팅 내역이 길어질 시 분할 처리가 필요할 수 있으므로 다수의 요청을 처리하여 응답을 병합할 수 있도록 구현.
+        단일 안건이 채팅 단위로 나뉘어 요약된 경우, 같은 안건의 부분 요약을 하나로 병합.
+
+        Args:
+            meeting_context: 회의 맥락이 담긴 data class 객체
+            config: 요약 요청에 사용할 Generation 설정
+
+        Returns:
+            Gemini 응답 파싱 결과 (안건별 요약 dict 리스트)
+        """
+        history_builder = MeetingHistoryBuilder(meeting_context)
+        model, prompt_list = await self._build_prompt_list(history_builder=history_builder)
+        return await self._summarize_prompts(prompt_list, config, model)
+
+    async def _summarize_prompts(self, prompt_list: list[str], config: GenerateContentConfig,
+                                 model: ModelSpec) -> list[dict]:
+        """
+        요약 요청 프롬프트들을 처리하여 안건별 요약을 생성 (분할된 경우 같은 안건의 부분 요약 병합)
+
+        Args:
+            prompt_list: 회의 요약 생성 요청 프롬프트(지시문 prefix 제외)가 담긴 리스트
+            config: 요약 요청에 사용할 Generation 설정
+            model: 프롬프트 분할 기준이 된 (라우팅된) 모델
+
+        Returns:
+            Gemini 응답 파싱 결과 (안건별 요약 dict 리스트)
+        """
+        config = self._fit_config_to_model(config, model)
+
         # 요청 프롬프트가 입력 토큰 수 제한을 넘어 분할 처리되었을 때와 아닐 때의 로직 분기
         if len(prompt_list) > 1:
-            responses = await self.client.process_prompts(prompt_list, config)  # 비동기 처리로 다수의 요청을 한 번에 처리
+            responses = await self.client.process_prompts(prompt_list, config, model.name, self.prefix)  # 비동기 처리로 다수의 요청을 한 번에 처리
             parsed_responses = [r.parsed for r in responses]
             summary_data = list(itertools.chain.from_iterable(parsed_responses))  # 파싱한 다수의 응답 결과 병합
+            summary_data = await self._merge_partial_summaries(summary_data, config, model)  # 같은 안건의 부분 요약 병합
         else:
-            response = self.client.generate_content(prompt_list[0], config)
+            response = await self.client.generate_content_async(prompt_list[0], config, model.name, prefix=self.prefix)
             summary_data = response.parsed  # 단일 응답
 
-        agendas = meeting_context.agendas
-        included_ids = set()
+        return cast(list[dict], summary_data or [])
 
-        for summary in summary_data:
-            aid = str(summary["step"])
-            summary["is_skipped"] = (agendas[aid].status != AgendaStatus.COMPLETE)
-            included_ids.add(aid)
-
-        # 누락된 안건 추가
-        for aid, agenda in agendas.items():
-            if aid not in included_ids:
-                summary_data.append({
-                    "step": int(aid),
-                    "sub_topic": agenda.title,
-                    "is_skipped": True
-                })
+    async def _merge_partial_summaries(self, summary_data: list[dict], config: GenerateContentConfig,
+                                       model: ModelSpec) -> list[dict]:
+        """
+        같은 안건(step)에 대한 부분 요약들을 계층적으로 병합해 안건별 요약이 하나씩만 남도록 반환
 
-        return cast(list[dict], summary_data)
+        Note:
+            - 부분 요약을 MERGE_FAN_IN개씩 묶어 병합 요청을 동시에 보내고, 안건별로 하나가 남을 때까지 반복
+            - 부분 요약의 순서(채팅 시간 순서)는 병합 요청 프롬프트에서도 유지
+
+        Args:
+            summary_data: 분할 요청 응답을 이어 붙인 요약 dict 리스트
+            config: 병합 요청에 사용할 Generation 설정
+            model: 병합 요청에 사용할 모델
+
+        Returns:
+            안건별로 하나의 요약만 포함된 요약 dict 리스트 (안건 첫 등장 순서 유지)
+        """
+        partials_by_step: dict[int, list[dict]] = {}
+        for summary in summary_data:
+            partials_by_step.setdefault(int(summary["step"]), []).append(summary)
+
+        while any(len(partials) > 1 for partials in partials_by_step.values()):
+            # 병합이 필요한 안건의 부분 요약을 MERGE_FAN_IN개씩 묶기
+            groups = [
+                (step, partials[i:i + self.MERGE_FAN_IN])
+                for step, partials in partials_by_step.items() if len(partials) > 1
+                for i in range(0, len(partials), self.MERGE_FAN_IN)
+            ]
+            prompts = [
+                SUMMARY_MERGE_PROMPT_EN.format(partial_summaries=json.dumps(group, ensure_ascii=False))
+                for _, group in groups if len(group) > 1
+            ]
+            responses = iter(await self.client.process_prompts(prompts, config, model.name))
+
+            merged_by_step: dict[int, list[dict]] = {}
+            for step, group in groups:
+                if len(group) == 1:  # 묶음에 하나만 남은 부분 요약은 다음 단계로 그대로 전달
+                    merged_by_step.setdefault(step, []).append(group[0])
+                    continue
+
+                response = next(responses)
+                merged = response.parsed[0] if response.parsed else None
+                if not merged:
+                    raise GeminiParseError("부분 요약 병합 응답 누락")
+                merged["step"] = step
+                merged_by_step.setdefault(step, []).append(merged)
+            partials_by_step.update(merged_by_step)
+
+        return [partials[0] for partials in partials_by_step.values()]
 
     @catch_and_raise("Gemini 요약 응답 파싱", GeminiParseError)
     def parse_response_to_summary_data(self, response: list[dict]) -> list[AgendaSummaryModel]:
@@ -147,30 +423,44 @@ class MeetingSummarizer:
 
         return summary_list
 
-    def _build_prompt_list(self, history_builder: MeetingHistoryBuilder) -> list[str]:
+    async def _build_prompt_list(self, history_builder: MeetingHistoryBuilder) -> tuple[ModelSpec, list[str]]:
         """
-        프롬프트 템플릿에 필요한 요소를 삽입하여 최종 프롬프트를 생성
+        요약 요청에 사용할 모델을 선택하고, 프롬프트 템플릿에 필요한 요소를 삽입하여 최종 프롬프트를 생성
 
         Note:
-            - 토큰 수 제한으로 인해 회의 전체 Context를 하나의 요청 프롬프트에 담지 못할 시 분할 처리 적용
+            - 회의 전체 Context의 추정 토큰 수로 모델을 라우팅 (기본 모델의 입력 토큰 제한을 넘으면 long context 모델)
+            - 토큰 수 제한으로 인해 회의 전체 Context를 하나의 요청 프롬프트에 담지 못할 시
+              라우팅된 모델의 입력 토큰 제한 기준으로 분할 처리 적용
             - 분할 처리 적용 가능성이 있으므로 프롬프트를 항상 리스트에 담아 반환
+            - 반환하는 프롬프트는 회의 내역 부분만 담고, 공통 지시문(self.prefix)은 요청 시 GeminiClient가 붙이거나 캐시로 전달
 
         Args:
             history_builder: 회의 맥락을 관리하고 프롬프트에 필요한 chunk를 생성하는 MeetingHistoryBuilder
 
         Returns:
-            회의 요약 생성 요청 프롬프트가 담긴 리스트
+            (라우팅된 모델, 회의 요약 생성 요청 프롬프트가 담긴 리스트)
         """
-        # 회의 전체 Context(채팅 기록)에 할당할 토큰 수 계산
+        # 템플릿 토큰 수는 상한 추정값으로 보수적으로 계산
         prompt_base = self.template.format(chat_history='')
-        history_token_alloc = GeminiClient.INPUT_TOKEN_LIMIT - self.client.count_tokens(prompt_base)
+        prompt_base_tokens = self.token_estimator.upper_bound(prompt_base)
 
-        # 회의 Context 문자열 빌드, 토큰 수 제한에 맞춰 분할 처리 적용
-        chunks = history_builder.build_prompt_chunks(
-            count_tokens_callback=self.client.count_tokens,
+        # 분할 전 회의 전체 Context의 추정 토큰 수로 모델 선택
+        full_history = (await history_builder.build_prompt_chunks())[0]
+        model = self.client.model_router.route(
+            ModelRouter.SUMMARY, prompt_base_tokens + self.token_estimator.estimate(full_history)
+        )
+
+        # 회의 Context 문자열 빌드, 라우팅된 모델의 토큰 수 제한에 맞춰 분할 처리 적용
+        # (로컬 추정값 기준으로 분할하고, 제한 근처의 애매한 경우에만 라우팅된 모델 기준 원격 토큰 수 계산 사용)
+        history_token_alloc = model.input_token_limit - prompt_base_tokens
+        token_counter = LimitAwareTokenCounter(
+            self.token_estimator, functools.partial(self.client.count_tokens_async, model=model.name)
+        )
+        chunks = await history_builder.build_prompt_chunks(
+            count_tokens_callback=functools.partial(token_counter.count, token_limit=history_token_alloc),
             token_alloc=history_token_alloc
         )
 
-        prompt_list = [self.template.format(chat_history=chunk) for chunk in chunks]
-        return prompt_list
+        prompt_list = [self.text_template.format(chat_history=chunk) for chunk in chunks]
+        return model, prompt_list
 
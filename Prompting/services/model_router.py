@@ -0,0 +1,111 @@
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from Prompting.common.config import (
+    GEMINI_CHAT_MODEL, GEMINI_AGENDA_MODEL, GEMINI_SUMMARY_MODEL, GEMINI_LONG_CONTEXT_MODEL
+)
+
+
+@dataclass(frozen=True)
+class ModelSpec:
+    """
+    Gemini 모델별 토큰 수 제한과 상대 지연 시간/비용
+
+    Attributes:
+        name: Gemini 모델 이름
+        input_token_limit: 입력 토큰 제한 수
+        output_token_limit: 출력 토큰 제한 수
+        relative_latency: gemini-2.0-flash 대비 응답 지연 시간 (대략적인 비율)
+        relative_cost: gemini-2.0-flash 대비 토큰당 요금
+    """
+    name: str
+    input_token_limit: int
+    output_token_limit: int
+    relative_latency: float
+    relative_cost: float
+
+
+# 사용 가능한 Gemini 모델 목록 (새 모델은 여기에 등록한 뒤 GEMINI_*_MODEL 환경 변수로 지정)
+MODEL_REGISTRY: dict[str, ModelSpec] = {spec.name: spec for spec in [
+    ModelSpec("gemini-2.0-flash", input_token_limit=1_048_576, output_token_limit=8192,
+              relative_latency=1.0, relative_cost=1.0),
+    ModelSpec("gemini-2.0-flash-lite", input_token_limit=1_048_576, output_token_limit=8192,
+              relative_latency=0.8, relative_cost=0.75),
+    ModelSpec("gemini-1.5-pro", input_token_limit=2_097_152, output_token_limit=8192,
+              relative_latency=2.5, relative_cost=12.5),
+]}
+
+
+class ModelRouter:
+    CHAT = "chat"  # MBTI 봇 채팅 생성
+    AGENDA = "agenda"  # 회의 안건 생성
+    SUMMARY = "summary"  # 회의록 요약
+
+    def __init__(self, routes: Optional[dict[str, str]] = None,
+                 long_context_model: Optional[str] = GEMINI_LONG_CONTEXT_MODEL,
+                 registry: Optional[dict[str, ModelSpec]] = None):
+        """
+        서비스(요청 종류)와 입력 토큰 수에 따라 Gemini 모델을 선택하는 라우팅 정책
+
+        Note:
+            - 서비스별 기본 모델을 사용 (짧은 채팅과 안건 생성은 가볍고 빠른 모델, 요약은 기본 모델)
+            - 입력 토큰 수가 기본 모델의 입력 토큰 제한을 넘으면 더 큰 context를 가진 long_context_model로 전환해
+              분할 요청 없이 한 번에 처리 (long_context_model의 제한도 넘으면 해당 제한 기준으로 분할)
+            - 서비스의 프롬프트 분할 예산과 토큰 수 계산 기준 모델은 선택된 모델을 따름
+
+        Args:
+            routes: 서비스별 기본 모델 이름 (미지정 시 환경 변수 GEMINI_CHAT_MODEL/GEMINI_AGENDA_MODEL/GEMINI_SUMMARY_MODEL)
+            long_context_model: 입력 토큰 제한 초과 시 전환할 모델 이름 (None 또는 빈 문자열이면 전환하지 않음)
+            registry: 모델 이름별 ModelSpec (미지정 시 MODEL_REGISTRY)
+
+        Raises:
+            ValueError: registry에 등록되지 않은 모델 이름을 지정한 경우
+        """
+        self.registry = registry or MODEL_REGISTRY
+        self.routes = routes or {
+            self.CHAT: GEMINI_CHAT_MODEL,
+            self.AGENDA: GEMINI_AGENDA_MODEL,
+            self.SUMMARY: GEMINI_SUMMARY_MODEL,
+        }
+        self.long_context_model = long_context_model or None
+
+        unknown = [name for name in [*self.routes.values(), self.long_context_model]
+                   if name and name not in self.registry]
+        if unknown:
+            raise ValueError(f"등록되지 않은 Gemini 모델: {', '.join(unknown)}")
+
+        self._routed: dict[str, Counter] = {service: Counter() for service in self.routes}  # 서비스별 모델 선택 횟수
+        self.escalations = 0  # long_context_model로 전환한 횟수
+
+    def route(self, service: str, input_tokens: int = 0) -> ModelSpec:
+        """
+        서비스 요청에 사용할 모델을 선택
+
+        Args:
+            service: 서비스 이름 (ModelRouter.CHAT / AGENDA / SUMMARY)
+            input_tokens: 요청 입력 토큰 수 (추정값, 0이면 서비스 기본 모델 사용)
+
+        Returns:
+            선택된 모델의 ModelSpec
+        """
+        spec = self.registry[self.routes[service]]
+        if self.long_context_model and input_tokens > spec.input_token_limit:
+            long_spec = self.registry[self.long_context_model]
+            if long_spec.input_token_limit > spec.input_token_limit:
+                spec = long_spec
+                self.escalations += 1
+
+        self._routed[service][spec.name] += 1
+        return spec
+
+    def stats(self) -> dict[str, Any]:
+
+        """서비스별 기본 모델, 모델 선택 횟수 및 long context 전환 횟수"""
+
+        return {
+            "routes": dict(self.routes),
+            "long_context_model": self.long_context_model,
+            "routed": {service: dict(counts) for service, counts in self._routed.items()},
+            "escalations": self.escalations,
+        }
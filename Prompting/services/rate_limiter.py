@@ -0,0 +1,206 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from google.genai import errors
+
+from Prompting.common.config import (
+    GEMINI_RPM_LIMIT, GEMINI_TPM_LIMIT,
+    GEMINI_MAX_RETRIES, GEMINI_BACKOFF_BASE_SECONDS, GEMINI_BACKOFF_MAX_SECONDS
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class GeminiRateLimiter:
+    RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)  # 재시도할 Gemini API 응답 코드
+    MIN_RATE_SCALE = 0.1  # 스로틀링으로 낮출 수 있는 최소 허용 속도 비율
+    RATE_DECREASE_FACTOR = 0.5  # 429 응답 시 허용 속도에 곱하는 비율 (multiplicative decrease)
+    RATE_INCREASE_STEP = 0.05  # 성공 응답 시 허용 속도에 더하는 비율 (additive increase)
+
+    def __init__(self, rpm: int = GEMINI_RPM_LIMIT, tpm: int = GEMINI_TPM_LIMIT,
+                 max_retries: int = GEMINI_MAX_RETRIES,
+                 backoff_base: float = GEMINI_BACKOFF_BASE_SECONDS,
+                 backoff_max: float = GEMINI_BACKOFF_MAX_SECONDS, period: float = 60.0):
+        """
+        Gemini API 분당 요청 수(RPM)와 분당 토큰 수(TPM) 할당량을 지키기 위한 프로세스 공유 토큰 버킷 limiter
+
+        Note:
+            - 요청 수 버킷과 토큰 수 버킷을 함께 사용하며, 두 버킷 모두 여유가 있을 때만 요청을 보냄
+            - 토큰 수는 요청 전 추정값(입력 + 예상 출력)으로 먼저 차감하고, 응답의 usage_metadata로 실제 사용량을 정산
+              (실패한 시도의 추정값은 돌려주므로, 재시도한 호출도 토큰 수는 한 번만 차감)
+            - 대기 요청은 도착 순서대로(FIFO) 처리해 큰 요청이 작은 요청에 계속 밀리지 않도록 함
+            - 429/5xx 응답은 jitter를 적용한 지수 백오프로 재시도
+            - 429 응답을 받으면 허용 속도를 절반으로 낮추고, 성공 응답마다 조금씩 회복 (AIMD)
+
+        Args:
+            rpm: 분당(period당) 최대 요청 수
+            tpm: 분당(period당) 최대 토큰 수 (입력 + 출력)
+            max_retries: 429/5xx 응답 시 최대 재시도 횟수
+            backoff_base: 첫 재시도 대기 시간(초), 재시도마다 두 배로 증가
+            backoff_max: 재시도 대기 시간 상한(초)
+            period: 할당량 기준 시간(초, 기본값: 60 -> 분당 할당량, 테스트 시 단축용)
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.period = period
+
+        self.rate_scale = 1.0  # 관측된 스로틀링에 따라 조정되는 허용 속도 비율 (MIN_RATE_SCALE ~ 1.0)
+        self._request_tokens = float(rpm)  # 요청 수 버킷 잔량
+        self._token_tokens = float(tpm)  # 토큰 수 버킷 잔량
+        self._refilled_at = time.monotonic()
+        self._queue_lock = asyncio.Lock()  # 대기 요청을 도착 순서대로 한 명씩 통과시키는 lock
+
+        # 통계 지표
+        self.requests = 0
+        self.throttled = 0
+        self.retries = 0
+        self.waiting = 0
+        self.total_wait_seconds = 0.0
+
+    async def run(self, call: Callable[[], Awaitable[T]], estimated_tokens: int) -> T:
+        """
+        할당량 여유가 생길 때까지 대기한 뒤 call을 실행하고, 429/5xx 응답은 백오프 후 재시도
+
+        Args:
+            call: Gemini API를 호출하는 비동기 함수 (인자 없이 호출, 재시도 시 다시 호출)
+            estimated_tokens: 요청 1회의 예상 토큰 수 (입력 + 예상 출력)
+
+        Returns:
+            call의 반환값
+
+        Raises:
+            errors.APIError: 재시도할 수 없는 응답이거나 최대 재시도 횟수를 넘은 경우
+        """
+        for attempt in range(self.max_retries + 1):
+            await self.acquire(estimated_tokens)
+            try:
+                response = await call()
+            except errors.APIError as e:
+                self.refund(estimated_tokens)  # 실패한 시도의 예상 토큰 수 반환 (재시도 시 다시 차감)
+                if e.code not in self.RETRYABLE_STATUS_CODES or attempt == self.max_retries:
+                    raise
+                if e.code == 429:
+                    self._on_throttled()
+                self.retries += 1
+                delay = self._backoff_delay(attempt, e)
+                logger.warning("Gemini API %s 응답, %.2f초 후 재시도 (%d/%d)", e.code, delay, attempt + 1, self.max_retries)
+                await asyncio.sleep(delay)
+                continue
+
+            self._on_success()
+            self.settle(estimated_tokens, self.used_tokens(response))
+            return response
+
+    async def acquire(self, tokens: int):
+        """
+        요청 1회와 tokens개의 토큰을 사용할 수 있을 때까지 (도착 순서대로) 대기한 뒤 버킷에서 차감
+
+        Args:
+            tokens: 요청이 사용할 예상 토큰 수 (버킷 용량을 넘으면 용량으로 제한)
+        """
+        tokens = min(tokens, self.tpm)
+        start = time.monotonic()
+        self.waiting += 1
+        try:
+            async with self._queue_lock:
+                while True:
+                    self._refill()
+                    if self._request_tokens >= 1 and self._token_tokens >= tokens:
+                        self._request_tokens -= 1
+                        self._token_tokens -= tokens
+                        break
+                    await asyncio.sleep(self._time_until_available(tokens))
+        finally:
+            self.waiting -= 1
+        self.requests += 1
+        self.total_wait_seconds += time.monotonic() - start
+
+    def refund(self, estimated_tokens: int):
+
+        """실패한 요청에 대해 요청 전에 차감한 예상 토큰 수를 토큰 수 버킷에 반환 (요청 수는 반환하지 않음)"""
+
+        self._refill()
+        self._token_tokens = min(self._token_tokens + min(estimated_tokens, self.tpm), self.tpm)
+
+    def settle(self, estimated_tokens: int, used_tokens: Optional[int]):
+
+        """요청 전에 차감한 예상 토큰 수와 실제 사용 토큰 수의 차이를 토큰 수 버킷에 반영"""
+
+        if used_tokens is None:
+            return
+        self._refill()
+        self._token_tokens = min(self._token_tokens + min(estimated_tokens, self.tpm) - used_tokens, self.tpm)
+
+    def stats(self) -> dict[str, Any]:
+
+        """요청/스로틀링/재시도 횟수, 현재 허용 속도 비율 및 대기 통계"""
+
+        return {
+            "rpm": self.rpm,
+            "tpm": self.tpm,
+            "rate_scale": round(self.rate_scale, 4),
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "retries": self.retries,
+            "waiting": self.waiting,
+            "avg_wait_seconds": round(self.total_wait_seconds / self.requests, 4) if self.requests else 0.0,
+        }
+
+    def _refill(self):
+
+        """마지막 충전 이후 경과 시간만큼 (허용 속도 비율을 반영해) 두 버킷을 충전"""
+
+        now = time.monotonic()
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        self._request_tokens = min(self.rpm, self._request_tokens + elapsed * self.rpm / self.period * self.rate_scale)
+        self._token_tokens = min(self.tpm, self._token_tokens + elapsed * self.tpm / self.period * self.rate_scale)
+
+    def _time_until_available(self, tokens: int) -> float:
+
+        """요청 1회와 tokens개의 토큰이 충전될 때까지 남은 시간(초)"""
+
+        request_wait = (1 - self._request_tokens) * self.period / (self.rpm * self.rate_scale)
+        token_wait = (tokens - self._token_tokens) * self.period / (self.tpm * self.rate_scale)
+        return max(request_wait, token_wait, 0.001)
+
+    def _backoff_delay(self, attempt: int, error: errors.APIError) -> float:
+
+        """재시도 대기 시간 (Retry-After 헤더가 있으면 우선 사용, 없으면 full jitter 지수 백오프)"""
+
+        retry_after = getattr(error.response, "headers", {}).get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def _on_throttled(self):
+
+        """429 응답 시 허용 속도를 낮추고, 이미 충전된 요청 수 버킷을 비워 재시도 요청이 한꺼번에 몰리지 않도록 함"""
+
+        self.throttled += 1
+        self.rate_scale = max(self.MIN_RATE_SCALE, self.rate_scale * self.RATE_DECREASE_FACTOR)
+        self._request_tokens = min(self._request_tokens, 0.0)
+
+    def _on_success(self):
+
+        """성공 응답 시 허용 속도를 조금씩 회복"""
+
+        self.rate_scale = min(1.0, self.rate_scale + self.RATE_INCREASE_STEP)
+
+    @staticmethod
+    def used_tokens(response: Any) -> Optional[int]:
+
+        """응답의 usage_metadata에서 실제 사용 토큰 수(입력 + 출력)를 추출 (없으면 None)"""
+
+        usage = getattr(response, "usage_metadata", None)
+        if usage is None:
+            return None
+        return (usage.prompt_token_count or 0) + (usage.candidates_token_count or 0)
@@ -1,3 +1,7 @@
-from .agenda_prompt_templates import AGENDA_PROMPT_EN, AGENDA_PROMPT_KR
-from .chat_prompt_templates import CHAT_PROMPT_KR, CHAT_CONTEXT_KR, CHAT_PROMPT_EN, CHAT_CONTEXT_EN
-from .summary_prompt_templates import SUMMARY_PROMPT_KR, SUMMARY_PROMPT_EN
\ No newline at end of file
+from .agenda_prompt_templates import AGENDA_PROMPT_EN, AGENDA_PROMPT_KR, AGENDA_BATCH_PROMPT_KR
+from .chat_prompt_templates import (
+    CHAT_PROMPT_KR, CHAT_INSTRUCTION_KR, CHAT_TRAIT_KR, CHAT_MEETING_KR, CHAT_CONTEXT_KR, CHAT_PROMPT_EN, CHAT_CONTEXT_EN
+)
+from .summary_prompt_templates import (
+    SUMMARY_PROMPT_KR, SUMMARY_PROMPT_EN, SUMMARY_INSTRUCTION_EN, SUMMARY_TEXT_EN, SUMMARY_MERGE_PROMPT_EN
+)
\ No newline at end of file
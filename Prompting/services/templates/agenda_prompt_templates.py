@@ -31,6 +31,19 @@ Text: {topic_request}
 """
 
 
+# 여러 회의 설명의 안건을 한 번에 생성하는 배치 요청 프롬프트 (안건 생성 지침은 AGENDA_PROMPT_KR과 공유)
+AGENDA_BATCH_PROMPT_KR = AGENDA_PROMPT_KR.split("Text: {topic_request}")[0] + \
+    """Batch Instruction:
+    아래 Texts에는 서로 다른 회의의 설명이 [번호] 형식으로 여러 개 주어짐.
+    각 회의 설명을 서로 독립적으로 다루어 위 지침에 따라 회의마다 별도의 안건 목록을 작성할 것. (다른 회의 설명의 내용을 섞지 말 것)
+    결과는 회의 설명마다 하나씩, "index" (회의 설명의 [번호])와 "agendas" (해당 회의의 안건 목록)를 포함한 object의 JSON 배열로 제시하며,
+    주어진 회의 설명 수와 배열 원소 수가 같아야 함.
+
+Texts:
+{topic_requests}
+"""
+
+
 AGENDA_PROMPT_EN = \
     """
 Goal: Set clear meeting goals based on a given meeting description (Text) and present an efficient meeting agenda list in Korean JSON format, 
@@ -37,3 +37,19 @@ Example:
 Text: {chat_history}
 """
 
+# 회의 요약 프롬프트의 정적 지시문(prefix)과 회의 내역(suffix)
+#  - SUMMARY_INSTRUCTION_EN + SUMMARY_TEXT_EN.format(chat_history=...) == SUMMARY_PROMPT_EN.format(chat_history=...)
+SUMMARY_INSTRUCTION_EN = SUMMARY_PROMPT_EN.split("Text: {chat_history}")[0].format()
+SUMMARY_TEXT_EN = "Text: {chat_history}\n"
+
+
+
+SUMMARY_MERGE_PROMPT_EN = \
+    """
+The transcript of one agenda item was too long, so it was summarized in several consecutive parts.
+Merge the partial summaries given in 'Partial Summaries' (in chronological order) into a single summary of the agenda item in Korean.
+Keep each speaker's main opinions and attitudes without duplication in 'key_statements', and write one conclusion that reflects the final outcome of the discussion.
+Return a JSON array containing exactly one object with the same "step" and "sub_topic".
+
+Partial Summaries: {partial_summaries}
+"""
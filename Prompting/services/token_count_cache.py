@@ -0,0 +1,91 @@
+import hashlib
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+from Prompting.common.cache import LRUCache
+from Prompting.common.config import TOKEN_COUNT_CACHE_SIZE
+from Prompting.exceptions.errors import MongoAccessError
+from Prompting.repository import TokenCountRepository
+
+logger = logging.getLogger(__name__)
+
+
+class TokenCountCache:
+    def __init__(self, maxsize: int = TOKEN_COUNT_CACHE_SIZE, repository: Optional[TokenCountRepository] = None):
+        """
+        텍스트 내용 기반(content-addressed) 토큰 수 계산 결과 캐시
+
+        Note:
+            - key는 모델명과 텍스트를 합친 문자열의 SHA-256 해시 (텍스트가 같으면 어느 요청에서든 재사용)
+            - 인메모리 LRU 캐시를 우선 조회하고, repository가 주어지면 MongoDB(TTL 콜렉션)를 2차 저장소로 사용
+            - MongoDB 접근 실패는 캐시 미적중으로 처리해 토큰 수 계산 자체는 실패하지 않도록 함
+
+        Args:
+            maxsize: 인메모리 캐시 최대 항목 수
+            repository: 계산 결과를 영구 저장할 TokenCountRepository (선택 사항)
+        """
+        self.memory = LRUCache(maxsize=maxsize)
+        self.repository = repository
+        self.persistent_hits = 0  # MongoDB 저장소 적중 횟수
+        self.remote_counts = 0  # 캐시 미적중으로 실제 토큰 수 계산을 요청한 횟수
+
+    @staticmethod
+    def make_key(text: str, model: str) -> str:
+
+        """모델명과 텍스트로 캐시 key(해시값) 생성"""
+
+        return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+    async def get_or_count(self, text: str, model: str, count_callback: Callable[[str], Awaitable[int]]) -> int:
+        """
+        캐시된 토큰 수를 반환하고, 없으면 count_callback으로 계산해 캐시에 저장한 뒤 반환
+
+        Args:
+            text: 토큰 수를 계산할 텍스트
+            model: 토큰 수 계산 기준 모델명
+            count_callback: 실제 토큰 수를 계산하는 비동기 콜백 함수
+
+        Returns:
+            텍스트의 토큰 수
+        """
+        key = self.make_key(text, model)
+        tokens = self.memory.get(key)
+        if tokens is not None:
+            return tokens
+
+        if self.repository:
+            tokens = await self._load_persistent(key)
+            if tokens is not None:
+                self.persistent_hits += 1
+                self.memory.set(key, tokens)
+                return tokens
+
+        self.remote_counts += 1
+        tokens = await count_callback(text)
+        self.memory.set(key, tokens)
+        if self.repository:
+            await self._save_persistent(key, model, tokens)
+        return tokens
+
+    def stats(self) -> dict[str, Any]:
+
+        """캐시 적중/미적중 통계"""
+
+        return {
+            **self.memory.stats(),
+            "persistent_hits": self.persistent_hits,
+            "remote_counts": self.remote_counts,
+        }
+
+    async def _load_persistent(self, key: str) -> Optional[int]:
+        try:
+            return await self.repository.get_token_count(key)
+        except MongoAccessError:
+            logger.warning("토큰 수 캐시 조회 실패, 캐시 미적중으로 처리")
+            return None
+
+    async def _save_persistent(self, key: str, model: str, tokens: int):
+        try:
+            await self.repository.save_token_count(key, model, tokens)
+        except MongoAccessError:
+            logger.warning("토큰 수 캐시 저장 실패, 인메모리 캐시만 사용")
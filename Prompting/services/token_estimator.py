@@ -0,0 +1,84 @@
+from typing import Callable, Awaitable
+from Prompting.common.config import TOKEN_ESTIMATE_SAFETY_MARGIN
+
+
+class TokenEstimator:
+    # 문자 종류별 문자 1개당 토큰 수 (실제 count_tokens 결과로 보정하지 않은 보수적 기본값)
+    #  - 실제 Gemini 토큰 수와의 오차는 측정되지 않았으므로, 운영 전 보정 필요:
+    #    scripts/benchmark/calibrate_token_estimator.py 실행 결과의 계수와 TOKEN_ESTIMATE_SAFETY_MARGIN 적용
+    MULTIBYTE_TOKENS_PER_CHAR = 0.8  # 한글 등 멀티바이트 문자
+    ASCII_TOKENS_PER_CHAR = 0.28  # 영문, 숫자, 공백, 기호 등 ASCII 문자
+
+    def __init__(self, safety_margin: float = TOKEN_ESTIMATE_SAFETY_MARGIN,
+                 multibyte_tokens_per_char: float = MULTIBYTE_TOKENS_PER_CHAR,
+                 ascii_tokens_per_char: float = ASCII_TOKENS_PER_CHAR):
+        """
+        네트워크 호출 없이 텍스트의 토큰 수를 추정하는 로컬 토큰 추정기
+
+        Note:
+            - 문자열의 UTF-8 바이트 수와 문자 수 차이로 멀티바이트(한글) 문자 수를 구해 선형 모델로 추정 (O(n), C 레벨 연산)
+            - safety_margin은 추정 오차 허용 범위로, 상한 추정값 및 원격 계산 전환 구간 판단에 사용
+            - 기본 계수는 보정되지 않은 기본값이라 실제 오차가 safety_margin 안에 든다는 보장이 없음 (클래스 상수 주석 참고)
+
+        Args:
+            safety_margin: 추정 오차 허용 비율 (기본값: 0.1 -> ±10%)
+            multibyte_tokens_per_char: 멀티바이트 문자 1개당 토큰 수
+            ascii_tokens_per_char: ASCII 문자 1개당 토큰 수
+        """
+        self.safety_margin = safety_margin
+        self.multibyte_tokens_per_char = multibyte_tokens_per_char
+        self.ascii_tokens_per_char = ascii_tokens_per_char
+
+    def estimate(self, text: str) -> int:
+
+        """텍스트의 토큰 수 추정값 계산"""
+
+        char_cnt = len(text)
+        multibyte_cnt = (len(text.encode("utf-8")) - char_cnt) // 2  # 한글(3바이트)은 문자당 2바이트 추가
+        ascii_cnt = char_cnt - multibyte_cnt
+        return int(multibyte_cnt * self.multibyte_tokens_per_char + ascii_cnt * self.ascii_tokens_per_char) + 1
+
+    def upper_bound(self, text: str) -> int:
+
+        """오차 허용 범위를 반영한 토큰 수 상한 추정값 계산"""
+
+        return int(self.estimate(text) * (1 + self.safety_margin)) + 1
+
+    def is_near_limit(self, estimated: int, token_limit: int) -> bool:
+
+        """추정값이 오차 허용 범위 내에서 토큰 수 제한과 겹쳐, 추정만으로는 초과 여부를 판단할 수 없는지 확인"""
+
+        return estimated * (1 - self.safety_margin) <= token_limit < estimated * (1 + self.safety_margin)
+
+
+class LimitAwareTokenCounter:
+    def __init__(self, estimator: TokenEstimator, remote_count_callback: Callable[[str], Awaitable[int]]):
+        """
+        토큰 수 제한 비교용 토큰 카운터.
+        로컬 추정값으로 제한 초과 여부가 분명하면 추정값을 사용하고, 제한 근처일 때만 원격 토큰 수 계산으로 전환
+
+        Args:
+            estimator: 로컬 토큰 추정기
+            remote_count_callback: 정확한 토큰 수를 계산하는 (원격) 비동기 콜백 함수
+        """
+        self.estimator = estimator
+        self.remote_count_callback = remote_count_callback
+        self.remote_calls = 0  # 원격 계산으로 전환된 횟수
+
+    async def count(self, text: str, token_limit: int) -> int:
+        """
+        토큰 수 제한과 비교하기 위한 텍스트의 토큰 수를 반환
+
+        Args:
+            text: 토큰 수를 계산할 텍스트
+            token_limit: 비교 대상 토큰 수 제한
+
+        Returns:
+            토큰 수 (제한에서 먼 경우 추정값, 가까운 경우 원격 계산값)
+        """
+        estimated = self.estimator.estimate(text)
+        if not self.estimator.is_near_limit(estimated, token_limit):
+            return estimated
+
+        self.remote_calls += 1
+        return await self.remote_count_callback(text)
@@ -1,2 +1,3 @@
 from .summarize_usecase import load_summary_context_and_update_agenda_status
 from .mbti_chat_usecase import load_chat_context_and_update_agenda_status
+from .agenda_summary_usecase import summarize_completed_agendas, load_reusable_agenda_summaries, save_agenda_summaries
@@ -0,0 +1,101 @@
+# 안건별 요약을 미리 생성/저장하고 회의 요약 생성 시 재사용하는 하위 Use Case 모음
+import logging
+from typing import TYPE_CHECKING
+from Prompting.repository import AgendaSummaryRepository
+from Prompting.models import StoredAgendaSummaryModel
+from Prompting.usecases.meeting_context import MeetingContext
+from Prompting.exceptions import catch_and_raise, MongoAccessError
+
+if TYPE_CHECKING:  # services -> usecases 순환 import 방지 (타입 힌트 용도로만 사용)
+    from Prompting.services import MeetingSummarizer
+
+logger = logging.getLogger(__name__)
+
+
+async def summarize_completed_agendas(
+        meeting_context: MeetingContext,
+        room_id: str,
+        summarizer: "MeetingSummarizer",
+        summary_repo: AgendaSummaryRepository
+):
+    """
+    논의 완료 처리된 안건의 요약을 백그라운드에서 미리 생성해 저장 (회의 요약 생성 시 재사용)
+
+    Note:
+        - MBTI 봇 채팅 생성 요청에서 직전 안건이 완료 처리되면 응답 후 BackgroundTasks로 실행
+        - meeting_context.chats에 담긴 안건(= 방금 완료된 안건)만 요약
+        - 이미 같은 채팅 내역으로 저장된 요약이 있으면 생략
+        - 백그라운드 작업이므로 실패해도 예외를 전파하지 않고 로그만 남김 (회의 요약 시 다시 생성됨)
+
+    Args:
+        meeting_context: 완료된 안건의 채팅 내역이 담긴 회의 맥락
+        room_id: 채팅방 ID
+        summarizer: 회의 요약 생성 서비스 객체
+        summary_repo: 안건별 요약 데이터 관리 객체
+    """
+    try:
+        stored = await summary_repo.get_agenda_summaries(room_id)
+        fingerprints = {aid: meeting_context.agenda_fingerprint(aid) for aid in meeting_context.chats}
+        if all(aid in stored and stored[aid].fingerprint == fp for aid, fp in fingerprints.items()):
+            return
+
+        summaries = await summarizer.summarize_agendas(meeting_context)
+        await save_agenda_summaries(meeting_context, room_id, summaries, summary_repo)
+    except Exception:
+        logger.exception("roomId '%s'의 완료 안건 사전 요약 실패", room_id)
+
+
+@catch_and_raise("MongoDB 안건별 요약 로딩", MongoAccessError)
+async def load_reusable_agenda_summaries(
+        meeting_context: MeetingContext,
+        room_id: str,
+        summary_repo: AgendaSummaryRepository
+) -> dict[str, dict]:
+    """
+    저장된 안건별 요약 중 현재 채팅 내역과 일치해 그대로 재사용할 수 있는 요약만 골라 반환
+
+    Args:
+        meeting_context: 회의 요약 생성 요청의 회의 맥락
+        room_id: 채팅방 ID
+        summary_repo: 안건별 요약 데이터 관리 객체
+
+    Returns:
+        안건 ID -> Gemini 요약 응답 dict (채팅 내역이 바뀐 안건은 제외)
+    """
+    stored = await summary_repo.get_agenda_summaries(room_id)
+    return {
+        aid: item.summary
+        for aid, item in stored.items()
+        if aid in meeting_context.chats and item.fingerprint == meeting_context.agenda_fingerprint(aid)
+    }
+
+
+async def save_agenda_summaries(
+        meeting_context: MeetingContext,
+        room_id: str,
+        summaries: list[dict],
+        summary_repo: AgendaSummaryRepository
+):
+    """
+    Gemini로 새로 생성한 안건별 요약을 안건 채팅 내역 해시값과 함께 저장 (이후 요약 생성 시 안건 단위로 재사용)
+
+    Note:
+        - meeting_context.chats에 채팅 내역이 있고 Gemini가 실제로 요약을 생성한(key_statements가 있는) 안건만 저장
+          (Gemini 응답에서 빠져 생략 처리로 보충된 안건은 저장하지 않아, 다음 요약 시 다시 생성)
+        - 안건 상태에 따라 달라지는 생략 여부(is_skipped)는 저장하지 않음
+
+    Args:
+        meeting_context: 요약 생성에 사용한 회의 맥락
+        room_id: 채팅방 ID
+        summaries: 저장할 안건별 요약 dict 리스트
+        summary_repo: 안건별 요약 데이터 관리 객체
+    """
+    stored = {}
+    for summary in summaries:
+        aid = str(summary["step"])
+        if aid in meeting_context.chats and "key_statements" in summary:
+            stored[aid] = StoredAgendaSummaryModel(
+                fingerprint=meeting_context.agenda_fingerprint(aid),
+                summary={k: v for k, v in summary.items() if k != "is_skipped"}
+            )
+    await summary_repo.save_agenda_summaries(room_id, stored)
@@ -1,11 +1,13 @@
 # MBTI 참여자 챗 생성 하위 use case 모음
+import asyncio
 from Prompting.schemas import ChatRequest
 from Prompting.repository import ChatRepository, RoomRepository, UserRepository, AgendaRepository
-from Prompting.usecases.usecase_utils import load_participants_info
+from Prompting.usecases.usecase_utils import load_room_and_participants
 from Prompting.usecases.meeting_context import MeetingContext, ChatLog
 from Prompting.exceptions import catch_and_raise, MongoAccessError
 from fastapi.exceptions import RequestValidationError
 from Prompting.common import AgendaStatus
+from Prompting.models import AgendaItemModel
 
 
 @catch_and_raise("MongoDB 데이터 로딩", MongoAccessError)
@@ -19,6 +21,10 @@ async def load_chat_context_and_update_agenda_status(
     """
     MBTI 봇 채팅 생성 요청에 필요한 데이터를 MongoDB에서 읽어와 MeetingContext로 재구성
 
+    Note:
+        - 순서 의존성이 있는 작업(안건 ID 검사 후 상태 업데이트, 채팅방 문서 후 참여자 정보)만 차례로 처리하고
+          나머지는 동시에 처리하므로 MongoDB 왕복 2회 수준의 지연 시간
+
     Args:
         request: MBTI 봇 채팅 생성 요청
         chat_repo: 채팅 데이터 관리 객체
@@ -30,6 +36,41 @@ async def load_chat_context_and_update_agenda_status(
         회의 맥락이 담긴 MeetingContext 데이터 (주제, 안건, 채팅 내역, 주최자와 참여자)
     """
 
+    # 안건 읽기 -> (직전 안건 상태 업데이트, 직전 채팅 내역 읽기)와 채팅방 -> 참여자 정보 읽기를 동시에 처리
+    (agendas, chats), (room_model, participants) = await asyncio.gather(
+        _load_agendas_and_previous_chats(request, chat_repo, agenda_repo),
+        load_room_and_participants(request.roomId, room_repo, user_repo),
+    )
+
+    return MeetingContext(
+        topic=room_model.content,
+        agendas=agendas,
+        host=room_model.host,
+        participants=participants,
+        chats=chats
+    )
+
+
+async def _load_agendas_and_previous_chats(
+        request: ChatRequest,
+        chat_repo: ChatRepository,
+        agenda_repo: AgendaRepository
+) -> tuple[dict[str, AgendaItemModel], dict[str, list[ChatLog]]]:
+    """
+    회의의 안건 데이터를 읽어 요청 안건 ID를 검사한 뒤, 직전 안건의 상태 업데이트와 직전 채팅 내역 읽기를 동시에 처리
+
+    Note:
+        - 상태 업데이트(쓰기)와 직전 채팅 내역 읽기는 안건 ID가 유효한 경우에만 실행
+
+    Args:
+        request: MBTI 봇 채팅 생성 요청
+        chat_repo: 채팅 데이터 관리 객체
+        agenda_repo: 안건 데이터 관리 객체
+
+    Returns:
+        (안건 ID-안건 데이터 맵, 직전 안건 ID-채팅 내역 맵 (첫 안건이거나 직전 안건이 생략되었으면 빈 dict))
+    """
+
     # 해당 회의의 안건 데이터 읽어와 요청에 포함된 안건 ID가 유효한지 검사
     agendas = await agenda_repo.get_agenda_by_room(request.roomId)
     if request.agendaId not in agendas.keys():
@@ -39,22 +80,15 @@ async def load_chat_context_and_update_agenda_status(
     if request.agendaId != '1':  # 첫 번째 안건이 아닌 경우에만
         # 직전 안건의 상태 업데이트
         prev_agenda_id = str(int(request.agendaId) - 1)
-        await agenda_repo.update_status(request.roomId, prev_agenda_id, request.is_previous_skipped)
+        status_update = agenda_repo.update_status(request.roomId, prev_agenda_id, request.is_previous_skipped)
 
         # 직전 안건이 생략되지 않고 논의 완료로 처리되었으면, 직전 채팅 내역을 맥락으로 참조.
-        if not request.is_previous_skipped:
-            agenda_chat_map = await chat_repo.get_chat_logs_by_agenda_id(request.roomId, prev_agenda_id)
+        if request.is_previous_skipped:
+            await status_update
+        else:
+            _, agenda_chat_map = await asyncio.gather(
+                status_update, chat_repo.get_chat_logs_by_agenda_id(request.roomId, prev_agenda_id)
+            )
             chats = {aid: [ChatLog.from_model(c) for c in msgs] for aid, msgs in agenda_chat_map.items()}
 
-    # 회의 참여자 정보(이메일, 이름, mbti) 불러오기
-    room_model = await room_repo.get_room_info(request.roomId)
-    participants = await load_participants_info(room_model.participants, user_repo)
-
-    return MeetingContext(
-        topic=room_model.content,
-        agendas=agendas,
-        host=room_model.host,
-        participants=participants,
-        chats=chats
-    )
-
+    return agendas, chats
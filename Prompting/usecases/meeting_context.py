@@ -1,4 +1,5 @@
 # use case에서 쓰이는 data class 정의 모음
+import hashlib
 from dataclasses import dataclass
 from Prompting.models import ChatMessage, UserModel, AgendaItemModel
 
@@ -38,3 +39,25 @@ class MeetingContext:
     host: str
     participants: list[UserInfo]
     chats: dict[str, list[ChatLog]]  # agenda_id -> 안건별 채팅 내역
+
+    def agenda_fingerprint(self, agenda_id: str) -> str:
+        """
+        안건 요약의 입력이 되는 데이터(회의 주제, 안건명, 채팅 발언자와 발언)로 계산한 해시값.
+        저장된 안건별 요약이 현재 채팅 내역과 일치하는지(재사용 가능한지) 판단하는 데 사용.
+        """
+        agenda = self.agendas.get(agenda_id)
+        digest = hashlib.sha256()
+        digest.update(f"{self.topic}\0{agenda.title if agenda else ''}".encode("utf-8"))
+        for chat in self.chats.get(agenda_id, []):
+            digest.update(f"\0{chat.sender}\0{chat.message}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def meeting_fingerprint(self) -> str:
+        """
+        회의 요약 전체의 입력이 되는 데이터(안건별 논의 상태와 안건별 해시값)로 계산한 해시값.
+        저장된 회의 요약 전체를 그대로 재사용할 수 있는지 판단하는 데 사용.
+        """
+        digest = hashlib.sha256()
+        for aid in sorted(self.agendas, key=int):
+            digest.update(f"{aid}\0{self.agendas[aid].status.value}\0{self.agenda_fingerprint(aid)}\0".encode("utf-8"))
+        return digest.hexdigest()
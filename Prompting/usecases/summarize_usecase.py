@@ -1,9 +1,12 @@
 # 요약 생성 요청 시 활용되는 하위 Use Case 모음
+import asyncio
 from Prompting.repository import ChatRepository, RoomRepository, UserRepository, AgendaRepository
-from Prompting.usecases.usecase_utils import load_participants_info
+from Prompting.usecases.usecase_utils import load_room_and_participants
 from Prompting.usecases.meeting_context import MeetingContext, ChatLog
 from Prompting.exceptions import catch_and_raise, MongoAccessError
 from Prompting.schemas import SummaryRequest
+from Prompting.common import AgendaStatus
+from Prompting.models import AgendaItemModel
 
 
 @catch_and_raise("MongoDB 데이터 로딩", MongoAccessError)
@@ -17,6 +20,10 @@ async def load_summary_context_and_update_agenda_status(
     """
     회의 요약 생성 요청에 필요한 데이터를 MongoDB에서 읽어와 MeetingContext로 재구성
 
+    Note:
+        - 안건 읽기 -> 마지막 안건 상태 업데이트, 전체 채팅 내역 읽기, 채팅방 -> 참여자 정보 읽기를 동시에 처리
+          (순서 의존성이 있는 작업만 차례로 처리하므로 MongoDB 왕복 2회 수준의 지연 시간)
+
     Args:
         room_id: 회의를 진행한 채팅방 ID
         chat_repo: 채팅 데이터 관리 객체
@@ -28,19 +35,14 @@ async def load_summary_context_and_update_agenda_status(
         회의 맥락이 담긴 MeetingContext 데이터 (주제, 안건, 채팅 내역, 주최자와 참여자)
     """
 
-    # 해당 회의의 안건 데이터와 전체 채팅 내역 읽어오기
-    agendas = await agenda_repo.get_agenda_by_room(request.roomId)
-    agenda_chat_map = await chat_repo.get_chat_logs_by_room(request.roomId)
+    # 서로 의존하지 않는 안건 읽기/상태 업데이트, 전체 채팅 내역, 채팅방/참여자 정보를 동시에 불러오기
+    agendas, agenda_chat_map, (room_model, participants) = await asyncio.gather(
+        _load_agendas_and_update_last_status(request, agenda_repo),
+        chat_repo.get_chat_logs_by_room(request.roomId),
+        load_room_and_participants(request.roomId, room_repo, user_repo),
+    )
     chats = {aid: [ChatLog.from_model(c) for c in msgs] for aid, msgs in agenda_chat_map.items()}
 
-    # 마지막 안건의 상태 업데이트
-    last_agenda_id = str(len(agendas))
-    await agenda_repo.update_status(request.roomId, last_agenda_id, request.is_last_agenda_skipped)
-
-    # 회의 참여자 정보(이메일, 이름, mbti) 불러오기
-    room_model = await room_repo.get_room_info(request.roomId)
-    participants = await load_participants_info(room_model.participants, user_repo)
-
     return MeetingContext(
         topic=room_model.content,
         agendas=agendas,
@@ -49,3 +51,17 @@ async def load_summary_context_and_update_agenda_status(
         chats=chats
     )
 
+
+async def _load_agendas_and_update_last_status(request: SummaryRequest,
+                                               agenda_repo: AgendaRepository) -> dict[str, AgendaItemModel]:
+
+    """회의의 안건 데이터를 읽고 마지막 안건의 상태를 업데이트 (읽어온 안건 데이터에도 반영)"""
+
+    agendas = await agenda_repo.get_agenda_by_room(request.roomId)
+
+    last_agenda_id = str(len(agendas))  # 마지막 안건 ID는 안건 수에 의존
+    await agenda_repo.update_status(request.roomId, last_agenda_id, request.is_last_agenda_skipped)
+    if last_agenda_id in agendas:
+        last_status = AgendaStatus.SKIPPED if request.is_last_agenda_skipped else AgendaStatus.COMPLETE
+        agendas[last_agenda_id] = AgendaItemModel(title=agendas[last_agenda_id].title, status=last_status)
+    return agendas
@@ -1,5 +1,6 @@
 # 여러 use case에서 활용되는 공통 유틸 함수
-from Prompting.repository import UserRepository
+from Prompting.repository import RoomRepository, UserRepository
+from Prompting.models import RoomModel
 from Prompting.usecases.meeting_context import UserInfo
 
 
@@ -16,3 +17,21 @@ async def load_participants_info(email_list: list[str], user_repo: UserRepositor
     """
     user_data = await user_repo.get_user_list_by_emails(email_list)
     return [UserInfo.from_model(u) for u in user_data]
+
+
+async def load_room_and_participants(room_id: str, room_repo: RoomRepository,
+                                     user_repo: UserRepository) -> tuple[RoomModel, list[UserInfo]]:
+    """
+    MongoDB에서 채팅방 정보와 회의 참여자 정보를 차례로 가져오기 (참여자 조회는 채팅방 문서의 참여자 목록에 의존)
+
+    Args:
+        room_id: 채팅방 ID
+        room_repo: 채팅방 데이터 관리 객체
+        user_repo: 사용자 데이터 관리 객체
+
+    Returns:
+        (채팅방 정보, 회의 참여자의 세부 정보 목록)
+    """
+    room_model = await room_repo.get_room_info(room_id)
+    participants = await load_participants_info(room_model.participants, user_repo)
+    return room_model, participants